@@ -3,6 +3,7 @@
 '''
 from .seed import Seeder
 from .types import *
+from .relational import ForeignKey, Table
 
 __all__ = [
     "Text",
@@ -54,5 +55,12 @@ __all__ = [
     "MACAddress",
     "CreditCardNumber",
     "IBAN",
-    "BIC"
+    "BIC",
+    "Sequence",
+    "UUIDv7",
+    "ULID",
+    "Snowflake",
+    "EventTime",
+    "ForeignKey",
+    "Table"
 ]
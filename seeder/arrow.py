@@ -0,0 +1,195 @@
+'''
+    Apache Arrow and Parquet export. Requires the optional pyarrow package.
+'''
+import itertools
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from seeder.types import Null, Int, Number, Bool, Date, Datetime, Timestamp, Enum, EventTime
+
+def require_pyarrow():
+    '''
+        Import pyarrow, with a helpful error if it is missing
+
+        @returns: The pyarrow module
+    '''
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError("Arrow and Parquet export require the pyarrow package: pip install pyarrow") from e
+    return pyarrow
+
+def _parse_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+def _parse_datetime(value):
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+def column_type(generator: Any) -> Tuple[Any, Optional[Callable[[Any], Any]]]:
+    '''
+        Map a generator to an Arrow type
+
+        @param generator: The generator of the column
+        @returns: The Arrow type (None to let pyarrow infer it) and a converter applied to non-null values
+    '''
+    pa = require_pyarrow()
+    if isinstance(generator, Null):
+        return column_type(generator.value) if callable(generator.value) else (None, None)
+    if isinstance(generator, Bool):
+        return pa.bool_(), None
+    if isinstance(generator, Int):
+        return pa.int64(), None
+    if isinstance(generator, Number):
+        return pa.float64(), None
+    if isinstance(generator, Timestamp):
+        return pa.timestamp('s'), None
+    if isinstance(generator, EventTime):
+        if generator.output == 'datetime':
+            return pa.timestamp('s'), _parse_datetime
+        return pa.timestamp('ms' if generator.output == 'timestamp_ms' else 's'), None
+    if isinstance(generator, Datetime):
+        return pa.timestamp('s'), _parse_datetime
+    if isinstance(generator, Date):
+        return pa.date32(), _parse_date
+    if isinstance(generator, Enum):
+        if all(isinstance(choice, str) for choice in generator.choices):
+            return pa.dictionary(pa.int32(), pa.string()), None
+        return None, None
+    return pa.string(), None
+
+class ArrowColumns:  # pylint: disable=too-few-public-methods
+    '''
+        Converts batches of records into Arrow record batches with a fixed schema
+
+        A class rather than a function because the schema, converters and
+        dictionaries are fixed once and reused by every batch of a file.
+
+        @param columns: The column names
+        @param generators: The generators of the columns, used to pick typed Arrow columns.
+            Without them, types are inferred from the first batch.
+    '''
+    def __init__(self, columns: List[str], generators: Optional[List[Any]] = None):
+        pa = require_pyarrow()
+        self.columns = columns
+        self.schema = None
+        self.converters: List[Optional[Callable[[Any], Any]]] = [None] * len(columns)
+        self.dictionaries: List[Optional[Dict[Any, int]]] = [None] * len(columns)
+        self.types: List[Any] = [None] * len(columns)
+
+        by_name = {generator.name: generator for generator in generators or [] if hasattr(generator, 'name')}
+        for i, name in enumerate(columns):
+            if name not in by_name:
+                continue
+            arrow_type, converter = column_type(by_name[name])
+            self.types[i] = arrow_type
+            self.converters[i] = converter
+            if arrow_type is not None and pa.types.is_dictionary(arrow_type):
+                choices = list(dict.fromkeys(by_name[name].choices))
+                self.dictionaries[i] = {choice: index for index, choice in enumerate(choices)}
+
+    def _array(self, i: int, values: List[Any]):
+        pa = require_pyarrow()
+        dictionary = self.dictionaries[i]
+        if dictionary is not None:
+            # A fixed dictionary per column keeps every batch compatible with the IPC file format
+            indices = pa.array([None if value is None else dictionary[value] for value in values], pa.int32())
+            return pa.DictionaryArray.from_arrays(indices, pa.array(list(dictionary), pa.string()))
+        converter = self.converters[i]
+        if converter is not None:
+            values = [None if value is None else converter(value) for value in values]
+        return pa.array(values, type=self.types[i])
+
+    def record_batch(self, rows: List[Dict[str, Any]]):
+        '''
+            Convert a batch of records to an Arrow record batch
+
+            @param rows: The records to convert
+            @returns: The record batch
+        '''
+        pa = require_pyarrow()
+        values = list(zip(*(row.values() for row in rows)))
+        arrays = [self._array(i, list(column)) for i, column in enumerate(values)]
+        if self.schema is None:
+            self.schema = pa.schema([pa.field(name, array.type) for name, array in zip(self.columns, arrays)])
+        else:
+            arrays = [array if array.type == field.type else array.cast(field.type) for array, field in zip(arrays, self.schema)]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+def iter_record_batches(columns: List[str], rows: Iterable[Dict[str, Any]], batch_size: int,
+                        generators: Optional[List[Any]] = None) -> Iterator[Any]:
+    '''
+        Group records into Arrow record batches of at most batch_size rows
+
+        @param columns: The column names
+        @param rows: The records to convert
+        @param batch_size: The maximum number of rows per record batch
+        @param generators: The generators of the columns, used to pick typed Arrow columns
+        @returns: Iterator over the record batches
+    '''
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    converter = ArrowColumns(columns, generators)
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield converter.record_batch(batch)
+
+def write_parquet(path: str, columns: List[str], rows: Iterable[Dict[str, Any]], generators: Optional[List[Any]] = None,
+                  row_group_size: int = 65536, compression: Optional[str] = 'snappy') -> int:
+    '''
+        Write records to a Parquet file, one row group per batch
+
+        @param path: The path of the file to write
+        @param columns: The column names
+        @param rows: The records to write
+        @param generators: The generators of the columns, used to pick typed Arrow columns
+        @param row_group_size: The number of rows per row group
+        @param compression: The compression codec, e.g. "snappy", "zstd", "gzip", "lz4" or None
+        @returns: The number of rows written
+    '''
+    require_pyarrow()
+    import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+    written = 0
+    writer = None
+    try:
+        for batch in iter_record_batches(columns, rows, row_group_size, generators):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression or 'none')
+            writer.write_batch(batch, row_group_size=row_group_size)
+            written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+def write_arrow(path: str, columns: List[str], rows: Iterable[Dict[str, Any]], generators: Optional[List[Any]] = None,
+                batch_size: int = 65536, compression: Optional[str] = None) -> int:
+    '''
+        Write records to an Arrow IPC file, one record batch per batch
+
+        @param path: The path of the file to write
+        @param columns: The column names
+        @param rows: The records to write
+        @param generators: The generators of the columns, used to pick typed Arrow columns
+        @param batch_size: The number of rows per record batch
+        @param compression: The buffer compression codec, "lz4", "zstd" or None
+        @returns: The number of rows written
+    '''
+    pa = require_pyarrow()
+
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    written = 0
+    writer = None
+    try:
+        for batch in iter_record_batches(columns, rows, batch_size, generators):
+            if writer is None:
+                writer = pa.ipc.new_file(path, batch.schema, options=options)
+            writer.write_batch(batch)
+            written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
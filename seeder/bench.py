@@ -0,0 +1,285 @@
+'''
+    Benchmarks for every type and exporter, with machine-readable JSON output.
+
+    Run with: python -m seeder.bench --count 10000 --rows 10000 --output bench.json
+'''
+import argparse
+import inspect
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from seeder import types
+from seeder.seed import Seeder
+from seeder.vectorized import BACKENDS, numpy_available
+
+# Constructor arguments for types that cannot be built from a name alone
+TYPE_ARGS: Dict[str, Dict[str, Any]] = {
+    'Enum': {'choices': ['active', 'inactive', 'pending']},
+}
+
+# Schema used for the end-to-end Seeder.seed and exporter benchmarks
+BENCH_SCHEMA = [
+    {"name": "id", "type": "integer", "min": 1, "max": 1000000},
+    {"name": "name", "type": "name"},
+    {"name": "email", "type": "email"},
+    {"name": "active", "type": "boolean"},
+    {"name": "balance", "type": "currency"},
+    {"name": "created_at", "type": "datetime", "start_date": "2020-01-01", "end_date": "2024-12-31"},
+    {"name": "seen", "type": "timestamp", "start_date": "2020-01-01", "end_date": "2024-12-31"},
+    {"name": "version", "type": "version"},
+    {"name": "sku", "type": "sku"},
+]
+
+# Target for a cold `import seeder`, in seconds. Faker is loaded lazily, so
+# going over it usually means a heavy import crept back into module scope.
+IMPORT_BUDGET_SECONDS = 0.25
+
+# Measures the import in a fresh interpreter and reports whether Faker was loaded
+IMPORT_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import seeder\n"
+    "print(time.perf_counter() - start, 'faker' in sys.modules)\n"
+)
+
+def type_classes() -> Dict[str, type]:
+    '''
+        Find every type defined in seeder.types
+
+        @returns: The type classes by name
+    '''
+    return {
+        name: cls for name, cls in inspect.getmembers(types, inspect.isclass)
+        if issubclass(cls, types.BaseType) and cls not in (types.BaseType, types.PooledType, types.TemporalType, types.TimeOrderedType)
+        and cls.__module__ == types.__name__
+    }
+
+def percentiles(samples: List[int], points=(50, 90, 99)) -> Dict[str, float]:
+    '''
+        Compute latency percentiles
+
+        @param samples: Latencies in nanoseconds
+        @param points: The percentiles to compute
+        @returns: The percentiles in nanoseconds, keyed as p50, p90, ...
+    '''
+    ordered = sorted(samples)
+    if not ordered:
+        return {f'p{point}': 0.0 for point in points}
+    return {f'p{point}': float(ordered[min(len(ordered) - 1, len(ordered) * point // 100)]) for point in points}
+
+def measure_allocations(function: Callable[[], Any]) -> Dict[str, int]:
+    '''
+        Measure the memory allocated while running a function
+
+        @param function: The function to run
+        @returns: The peak traced memory and the memory still held by the result
+    '''
+    tracemalloc.start()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'peak_bytes': peak, 'retained_bytes': current}
+
+def bench_type(generator: Any, count: int) -> Dict[str, Any]:
+    '''
+        Benchmark one generator in scalar and batch mode
+
+        @param generator: The generator to benchmark
+        @param count: The number of values to generate per mode
+        @returns: Throughput, scalar latency percentiles and allocations
+    '''
+    clock = time.perf_counter_ns
+    latencies = []
+    start = clock()
+    for _ in range(count):
+        call_start = clock()
+        generator()
+        latencies.append(clock() - call_start)
+    scalar_seconds = (clock() - start) / 1e9
+
+    start = clock()
+    generator.generate_batch(count)
+    batch_seconds = (clock() - start) / 1e9
+
+    allocations = measure_allocations(lambda: generator.generate_batch(count))
+    return {
+        'count': count,
+        'scalar': {
+            'values_per_sec': count / scalar_seconds if scalar_seconds else None,
+            'latency_ns': percentiles(latencies),
+        },
+        'batch': {
+            'values_per_sec': count / batch_seconds if batch_seconds else None,
+            'peak_bytes_per_value': allocations['peak_bytes'] / count if count else None,
+            'retained_bytes_per_value': allocations['retained_bytes'] / count if count else None,
+        },
+        'speedup': scalar_seconds / batch_seconds if batch_seconds else None,
+    }
+
+def bench_types(count: int, names: Optional[List[str]] = None, backend: str = 'python') -> Dict[str, Any]:
+    '''
+        Benchmark every type in seeder.types
+
+        @param count: The number of values to generate per type and mode
+        @param names: Only benchmark these types
+        @param backend: The batch backend, "python" or "numpy"
+        @returns: The results by type name
+    '''
+    results = {}
+    for name, cls in type_classes().items():
+        if names and name not in names:
+            continue
+        generator = cls(name.lower(), **TYPE_ARGS.get(name, {}))
+        generator.backend = backend
+        results[name] = bench_type(generator, count)
+    return results
+
+def bench_import(runs: int = 5, budget: float = IMPORT_BUDGET_SECONDS) -> Dict[str, Any]:
+    '''
+        Benchmark a cold `import seeder`, each run in a fresh interpreter
+
+        @param runs: The number of interpreters to start
+        @param budget: The import time budget in seconds
+        @returns: Import time statistics, whether Faker was loaded, and whether the budget was met
+    '''
+    samples = []
+    faker_loaded = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], capture_output=True, text=True, check=True).stdout.split()
+        samples.append(float(output[0]))
+        faker_loaded = faker_loaded or output[1] == 'True'
+    best = min(samples)
+    return {
+        'runs': runs,
+        'seconds': {'min': best, 'median': statistics.median(samples), 'max': max(samples)},
+        'faker_loaded': faker_loaded,
+        'budget_seconds': budget,
+        'within_budget': best <= budget,
+    }
+
+def _create_table(path: str, table: str, columns: List[str]):
+    connection = sqlite3.connect(path)
+    connection.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+    connection.commit()
+    connection.close()
+
+def bench_seed(rows: int, schema: Optional[List[Dict[str, Any]]] = None, exporters: bool = True,
+               backend: str = 'python') -> Dict[str, Any]:
+    '''
+        Benchmark Seeder.seed end to end and every exporter
+
+        @param rows: The number of rows to generate and export
+        @param schema: The schema to seed. Defaults to BENCH_SCHEMA
+        @param exporters: Whether to benchmark the exporters. They are skipped when rows is 0, as there is nothing to export
+        @param backend: The batch backend, "python" or "numpy"
+        @returns: Timings of seeding and of each exporter
+    '''
+    schema = schema or BENCH_SCHEMA
+    seeder = Seeder(backend=backend)
+    clock = time.perf_counter
+
+    start = clock()
+    seeder.seed(schema, count=rows)
+    seconds = clock() - start
+    results = {'seed': {'rows': rows, 'seconds': seconds, 'rows_per_sec': rows / seconds if seconds else None}}
+    if not exporters or rows == 0:
+        return results
+
+    with tempfile.TemporaryDirectory() as directory:
+        seeder.export_path = directory
+        columns = list(seeder.data[0].keys()) if rows else []
+        _create_table(f'{directory}/bench.db', 'bench', columns)
+        exports = {
+            'to_csv': lambda: seeder.to_csv('bench'),
+            'to_json': lambda: seeder.to_json('bench'),
+            'to_jsonl': lambda: seeder.to_jsonl('bench'),
+            'to_jsonl_gzip': lambda: seeder.to_jsonl('bench', compression='gzip'),
+            'to_jsonl_gzip_background': lambda: seeder.to_jsonl('bench', compression='gzip', background=True),
+            'to_jsonl_zstd': lambda: seeder.to_jsonl('bench', compression='zstd'),
+            'to_jsonl_lz4': lambda: seeder.to_jsonl('bench', compression='lz4'),
+            'to_sql': lambda: seeder.to_sql('bench', 'bench'),
+            'to_pg_copy': lambda: seeder.to_pg_copy('bench'),
+            'to_pg_copy_binary': lambda: seeder.to_pg_copy('bench', binary=True),
+            'to_mysql_load': lambda: seeder.to_mysql_load('bench'),
+            'to_database': lambda: seeder.to_database(f'{directory}/bench.db', 'bench'),
+            'to_parquet': lambda: seeder.to_parquet('bench'),
+            'to_arrow': lambda: seeder.to_arrow('bench'),
+        }
+        for name, export in exports.items():
+            start = clock()
+            try:
+                export()
+            except ImportError as e:
+                results[name] = {'skipped': str(e)}
+                continue
+            seconds = clock() - start
+            results[name] = {'rows': rows, 'seconds': seconds, 'rows_per_sec': rows / seconds if seconds else None}
+    return results
+
+def run(count: int = 10000, rows: int = 10000, names: Optional[List[str]] = None, exporters: bool = True,
+        import_runs: int = 5, backend: str = 'python') -> Dict[str, Any]:
+    '''
+        Run the full benchmark suite
+
+        @param count: The number of values per type benchmark
+        @param rows: The number of rows for the seed and exporter benchmarks
+        @param names: Only benchmark these types
+        @param exporters: Whether to benchmark the exporters
+        @param import_runs: The number of cold imports to time. 0 skips the import benchmark
+        @param backend: The batch backend, "python" or "numpy"
+        @returns: The results with environment metadata
+    '''
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': backend,
+            'numpy': numpy_available(),
+        },
+        'import': bench_import(import_runs) if import_runs else None,
+        'types': bench_types(count, names, backend),
+        'seed': bench_seed(rows, exporters=exporters, backend=backend),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    '''
+        Command line entry point
+
+        @param argv: The command line arguments
+        @returns: The exit code
+    '''
+    parser = argparse.ArgumentParser(prog='python -m seeder.bench', description='Benchmark quick-seeders types and exporters.')
+    parser.add_argument('--count', type=int, default=10000, help='values per type benchmark (default: 10000)')
+    parser.add_argument('--rows', type=int, default=10000, help='rows for the seed and exporter benchmarks (default: 10000)')
+    parser.add_argument('--types', nargs='*', help='only benchmark these types, e.g. --types Int Email')
+    parser.add_argument('--no-exporters', action='store_true', help='skip the exporter benchmarks')
+    parser.add_argument('--import-runs', type=int, default=5, help='cold imports to time, 0 to skip (default: 5)')
+    parser.add_argument('--backend', choices=BACKENDS, default='python',
+                        help='batch backend; numpy falls back to python when NumPy is missing (default: python)')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.rows, args.types, not args.no_exporters, args.import_runs, args.backend)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
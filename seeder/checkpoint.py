@@ -0,0 +1,304 @@
+'''
+    Checkpoints of long seed runs, so a run that stops part way can resume exactly where it left off.
+'''
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, List, Optional
+
+from seeder.plan import SchemaPlan, schema_fingerprint
+from seeder.types import BaseType
+
+# Bumped when the checkpoint layout changes, so old checkpoints are refused rather than misread
+CHECKPOINT_VERSION = 2
+
+# Hashed when a checkpoint is saved and again when it is loaded. Seen-set
+# fingerprints of strings are only valid in a process where the hash matches.
+HASH_PROBE = 'quick-seeders'
+
+class Checkpoint:
+    '''
+        The state of a seed run after its last completed shard
+
+        The RNG and Faker state need no saving: every shard is seeded from
+        the master seed and its index, so the next shard index is enough to
+        pick up the random streams. What cannot be derived from it is kept:
+        how much output is on disk, and how much of the SeenLog holding the
+        seen-sets of unique columns belongs to the rows written.
+
+        @param key: The run_key() of the run
+        @param master_seed: The master seed of the run
+        @param shard: The index of the next shard to generate
+        @param rows: The number of rows written
+        @param offset: The size of the output file in bytes after the rows written
+        @param seen_offset: The size of the seen log in bytes after the rows written
+    '''
+    def __init__(self, key: str, master_seed: int, shard: int = 0, rows: int = 0, offset: int = 0,
+                 seen_offset: int = 0):
+        self.version = CHECKPOINT_VERSION
+        self.key = key
+        self.master_seed = master_seed
+        self.shard = shard
+        self.rows = rows
+        self.offset = offset
+        self.seen_offset = seen_offset
+        self.hash_probe = hash(HASH_PROBE)
+
+    def seen_restorable(self) -> bool:
+        '''
+            Whether the seen-sets can be restored in this process
+
+            @returns: True if there are none, or if string hashing matches the process that saved them
+        '''
+        return not self.seen_offset or self.hash_probe == hash(HASH_PROBE)
+
+    def save(self, path: str):
+        '''
+            Write the checkpoint atomically: to a temporary file, synced to disk, then renamed over path
+
+            @param path: The checkpoint file
+        '''
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+
+    @staticmethod
+    def load(path: str) -> Optional['Checkpoint']:
+        '''
+            Read a checkpoint written by save(). Only load checkpoints you wrote: they are pickles.
+
+            @param path: The checkpoint file
+            @returns: The checkpoint, or None if the file does not exist
+        '''
+        try:
+            with open(path, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        if not isinstance(checkpoint, Checkpoint) or getattr(checkpoint, 'version', None) != CHECKPOINT_VERSION:
+            raise ValueError(f"{path} is not a checkpoint of this version of quick-seeders")
+        return checkpoint
+
+class SeenLog:
+    '''
+        An append-only file of the fingerprints unique columns add between checkpoints
+
+        Each checkpoint appends only what is new since the one before, so
+        the cost of checkpointing grows with the rows written, not with the
+        size of the seen-sets. The checkpoint records the log size, and the
+        log is cut back to it on resume, dropping records of rows that were
+        never checkpointed.
+
+        @param path: The log file
+    '''
+    def __init__(self, path: str):
+        self.path = path
+
+    def append(self, seen: Dict[str, List[int]], offset: int) -> int:
+        '''
+            Append fingerprints, synced to disk
+
+            @param seen: The new fingerprints per column name
+            @param offset: The size of the log at the last checkpoint
+            @returns: The size of the log after the fingerprints
+        '''
+        if not any(seen.values()):
+            return offset
+        with open(self.path, 'ab') as f:
+            pickle.dump(seen, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def read(self, offset: int) -> Dict[str, List[int]]:
+        '''
+            Read the fingerprints of a checkpoint and cut the log back to it
+
+            @param offset: The checkpoint's seen_offset
+            @returns: The fingerprints per column name
+        '''
+        seen: Dict[str, List[int]] = {}
+        if not offset:
+            self.remove()
+            return seen
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < offset:
+            raise ValueError(f"{self.path} is shorter than its checkpoint records. Delete the checkpoint to start over")
+        os.truncate(self.path, offset)
+        with open(self.path, 'rb') as f:
+            while f.tell() < offset:
+                for name, fingerprints in pickle.load(f).items():
+                    seen.setdefault(name, []).extend(fingerprints)
+        return seen
+
+    def remove(self):
+        '''
+            Delete the log, if there is one
+        '''
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def run_key(schema: Any, **options: Any) -> str:
+    '''
+        Identify a run by its schema and options, so a checkpoint is only resumed by the same run
+
+        Schema definitions are identified by their fingerprint. For lists of
+        generators, and definitions holding functions, only the column names
+        and types are compared.
+
+        @param schema: A list of generators, a schema definition list or a compiled SchemaPlan
+        @param options: Everything else that changes the output, e.g. count, seed and format
+        @returns: A hex digest
+    '''
+    fingerprint = None
+    if isinstance(schema, SchemaPlan):
+        fingerprint = schema.fingerprint
+    elif schema and isinstance(schema[0], dict):
+        fingerprint = schema_fingerprint(schema)
+    if fingerprint is None:
+        fingerprint = [
+            [field.get('type'), field.get('name')] if isinstance(field, dict) else [type(field).__name__, getattr(field, 'name', None)]
+            for field in schema
+        ]
+    canonical = json.dumps({'schema': fingerprint, **options}, sort_keys=True, default=repr, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+def seen_columns(generators: List[Any]) -> List[BaseType]:
+    '''
+        Get the unique columns that track their values in a seen-set
+
+        @param generators: The bound generators of a run
+        @returns: The generators whose unique values are not drawn from a Permutation
+    '''
+    return [
+        generator for generator in generators
+        if isinstance(generator, BaseType) and generator.unique and not generator.uses_permutation()
+    ]
+
+def track_seen(generators: List[Any]):
+    '''
+        Make the seen-sets of freshly bound generators record new fingerprints for drain_seen(), specializing them first
+
+        @param generators: The bound generators of a run
+    '''
+    for generator in seen_columns(generators):
+        if '_generate' not in generator.__dict__:
+            generator._prepare()  # pylint: disable=protected-access
+        generator._seen.track()  # pylint: disable=protected-access
+
+def drain_seen(generators: List[Any]) -> Dict[str, List[int]]:
+    '''
+        Take the fingerprints a run's unique columns added since the last call
+
+        @param generators: The bound generators of a run, passed to track_seen()
+        @returns: The new fingerprints per column name
+    '''
+    return {
+        generator.name: generator._seen.drain()  # pylint: disable=protected-access
+        for generator in seen_columns(generators)
+    }
+
+def restore_seen(generators: List[Any], seen: Dict[str, List[int]]):
+    '''
+        Load seen-sets into generators passed to track_seen()
+
+        Restored fingerprints are not drained again: they are already in the log.
+
+        @param generators: The bound generators of a run
+        @param seen: The fingerprints per column name, from SeenLog.read()
+    '''
+    for generator in seen_columns(generators):
+        fingerprints = seen.get(generator.name)
+        if fingerprints:
+            generator._seen.restore(fingerprints)  # pylint: disable=protected-access
+
+class CheckpointedRun:
+    '''
+        The checkpoint and seen log of one Seeder.seed_to_file() run
+
+        resume() picks up the checkpoint, if there is one, and bind() is
+        passed to Seeder.iter_shards() as on_bind to restore and track the
+        seen-sets. After that, save() records each checkpoint and finish()
+        cleans up once the run completes.
+
+        @param key: The run_key() of the run
+        @param path: The output file
+        @param checkpoint: The checkpoint file
+    '''
+    def __init__(self, key: str, path: str, checkpoint: str):
+        self.key = key
+        self.path = path
+        self.checkpoint = checkpoint
+        self.seen_log = SeenLog(checkpoint + '.seen')
+        self.state = Checkpoint(key, 0)
+        self.replay = False
+        self.seen_offset = 0
+        self.generators: List[Any] = []
+        self._seen: Dict[str, List[int]] = {}
+
+    def resume(self, seed: Optional[int], rng: Any) -> str:
+        '''
+            Load the checkpoint and cut the output and the seen log back to it
+
+            When the seen-sets cannot be restored in this process, the shards
+            before the checkpoint are replayed to rebuild them, so the seen
+            log starts over.
+
+            @param seed: The master seed of the Seeder, if any
+            @param rng: The Random to draw a master seed from when there is neither a seed nor a checkpoint
+            @returns: The mode to open the output file with, "w" for a new run or "a" to resume one
+        '''
+        state = Checkpoint.load(self.checkpoint)
+        if state is None:
+            self.state = Checkpoint(self.key, seed if seed is not None else rng.getrandbits(64))
+            self.seen_log.remove()
+            return 'w'
+        if state.key != self.key:
+            raise ValueError(f"Checkpoint {self.checkpoint} belongs to a different run. Delete it to start over")
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < state.offset:
+            raise ValueError(f"{self.path} is shorter than checkpoint {self.checkpoint} records. Delete the checkpoint to start over")
+        os.truncate(self.path, state.offset)
+        self.state = state
+        self.replay = not state.seen_restorable()
+        self.seen_offset = 0 if self.replay else state.seen_offset
+        self._seen = self.seen_log.read(self.seen_offset)
+        return 'a'
+
+    @property
+    def first_shard(self) -> int:
+        '''
+            The index of the first shard to generate: the checkpoint's, or 0 when replaying
+        '''
+        return 0 if self.replay else self.state.shard
+
+    def bind(self, generators: List[Any]):
+        '''
+            Restore the seen-sets into freshly bound generators and track what they add
+
+            @param generators: The bound generators of the run
+        '''
+        self.generators.extend(generators)
+        track_seen(generators)
+        restore_seen(generators, self._seen)
+
+    def save(self, shard: int, rows: int, offset: int):
+        '''
+            Append the new seen values to the log, then save a checkpoint. Sync the output first.
+
+            @param shard: The index of the next shard to generate
+            @param rows: The number of rows written
+            @param offset: The size of the output file in bytes
+        '''
+        self.seen_offset = self.seen_log.append(drain_seen(self.generators), self.seen_offset)
+        Checkpoint(self.key, self.state.master_seed, shard, rows, offset, self.seen_offset).save(self.checkpoint)
+
+    def finish(self):
+        '''
+            Remove the checkpoint and the seen log of a completed run
+        '''
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        self.seen_log.remove()
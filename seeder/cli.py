@@ -0,0 +1,162 @@
+'''
+    The quick-seeders command: generate rows from a schema file and stream them to stdout or a file.
+
+    Run with: quick-seeders schema.json --count 100000 --format sql --table users | psql mydb
+'''
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from seeder.output import COMPRESSION_EXTENSIONS, DEFAULT_BUFFER_SIZE, open_output
+from seeder.plan import validate_schema
+from seeder.seed import Seeder
+from seeder.vectorized import BACKENDS
+from seeder.writers import FORMAT_EXTENSIONS, SQL_DIALECTS, write_format
+
+def load_schema(path: str) -> Any:
+    '''
+        Read a schema file: a list of field definitions, or a dict with a "tables" list
+
+        @param path: The path of a .json, .yaml or .yml file, or "-" for JSON on stdin
+        @returns: The schema definition
+    '''
+    if path == '-':
+        return json.load(sys.stdin)
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml  # pylint: disable=import-outside-toplevel
+            except ImportError as e:
+                raise ImportError("YAML schemas require the PyYAML package: pip install pyyaml") from e
+            return yaml.safe_load(f)
+        return json.load(f)
+
+def check_schema(schema: Any):
+    '''
+        Validate a schema file up front, so a bad field fails before any rows are written
+
+        @param schema: The schema definition from load_schema()
+    '''
+    if isinstance(schema, dict) and 'tables' in schema:
+        tables = schema['tables']
+        if not isinstance(tables, list):
+            raise ValueError("\"tables\" must be a list of tables")
+        for position, table in enumerate(tables):
+            if not isinstance(table, dict) or 'name' not in table or 'columns' not in table:
+                raise ValueError(f"Table {position} of the schema needs a \"name\" and \"columns\"")
+            try:
+                validate_schema(table['columns'])
+            except ValueError as e:
+                raise ValueError(f"Table {table['name']}: {e}") from None
+        return
+    if not isinstance(schema, list):
+        raise ValueError("A schema must be a list of fields or a dict with a \"tables\" list")
+    validate_schema(schema)
+
+def write_records(f: TextIO, output_format: str, table: str, records: Iterable[Dict[str, Any]], batch_size: int,
+                  dialect: str = 'standard') -> int:
+    '''
+        Write one table's records in an output format
+
+        @param f: The text handle to write to
+        @param output_format: A key of FORMAT_EXTENSIONS
+        @param table: The table name, used by the sql format
+        @param records: The records
+        @param batch_size: The number of rows per INSERT statement of the sql format
+        @param dialect: The SQL dialect of the sql format
+        @returns: The number of rows written
+    '''
+    rows = iter(records)
+    first = next(rows, None)
+    if first is None:
+        # Nothing to write, and no columns for a header; an empty array is still valid JSON
+        if output_format == 'json':
+            f.write('[]')
+        return 0
+    return write_format(f, output_format, table, list(first.keys()), itertools.chain((first,), rows), batch_size, dialect)
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    '''
+        Generate the schema of the parsed arguments and write it to out
+
+        @param args: The parsed command line arguments
+        @param out: The text handle to write to
+        @returns: The number of rows written
+    '''
+    schema = load_schema(args.schema)
+    check_schema(schema)
+    seeder = Seeder(seed=args.seed, locale=args.locale, backend=args.backend)
+    batch_size = args.batch_size
+
+    if isinstance(schema, dict) and 'tables' in schema:
+        if args.format not in ('sql', 'jsonl'):
+            raise ValueError("Multi-table schemas can only be written as sql or jsonl")
+        written = 0
+        for table, records in seeder.iter_tables(schema, workers=args.workers):
+            if args.format == 'jsonl':
+                records = ({'table': table, **record} for record in records)
+            written += write_records(out, args.format, table, records, batch_size, args.dialect)
+        return written
+
+    table = args.table or os.path.splitext(os.path.basename(args.schema))[0].replace('-', '_')
+    records = (
+        record
+        for batch in seeder.iter_seed(schema, args.count, batch_size=batch_size, workers=args.workers)
+        for record in batch
+    )
+    return write_records(out, args.format, table, records, batch_size, args.dialect)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    '''
+        Command line entry point
+
+        @param argv: The command line arguments
+        @returns: The exit code
+    '''
+    parser = argparse.ArgumentParser(prog='quick-seeders', description='Generate seed data from a JSON or YAML schema file.')
+    parser.add_argument('schema', help='schema file (.json, .yaml or .yml), or - to read JSON from stdin')
+    parser.add_argument('-n', '--count', type=int, default=10, help='rows to generate (default: 10). Ignored for multi-table schemas')
+    parser.add_argument('-f', '--format', choices=list(FORMAT_EXTENSIONS), default='jsonl', help='output format (default: jsonl)')
+    parser.add_argument('-o', '--output', default='-', help='file to write to, or - for stdout (default: -)')
+    parser.add_argument('--seed', type=int, help='master seed for reproducible output')
+    parser.add_argument('--workers', type=int, help='worker processes to generate shards in parallel')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='rows generated per batch, and per INSERT statement with --format sql (default: 1000)')
+    parser.add_argument('--dialect', choices=SQL_DIALECTS, default='standard',
+                        help='SQL dialect of --format sql: mysql also escapes backslashes (default: standard)')
+    parser.add_argument('--table', help='table name for --format sql (default: the schema file name)')
+    parser.add_argument('--locale', default='en_US', help='Faker locale (default: en_US)')
+    parser.add_argument('--backend', choices=BACKENDS, default='python', help='batch backend (default: python)')
+    parser.add_argument('--compression', choices=list(COMPRESSION_EXTENSIONS), help='compress the output')
+    parser.add_argument('--buffer-bytes', type=int, default=DEFAULT_BUFFER_SIZE,
+                        help=f'bytes buffered per write (default: {DEFAULT_BUFFER_SIZE})')
+    parser.add_argument('--background', action='store_true',
+                        help='compress and write from a background thread, overlapping with generation')
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error('--count must not be negative')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+    if args.buffer_bytes < 1:
+        parser.error('--buffer-bytes must be at least 1')
+
+    try:
+        target = sys.stdout.buffer if args.output == '-' else args.output
+        with open_output(target, compression=args.compression, buffer_size=args.buffer_bytes,
+                         background=args.background, newline='') as f:
+            run(args, f)
+    except BrokenPipeError:
+        # The reader went away, e.g. `quick-seeders ... | head`. Point stdout at devnull so the final flush does not fail
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, ImportError) as e:
+        sys.stderr.write(f'quick-seeders: error: {e}\n')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+'''
+    Database sink that writes generated records straight into a DB-API connection.
+'''
+import itertools
+import queue
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+PLACEHOLDERS = {
+    'qmark': lambda index: '?',
+    'format': lambda index: '%s',
+    'numeric': lambda index: f':{index + 1}',
+    'named': lambda index: f':p{index}',
+    'pyformat': lambda index: f'%(p{index})s',
+}
+
+class ConnectionPool:
+    '''
+        A small thread-safe pool of DB-API connections
+
+        @param connect: Callable that opens a new connection
+        @param size: The maximum number of open connections
+    '''
+    def __init__(self, connect: Callable[[], Any], size: int = 1):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.connect = connect
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Any:
+        '''
+            Take a connection from the pool, opening one if the pool is not full
+
+            @returns: A connection
+        '''
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                connection = self.connect()
+                self._opened.append(connection)
+                return connection
+        return self._idle.get()
+
+    def release(self, connection: Any):
+        '''
+            Return a connection to the pool
+
+            @param connection: The connection to return
+        '''
+        self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        '''
+            Borrow a connection for the duration of a with block
+        '''
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        '''
+            Close every connection the pool opened
+        '''
+        with self._lock:
+            for connection in self._opened:
+                connection.close()
+            self._opened = []
+            self._idle = queue.LifoQueue()
+
+    def __repr__(self):
+        return f"ConnectionPool(size={self.size})"
+
+def driver_paramstyle(connection: Any) -> str:
+    '''
+        Find the DB-API paramstyle of a connection's driver module
+
+        @param connection: A DB-API connection
+        @returns: The paramstyle, defaulting to "qmark"
+    '''
+    module = sys.modules.get(type(connection).__module__.split('.')[0])
+    return getattr(module, 'paramstyle', 'qmark')
+
+def insert_statement(table: str, columns: List[str], paramstyle: str) -> str:
+    '''
+        Build a parameterized INSERT statement
+
+        @param table: The name of the table to insert into
+        @param columns: The column names
+        @param paramstyle: The DB-API paramstyle of the driver
+        @returns: The INSERT statement
+    '''
+    if paramstyle not in PLACEHOLDERS:
+        raise ValueError(f"Unsupported paramstyle: {paramstyle}")
+    placeholder = PLACEHOLDERS[paramstyle]
+    values = ', '.join(placeholder(index) for index in range(len(columns)))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({values})"
+
+def execute_batch(pool: ConnectionPool, statement: str, named: bool, batch: List[Dict[str, Any]]) -> int:
+    '''
+        Insert one batch with executemany in its own transaction, on a pooled connection
+
+        @param pool: The pool to take a connection from
+        @param statement: The INSERT statement from insert_statement()
+        @param named: Whether the statement takes named parameters, p0, p1, ...
+        @param batch: The records to insert
+        @returns: The number of rows written
+    '''
+    if named:
+        parameters = [{f'p{index}': value for index, value in enumerate(row.values())} for row in batch]
+    else:
+        parameters = [tuple(row.values()) for row in batch]
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.executemany(statement, parameters)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    return len(batch)
+
+def execute_concurrently(execute: Callable[[List[Dict[str, Any]]], int], batches: Iterable[List[Dict[str, Any]]], writers: int) -> int:
+    '''
+        Hand batches to writer threads through a bounded queue
+
+        After the first failure, the remaining batches are skipped and the
+        error is raised once every thread has stopped.
+
+        @param execute: Writes one batch and returns its row count, e.g. execute_batch() with its options bound
+        @param batches: The batches to write
+        @param writers: The number of writer threads
+        @returns: The number of rows written
+    '''
+    pending = queue.Queue(maxsize=writers * 2)
+    errors = []
+    written = [0]
+    count_lock = threading.Lock()
+
+    def work():
+        while True:
+            batch = pending.get()
+            if batch is None:
+                return
+            if errors:
+                continue
+            try:
+                count = execute(batch)
+                with count_lock:
+                    written[0] += count
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            pending.put(batch)
+    finally:
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return written[0]
+
+def write_rows(pool: ConnectionPool, table: str, columns: List[str], rows: Iterable[Dict[str, Any]], batch_size: int = 1000,
+               writers: int = 1, paramstyle: Optional[str] = None) -> int:
+    '''
+        Insert rows with executemany, one transaction per batch
+
+        With more than one writer, batches are handed to writer threads
+        through a bounded queue, each thread using its own pooled connection.
+
+        @param pool: The pool to take connections from
+        @param table: The name of the table to insert into
+        @param columns: The column names
+        @param rows: The records to insert
+        @param batch_size: The number of rows per executemany call
+        @param writers: The number of concurrent writer threads
+        @param paramstyle: The DB-API paramstyle. Detected from the driver if not given
+        @returns: The number of rows written
+    '''
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if writers < 1:
+        raise ValueError("writers must be at least 1")
+
+    with pool.connection() as connection:
+        paramstyle = paramstyle or driver_paramstyle(connection)
+    execute = partial(execute_batch, pool, insert_statement(table, columns, paramstyle), paramstyle in ('named', 'pyformat'))
+
+    rows = iter(rows)
+    batches = iter(lambda: list(itertools.islice(rows, batch_size)), [])
+    if writers == 1:
+        return sum(execute(batch) for batch in batches)
+    return execute_concurrently(execute, batches, writers)
+
+def connection_pool(target: Any, size: int = 1) -> ConnectionPool:
+    '''
+        Build a connection pool from a DSN, a connect function or a connection
+
+        A string is opened as a SQLite database file. A callable is used to
+        open connections with any DB-API driver. An existing connection is
+        shared as a pool of one.
+
+        @param target: A SQLite path, a callable returning new connections, or a connection
+        @param size: The maximum number of open connections
+        @returns: The connection pool
+    '''
+    if isinstance(target, str):
+        return ConnectionPool(lambda: sqlite3.connect(target, timeout=30, check_same_thread=False), size)
+    if hasattr(target, 'cursor'):
+        return ConnectionPool(lambda: target, 1)
+    if callable(target):
+        return ConnectionPool(target, size)
+    raise ValueError(f"Unsupported database target: {target!r}")
@@ -0,0 +1,308 @@
+'''
+    Value distributions for numeric columns: normal, lognormal, exponential,
+    Zipf and weighted histograms.
+'''
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+class AliasTable:
+    '''
+        Walker's alias method: draws an index with probability proportional
+        to its weight in O(1), after O(n) setup (Vose's construction)
+
+        @param weights: Non-negative weights, at least one of them positive
+    '''
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        total = float(sum(weights))
+        if size == 0 or total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("Weights must be non-negative with a positive sum")
+        self.size = size
+        scaled = [weight * size / total for weight in weights]
+        self.probabilities = [1.0] * size
+        self.aliases = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1 up to rounding error and keeps probability 1
+
+    def sampler(self, rng: Any) -> Callable[[], int]:
+        '''
+            Build a draw callable
+
+            @param rng: The random number generator to draw from
+            @returns: Zero-argument callable returning an index
+        '''
+        random, size = rng.random, self.size
+        probabilities, aliases = self.probabilities, self.aliases
+
+        def draw():
+            # One uniform draw picks the column and decides between it and its alias
+            position = random() * size
+            index = int(position)
+            return index if position - index < probabilities[index] else aliases[index]
+        return draw
+
+    def sample_batch(self, rng: Any, n: int) -> List[int]:
+        '''
+            Draw n indices
+
+            @param rng: The random number generator to draw from
+            @param n: The number of indices
+            @returns: The indices
+        '''
+        random, size = rng.random, self.size
+        probabilities, aliases = self.probabilities, self.aliases
+        indices = []
+        append = indices.append
+        for _ in range(n):
+            position = random() * size
+            index = int(position)
+            append(index if position - index < probabilities[index] else aliases[index])
+        return indices
+
+    def numpy_batch(self, np: Any, np_rng: Any, n: int) -> Any:
+        '''
+            Draw n indices as a NumPy array
+
+            @param np: The numpy module
+            @param np_rng: A numpy.random.Generator
+            @param n: The number of indices
+            @returns: An int64 array
+        '''
+        positions = np_rng.random(n) * self.size
+        indices = positions.astype(np.int64)
+        keep = positions - indices < np.asarray(self.probabilities)[indices]
+        return np.where(keep, indices, np.asarray(self.aliases)[indices])
+
+class Distribution:
+    '''
+        Base class for distributions. Samples are floats, or ints for discrete
+        distributions; the type drawing them rounds and clamps them to its range.
+    '''
+    def sampler(self, rng: Any, low: int, high: int) -> Callable[[], float]:
+        '''
+            Build a draw callable
+
+            @param rng: The random number generator to draw from
+            @param low: The smallest value of the column, used by distributions over a range
+            @param high: The largest value of the column
+            @returns: Zero-argument callable returning one sample
+        '''
+        raise NotImplementedError
+
+    def numpy_batch(self, np: Any, np_rng: Any, n: int, low: int, high: int) -> Optional[Any]:  # pylint: disable=unused-argument
+        '''
+            Draw n samples as a NumPy array. Distributions with a vectorized path override this.
+
+            @param np: The numpy module
+            @param np_rng: A numpy.random.Generator
+            @param n: The number of samples
+            @param low: The smallest value of the column
+            @param high: The largest value of the column
+            @returns: The samples, or None when the distribution has no vectorized path
+        '''
+        return None
+
+class Normal(Distribution):
+    '''
+        @param mean: The mean
+        @param stddev: The standard deviation
+    '''
+    def __init__(self, mean: float, stddev: float):
+        if stddev <= 0:
+            raise ValueError("stddev must be positive")
+        self.mean = mean
+        self.stddev = stddev
+
+    def sampler(self, rng, low, high):
+        gauss, mean, stddev = rng.gauss, self.mean, self.stddev
+        return lambda: gauss(mean, stddev)
+
+    def numpy_batch(self, np, np_rng, n, low, high):
+        return np_rng.normal(self.mean, self.stddev, n)
+
+    def __repr__(self):
+        return f"Normal(mean={self.mean}, stddev={self.stddev})"
+
+class LogNormal(Distribution):
+    '''
+        @param mu: The mean of the underlying normal distribution
+        @param sigma: The standard deviation of the underlying normal distribution
+    '''
+    def __init__(self, mu: float, sigma: float):
+        if sigma <= 0:
+            raise ValueError("sigma must be positive")
+        self.mu = mu
+        self.sigma = sigma
+
+    def sampler(self, rng, low, high):
+        gauss, exp, mu, sigma = rng.gauss, math.exp, self.mu, self.sigma
+        return lambda: exp(gauss(mu, sigma))
+
+    def numpy_batch(self, np, np_rng, n, low, high):
+        return np_rng.lognormal(self.mu, self.sigma, n)
+
+    def __repr__(self):
+        return f"LogNormal(mu={self.mu}, sigma={self.sigma})"
+
+class Exponential(Distribution):
+    '''
+        Samples start at the column's smallest value
+
+        @param mean: The mean distance from the smallest value
+    '''
+    def __init__(self, mean: float):
+        if mean <= 0:
+            raise ValueError("mean must be positive")
+        self.mean = mean
+
+    def sampler(self, rng, low, high):
+        expovariate, rate = rng.expovariate, 1.0 / self.mean
+        return lambda: low + expovariate(rate)
+
+    def numpy_batch(self, np, np_rng, n, low, high):
+        return low + np_rng.exponential(self.mean, n)
+
+    def __repr__(self):
+        return f"Exponential(mean={self.mean})"
+
+def log1p_ratio(x: float) -> float:
+    '''
+        log1p(x) / x, accurate near 0
+
+        @param x: The argument
+        @returns: The ratio, 1 at x = 0
+    '''
+    return math.log1p(x) / x if abs(x) > 1e-8 else 1 - x * (0.5 - x * (1 / 3 - 0.25 * x))
+
+def expm1_ratio(x: float) -> float:
+    '''
+        expm1(x) / x, accurate near 0
+
+        @param x: The argument
+        @returns: The ratio, 1 at x = 0
+    '''
+    return math.expm1(x) / x if abs(x) > 1e-8 else 1 + x * 0.5 * (1 + x / 3 * (1 + 0.25 * x))
+
+class Zipf(Distribution):
+    '''
+        Zipf's law over the column's range: the k-th value from the smallest
+        is drawn with probability proportional to 1 / k ** s, so a few values
+        are hot and the rest form a long tail.
+
+        Sampled by rejection-inversion (Hörmann and Derflinger), which needs
+        constant memory however large the range is.
+
+        @param s: The exponent. Larger values concentrate more draws on the first values
+    '''
+    def __init__(self, s: float = 1.0):
+        if s <= 0:
+            raise ValueError("s must be positive")
+        self.s = s
+
+    # h(x) = x ** -s, its integral and the inverse of the integral, as named by Hörmann and Derflinger
+    def _h(self, x):
+        return math.exp(-self.s * math.log(x))
+
+    def _h_integral(self, x):
+        log_x = math.log(x)
+        return expm1_ratio((1 - self.s) * log_x) * log_x
+
+    def _h_integral_inverse(self, x):
+        t = max(x * (1 - self.s), -1.0)
+        return math.exp(log1p_ratio(t) * x)
+
+    def sampler(self, rng, low, high):
+        size, random = high - low + 1, rng.random
+        h, h_integral, h_integral_inverse = self._h, self._h_integral, self._h_integral_inverse
+        h_integral_x1 = h_integral(1.5) - 1.0
+        h_integral_size = h_integral(size + 0.5)
+        squeeze = 2 - h_integral_inverse(h_integral(2.5) - h(2))
+
+        def draw():
+            while True:
+                u = h_integral_size + random() * (h_integral_x1 - h_integral_size)
+                x = h_integral_inverse(u)
+                rank = min(max(int(x + 0.5), 1), size)
+                if rank - x <= squeeze or u >= h_integral(rank + 0.5) - h(rank):
+                    return low + rank - 1
+        return draw
+
+    def __repr__(self):
+        return f"Zipf(s={self.s})"
+
+class Histogram(Distribution):
+    '''
+        A weighted histogram: a bin is picked by weight through an AliasTable,
+        then a value is drawn uniformly within it
+
+        @param bins: (low, high, weight) triples. Values are drawn from [low, high)
+    '''
+    def __init__(self, bins: Sequence[Sequence[float]]):
+        if not bins:
+            raise ValueError("Histogram needs at least one bin")
+        for low, high, _ in bins:
+            if low > high:
+                raise ValueError(f"Histogram bin low {low} is greater than high {high}")
+        self.bins = [tuple(bin_) for bin_ in bins]
+        self.table = AliasTable([weight for _, _, weight in self.bins])
+
+    def sampler(self, rng, low, high):
+        pick, random = self.table.sampler(rng), rng.random
+        bins = [(bin_low, bin_high - bin_low) for bin_low, bin_high, _ in self.bins]
+
+        def draw():
+            bin_low, width = bins[pick()]
+            return bin_low + random() * width
+        return draw
+
+    def numpy_batch(self, np, np_rng, n, low, high):
+        indices = self.table.numpy_batch(np, np_rng, n)
+        lows = np.asarray([bin_low for bin_low, _, _ in self.bins], dtype=float)
+        widths = np.asarray([bin_high - bin_low for bin_low, bin_high, _ in self.bins], dtype=float)
+        return lows[indices] + np_rng.random(n) * widths[indices]
+
+    def __repr__(self):
+        return f"Histogram(bins={self.bins})"
+
+DISTRIBUTIONS = {
+    'normal': Normal,
+    'lognormal': LogNormal,
+    'exponential': Exponential,
+    'zipf': Zipf,
+    'histogram': Histogram,
+}
+
+def make_distribution(spec: Union[None, Distribution, Dict[str, Any]]) -> Optional[Distribution]:
+    '''
+        Build a distribution from its schema definition
+
+        @param spec: A Distribution, a dict with "type" and the distribution's parameters, or None
+        @returns: The distribution, or None for uniform values
+    '''
+    if spec is None or isinstance(spec, Distribution):
+        return spec
+    if not isinstance(spec, dict) or spec.get('type') not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {spec!r}, expected a type of: {', '.join(DISTRIBUTIONS)}")
+    parameters = {key: value for key, value in spec.items() if key != 'type'}
+    try:
+        return DISTRIBUTIONS[spec['type']](**parameters)
+    except TypeError as e:
+        raise ValueError(f"Invalid parameters for the {spec['type']} distribution: {e}") from e
+
+def rounded_sampler(draw: Callable[[], float], low: int, high: int) -> Callable[[], int]:
+    '''
+        Round samples to ints and clamp them to a range
+
+        @param draw: The sample callable
+        @param low: The smallest value
+        @param high: The largest value
+        @returns: Zero-argument callable returning ints in [low, high]
+    '''
+    return lambda: min(max(round(draw()), low), high)
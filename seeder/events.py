@@ -0,0 +1,107 @@
+'''
+    Arrival processes for ordered event streams: event times are produced in
+    increasing order, block by block, with constant memory.
+'''
+import hashlib
+import random
+from typing import Iterator, List
+
+# Events are generated in blocks of this many. Each block covers a fixed
+# window of EVENT_BLOCK_SIZE / rate seconds and is seeded from the column key
+# and its index, so any row can be reached without generating the rows before it.
+EVENT_BLOCK_SIZE = 1000
+
+ARRIVALS = ('poisson', 'regular', 'bursty')
+
+def block_seed(key: int, block: int) -> int:
+    '''
+        Derive the seed of a block of events
+
+        @param key: The column key
+        @param block: The index of the block
+        @returns: A 64-bit seed
+    '''
+    digest = hashlib.blake2b(f"{key}:{block}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+def arrival_gaps(rng: random.Random, count: int, arrival: str = 'poisson', jitter: float = 0.0,
+                 burst_factor: float = 10.0, burst_probability: float = 0.01, burst_length: float = 50.0) -> List[float]:
+    '''
+        Draw the gaps between consecutive events, in units of the mean gap outside bursts
+
+        @param rng: The random number generator to draw from
+        @param count: The number of gaps
+        @param arrival: "poisson" for exponential gaps, "regular" for equal gaps, or "bursty" for
+            a Poisson process that switches into bursts of burst_factor times the rate
+        @param jitter: Scale every gap by a uniform factor in [1 - jitter, 1 + jitter]
+        @param burst_factor: How many times faster events arrive during a burst
+        @param burst_probability: The chance that a burst starts after each event outside one
+        @param burst_length: The mean number of events in a burst
+        @returns: The gaps
+    '''
+    expovariate, random_ = rng.expovariate, rng.random
+    if arrival == 'poisson':
+        gaps = [expovariate(1.0) for _ in range(count)]
+    elif arrival == 'regular':
+        gaps = [1.0] * count
+    elif arrival == 'bursty':
+        gaps = []
+        append = gaps.append
+        burst_rate, burst_end = float(burst_factor), 1.0 / burst_length
+        in_burst = False
+        for _ in range(count):
+            if in_burst:
+                append(expovariate(burst_rate))
+                in_burst = random_() >= burst_end
+            else:
+                append(expovariate(1.0))
+                in_burst = random_() < burst_probability
+    else:
+        raise ValueError(f"Unknown arrival process {arrival!r}, expected one of: {', '.join(ARRIVALS)}")
+    if jitter:
+        gaps = [gap * (1.0 + jitter * (2.0 * random_() - 1.0)) for gap in gaps]
+    return gaps
+
+def block_fractions(rng: random.Random, size: int, **process) -> List[float]:
+    '''
+        Place size events within one block window
+
+        The block's first event opens the window and size gaps are scaled
+        to fill it, the last one separating the block from the first event
+        of the next. Regular arrivals are therefore exactly 1 / rate apart,
+        also across blocks.
+
+        @param rng: The random number generator of the block
+        @param size: The number of events in the block
+        @param process: The arrival process options of arrival_gaps()
+        @returns: Increasing fractions of the window in [0, 1)
+    '''
+    gaps = arrival_gaps(rng, size, **process)
+    total = sum(gaps)
+    fractions = []
+    append = fractions.append
+    elapsed = 0.0
+    for gap in gaps:
+        append(elapsed / total)
+        elapsed += gap
+    return fractions
+
+def event_offsets(key: int, start_index: int, rate: float, **process) -> Iterator[float]:
+    '''
+        Iterate event times from an event index onwards, in increasing order
+
+        @param key: The column key, seeding every block
+        @param start_index: The index of the first event, e.g. the row offset of a shard
+        @param rate: The mean number of events per second
+        @param process: The arrival process options of arrival_gaps()
+        @returns: Endless iterator over seconds since the start of the stream
+    '''
+    block, position = divmod(start_index, EVENT_BLOCK_SIZE)
+    window = EVENT_BLOCK_SIZE / rate
+    while True:
+        fractions = block_fractions(random.Random(block_seed(key, block)), EVENT_BLOCK_SIZE, **process)
+        base = block * window
+        for fraction in fractions[position:]:
+            yield base + fraction * window
+        block += 1
+        position = 0
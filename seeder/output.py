@@ -0,0 +1,169 @@
+'''
+    Output streams for the exporters: compression, large write buffers and a background writer thread.
+'''
+import io
+import os
+import queue
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+# File extension per compression codec
+COMPRESSION_EXTENSIONS = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+    'lz4': '.lz4',
+}
+
+# Bytes collected before they are handed to the compressor or the file. Large
+# buffers mean fewer, bigger writes and compressor calls.
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Buffers the background writer holds before exporters wait for it to catch up
+DEFAULT_QUEUE_SIZE = 8
+
+def compression_extension(compression: Optional[str]) -> str:
+    '''
+        Get the file extension of a compression codec
+
+        @param compression: "gzip", "zstd", "lz4" or None
+        @returns: The extension, or "" without compression
+    '''
+    if compression is None:
+        return ''
+    try:
+        return COMPRESSION_EXTENSIONS[compression]
+    except KeyError:
+        raise ValueError(f"Unknown compression {compression!r}, expected one of: {', '.join(COMPRESSION_EXTENSIONS)}") from None
+
+def compressed_stream(stream: BinaryIO, compression: str, level: Optional[int] = None) -> BinaryIO:
+    '''
+        Wrap a binary stream in a compressor. Closing the compressor finishes the
+        compressed data but leaves the stream open.
+
+        gzip is built in; zstd requires the zstandard package and lz4 the lz4 package.
+
+        @param stream: The binary stream to write the compressed data to
+        @param compression: "gzip", "zstd" or "lz4"
+        @param level: The compression level. Defaults to the codec's own default
+        @returns: A writable binary stream
+    '''
+    compression_extension(compression)
+    if compression == 'gzip':
+        import gzip  # pylint: disable=import-outside-toplevel
+        # mtime=0 keeps the output byte-identical between runs
+        return gzip.GzipFile(fileobj=stream, mode='wb', compresslevel=6 if level is None else level, mtime=0)
+    if compression == 'zstd':
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("zstd compression requires the zstandard package: pip install zstandard") from e
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(stream, closefd=False)
+    try:
+        import lz4.frame  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError("lz4 compression requires the lz4 package: pip install lz4") from e
+    return lz4.frame.LZ4FrameFile(stream, mode='wb', compression_level=0 if level is None else level)
+
+class BackgroundWriter(io.RawIOBase):
+    '''
+        A binary stream that writes to another one from a background thread
+
+        write() hands the data to a bounded queue and returns at once, so
+        compressing and writing a buffer overlaps with generating and
+        encoding the next one. When the queue is full, write() blocks until
+        the thread catches up. Errors in the thread are raised by the next
+        write() or by close(), which waits for every pending write.
+
+        @param stream: The binary stream to write to, e.g. a file or a compressor
+        @param queue_size: The number of writes held before write() blocks
+    '''
+    def __init__(self, stream: BinaryIO, queue_size: int = DEFAULT_QUEUE_SIZE):
+        super().__init__()
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.stream = stream
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='seeder-writer', daemon=True)
+        self._thread.start()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._raise_error()
+        # The caller may reuse its buffer, so queue a copy
+        self._queue.put(bytes(data))
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        super().close()
+        self._raise_error()
+
+    def _run(self):
+        write = self.stream.write
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            if self._error is not None:
+                # Keep draining, so write() never blocks on a writer that failed
+                continue
+            try:
+                write(data)
+            except BaseException as e:  # pylint: disable=broad-except
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+@contextmanager
+def open_output(target: Union[str, os.PathLike, BinaryIO], binary: bool = False, compression: Optional[str] = None,
+                level: Optional[int] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False,
+                queue_size: int = DEFAULT_QUEUE_SIZE, newline: Optional[str] = None) -> Iterator[Any]:
+    '''
+        Open an output for an exporter, layering buffering, an optional background thread and compression
+
+        Writes collect in a buffer of buffer_size bytes, which goes through
+        the background writer, if any, then the compressor and the file.
+        Everything is flushed and closed when the block exits, except a
+        stream passed as the target, which is flushed and left open.
+
+        @param target: A file path, or an open binary stream such as sys.stdout.buffer
+        @param binary: Yield a binary stream instead of UTF-8 text
+        @param compression: "gzip", "zstd", "lz4" or None
+        @param level: The compression level. Defaults to the codec's own default
+        @param buffer_size: The number of bytes buffered per write
+        @param background: Compress and write from a background thread
+        @param queue_size: The number of buffers the background thread holds before writes wait
+        @param newline: The newline translation of text output, as for open()
+        @returns: The writable text or binary stream
+    '''
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1")
+    with ExitStack() as stack:
+        if isinstance(target, (str, os.PathLike)):
+            stream = stack.enter_context(open(target, 'wb', buffering=0))
+        else:
+            # Registered first so it runs last, once the layers above have written everything
+            stream = target
+            stack.callback(target.flush)
+        if compression is not None:
+            stream = stack.enter_context(compressed_stream(stream, compression, level))
+        if background:
+            stream = stack.enter_context(BackgroundWriter(stream, queue_size))
+        buffered = io.BufferedWriter(stream, buffer_size)
+        handle = buffered if binary else io.TextIOWrapper(buffered, encoding='utf-8', newline=newline)
+        try:
+            yield handle
+        finally:
+            # Flush down to the stream, then let the exit stack close the layers below in order.
+            # Detaching keeps the wrappers from closing a target stream when they are collected.
+            (handle if binary else handle.detach()).detach()
@@ -0,0 +1,367 @@
+'''
+    Schema plans compile a schema definition into generators once and cache them.
+'''
+import copy
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date, time, timedelta
+from decimal import Decimal
+from functools import partial
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Any, Dict, List, Optional, Tuple
+
+from seeder.types import (
+    Null,
+    Int,
+    Number,
+    Bool,
+    Date,
+    Datetime,
+    Time,
+    Timestamp,
+    TimeZone,
+    DayOfWeek,
+    UUID,
+    Color,
+    JobTitle,
+    CompanyDepartment,
+    FileExtension,
+    SocialMediaHandle,
+    IPAddress,
+    LatitudeLongitude,
+    Version,
+    Sentence,
+    Paragraph,
+    UserAgent,
+    Hash,
+    ISBN,
+    ISBN13,
+    EAN,
+    SKU,
+    MACAddress,
+    CreditCardNumber,
+    IBAN,
+    Enum,
+    BIC,
+    Text,
+    Currency,
+    Email,
+    Phone,
+    Website,
+    DomainName,
+    DomainWord,
+    TLD,
+    Country,
+    State,
+    City,
+    Zip,
+    Address,
+    Name,
+    ID,
+    PooledType,
+    Sequence,
+    UUIDv7,
+    ULID,
+    Snowflake,
+    EventTime,
+)
+from seeder.relational import ForeignKey
+from seeder.distributions import make_distribution
+
+# Types that accept fast=True, set per field with "fast": true
+FAST_TYPES = ('boolean', 'id', 'uuid', 'hash', 'ipaddress', 'macaddress', 'dayofweek', 'tld')
+
+# Types that accept unique=True, set per field with "unique": true
+UNIQUE_TYPES = (
+    'integer', 'float', 'number', 'id', 'uuid', 'sku', 'isbn', 'isbn13', 'ean', 'hash', 'ipaddress', 'macaddress',
+    'name', 'address', 'sentence', 'paragraph', 'jobtitle', 'useragent', 'email',
+)
+
+# Types that accept a distribution, set per field with "distribution": {"type": "normal", ...}
+DISTRIBUTION_TYPES = ('integer', 'float', 'number', 'currency')
+
+TYPE_MAPPING = {
+    'integer': Int,
+    'text': Text,
+    'currency': Currency,
+    'enum': Enum,
+    'boolean': Bool,
+    'string': Text,
+    'float': Number,
+    'number': Number,
+    'date': Date,
+    'datetime': Datetime,
+    'email': Email,
+    'phone': Phone,
+    'address': Address,
+    'url': Website,
+    'id': ID,
+    'name': Name,
+    'country': Country,
+    'state': State,
+    'city': City,
+    'zip': Zip,
+    'time': Time,
+    'timestamp': Timestamp,
+    'timezone': TimeZone,
+    'dayofweek': DayOfWeek,
+    'color': Color,
+    'jobtitle': JobTitle,
+    'department': CompanyDepartment,
+    'fileextension': FileExtension,
+    'socialmedia': SocialMediaHandle,
+    'ipaddress': IPAddress,
+    'latlng': LatitudeLongitude,
+    'version': Version,
+    'sentence': Sentence,
+    'paragraph': Paragraph,
+    'useragent': UserAgent,
+    'hash': Hash,
+    'isbn': ISBN,
+    'isbn13': ISBN13,
+    'ean': EAN,
+    'sku': SKU,
+    'macaddress': MACAddress,
+    'creditcard': CreditCardNumber,
+    'iban': IBAN,
+    'bic': BIC,
+    'null': Null,
+    'uuid': UUID,
+    'domainname': DomainName,
+    'domainword': DomainWord,
+    'tld': TLD,
+    'sequence': Sequence,
+    'uuidv7': UUIDv7,
+    'ulid': ULID,
+    'snowflake': Snowflake,
+    'event_time': EventTime,
+    'foreign_key': ForeignKey,
+}
+
+# Marks a field key FIELD_ARGUMENTS has no default for
+REQUIRED = object()
+
+PROBABILITY = ('probability', 'probability', 100)
+FAST = ('fast', 'fast', False)
+DATE_RANGE = (('start_date', 'start_date', '1970-01-01'), ('end_date', 'end_date', 'today'), PROBABILITY)
+
+# Constructor arguments per field type, as (argument, field key, default).
+# Other types only take a name.
+FIELD_ARGUMENTS = {
+    'currency': (('symbol', 'symbol', '$'), ('min_value', 'min_value', 0), ('max_value', 'max_value', 1000)),
+    'integer': (('min_value', 'min', 1), ('max_value', 'max', 99999)),
+    'datetime': DATE_RANGE,
+    'timestamp': DATE_RANGE,
+    'color': (('color_type', 'color_type', 'name'), PROBABILITY),
+    'version': (
+        ('major_min', 'major_min', 0), ('major_max', 'major_max', 10), ('minor_min', 'minor_min', 0),
+        ('minor_max', 'minor_max', 10), ('patch_min', 'patch_min', 0), ('patch_max', 'patch_max', 10), PROBABILITY,
+    ),
+    'sentence': (('nb_words', 'nb_words', 6), ('variable_nb_words', 'variable_nb_words', 6), PROBABILITY),
+    'paragraph': (('nb_sentences', 'nb_sentences', 3), ('variable_nb_sentences', 'variable_nb_sentences', 3), PROBABILITY),
+    'hash': (('hash_type', 'hash_type', 'sha256'), PROBABILITY, FAST),
+    'creditcard': (('card_type', 'card_type', 'visa'), PROBABILITY),
+    'iban': (('country_code', 'country_code', None), PROBABILITY),
+    'sku': (('prefix', 'prefix', ''), ('length', 'length', 8), PROBABILITY),
+    'socialmedia': (('platform', 'platform', None), PROBABILITY),
+    'ipaddress': (('version', 'version', 'ipv4'), PROBABILITY, FAST),
+    'enum': (('choices', 'choices', []), PROBABILITY, ('weights', 'weights', None)),
+    'latlng': (PROBABILITY,),
+    'timezone': (PROBABILITY,),
+    'sequence': (('start', 'start', 1), ('step', 'step', 1), PROBABILITY),
+    'uuidv7': (('start', 'start', None), PROBABILITY),
+    'ulid': (('start', 'start', None), PROBABILITY),
+    'foreign_key': (('references', 'references', REQUIRED), PROBABILITY),
+    'snowflake': (('start', 'start', None), ('worker_id', 'worker_id', 0), PROBABILITY),
+    'event_time': (
+        ('start', 'start', None), ('rate', 'rate', 1.0), ('arrival', 'arrival', 'poisson'), ('jitter', 'jitter', 0.0),
+        ('burst_factor', 'burst_factor', 10.0), ('burst_probability', 'burst_probability', 0.01),
+        ('burst_length', 'burst_length', 50.0), ('output', 'output', 'datetime'), PROBABILITY,
+    ),
+    **{field_type: (FAST,) for field_type in FAST_TYPES if field_type not in ('hash', 'ipaddress')},
+}
+
+def validate_schema(schema_json: List[Dict[str, Any]]):
+    '''
+        Check that a schema definition is a list of fields with a name and a supported type
+
+        @param schema_json: The schema definition
+    '''
+    if not isinstance(schema_json, list):
+        raise ValueError("A schema must be a list of fields")
+    for position, field in enumerate(schema_json):
+        if not isinstance(field, dict):
+            raise ValueError(f"Field {position} of the schema is not an object")
+        for key in ('name', 'type'):
+            if key not in field:
+                raise ValueError(f"Field {position} of the schema has no \"{key}\"")
+        if not isinstance(field['type'], str) or field['type'].lower() not in TYPE_MAPPING:
+            raise ValueError(f"Unsupported field type: {field['type']}")
+
+def build_generator(field: Dict[str, Any]) -> Any:
+    '''
+        Convert one validated field definition to a generator
+
+        @param field: The field definition
+        @returns: The generator
+    '''
+    field_type = field['type'].lower()
+    arguments = {'name': field['name']}
+    for argument, key, default in FIELD_ARGUMENTS.get(field_type, ()):
+        if key in field:
+            arguments[argument] = field[key]
+        elif default is REQUIRED:
+            raise ValueError(f"Field {field['name']} of type {field_type} needs \"{key}\"")
+        else:
+            arguments[argument] = copy.copy(default)
+    generator = TYPE_MAPPING[field_type](**arguments)
+
+    if field.get('unique'):
+        if field_type not in UNIQUE_TYPES:
+            raise ValueError(f"Field type {field_type} does not support unique")
+        generator.unique = True
+    if 'distribution' in field:
+        if field_type not in DISTRIBUTION_TYPES:
+            raise ValueError(f"Field type {field_type} does not support distribution")
+        generator.distribution = make_distribution(field['distribution'])
+    if 'pool_size' in field:
+        if not isinstance(generator, PooledType):
+            raise ValueError(f"Field type {field_type} does not support pool_size")
+        generator.set_pool(field['pool_size'], field.get('pool_seed', 0), field.get('pool_cache'))
+    return generator
+
+def build_generators(schema_json: List[Dict[str, Any]]) -> List[Any]:
+    '''
+        Convert a schema to a list of generators
+
+        @param schema_json: The schema to convert to generators
+        @returns: A list of generators
+    '''
+    validate_schema(schema_json)
+    return [build_generator(field) for field in schema_json]
+
+class SchemaPlan:
+    '''
+        A compiled schema: one generator per column, built once and reused
+
+        Plans are hashable and compare equal when compiled from the same
+        schema definition. Pass a plan to Seeder.seed() in place of the schema.
+
+        @param fingerprint: The fingerprint of the schema definition
+        @param generators: The generators of the columns
+    '''
+    def __init__(self, fingerprint: str, generators: List[Any]):
+        self.fingerprint = fingerprint
+        self.generators: Tuple[Any, ...] = tuple(generators)
+        self.names: Tuple[str, ...] = tuple(generator.name for generator in generators)
+
+    def __iter__(self):
+        return iter(self.generators)
+
+    def __len__(self):
+        return len(self.generators)
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other):
+        return isinstance(other, SchemaPlan) and other.fingerprint == self.fingerprint
+
+    def __str__(self):
+        return f'SchemaPlan(columns={list(self.names)})'
+
+    def __repr__(self):
+        return f"SchemaPlan(fingerprint='{self.fingerprint}')"
+
+class UnstableSchemaValue(ValueError):
+    '''
+        Raised for schema values that cannot be fingerprinted by their content
+    '''
+
+def _canonical_value(value: Any) -> Any:
+    '''
+        Convert a non-JSON schema value to JSON for fingerprinting
+
+        Generators and other objects are identified by their type and their
+        public attributes, which are converted in turn. Reprs are only used
+        for values whose repr is their content, such as dates.
+
+        @param value: The value json.dumps() could not serialize
+        @returns: A JSON-serializable stand-in
+    '''
+    if isinstance(value, (date, time, timedelta, Decimal)):
+        return repr(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, (FunctionType, BuiltinFunctionType, MethodType, partial, type)) or not hasattr(value, '__dict__'):
+        raise UnstableSchemaValue(f"Cannot fingerprint {value!r}")
+    kind = type(value)
+    return {
+        '__type__': f"{kind.__module__}.{kind.__qualname__}",
+        **{key: option for key, option in vars(value).items() if not key.startswith('_')},
+    }
+
+def schema_fingerprint(schema_json: List[Dict[str, Any]]) -> Optional[str]:
+    '''
+        Fingerprint a schema definition, independent of key order
+
+        Generators embedded in the definition, e.g. as enum choices, are
+        fingerprinted by their type and options.
+
+        @param schema_json: The schema definition
+        @returns: A hex digest identifying the schema, or None when it holds values with no stable
+            fingerprint, such as functions
+    '''
+    try:
+        canonical = json.dumps(schema_json, sort_keys=True, default=_canonical_value, separators=(',', ':'))
+    except UnstableSchemaValue:
+        return None
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+# Compiled plans by schema fingerprint, least recently used first
+PLAN_CACHE_SIZE = 256
+_plan_cache: "OrderedDict[str, SchemaPlan]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+def compile_schema(schema_json: List[Dict[str, Any]], cache: bool = True) -> SchemaPlan:
+    '''
+        Compile a schema definition into a reusable plan
+
+        Plans are cached by fingerprint, so compiling the same schema again
+        returns the same plan without rebuilding its generators. Relative
+        bounds such as "now" are resolved when the plan is first compiled;
+        pass cache=False to resolve them again. Schemas holding functions
+        have no fingerprint and are never cached.
+
+        @param schema_json: The schema definition
+        @param cache: Whether to look up and store the plan in the cache
+        @returns: The compiled plan
+    '''
+    fingerprint = schema_fingerprint(schema_json)
+    if fingerprint is None:
+        cache = False
+        fingerprint = f"uncached-{uuid.uuid4().hex}"
+    if cache:
+        with _plan_cache_lock:
+            plan = _plan_cache.get(fingerprint)
+            if plan is not None:
+                _plan_cache.move_to_end(fingerprint)
+                return plan
+
+    plan = SchemaPlan(fingerprint, build_generators(schema_json))
+    if cache:
+        with _plan_cache_lock:
+            _plan_cache[fingerprint] = plan
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+    return plan
+
+def clear_plan_cache():
+    '''
+        Forget every cached plan
+    '''
+    with _plan_cache_lock:
+        _plan_cache.clear()
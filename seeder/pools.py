@@ -0,0 +1,109 @@
+'''
+    Value pools: a fixed set of unique values drawn once and sampled per row.
+'''
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# A pool is accepted as smaller than pool_size, for generators with fewer
+# distinct values than requested, after this many draws per requested value
+# or this many draws in a row without a new value
+POOL_DRAW_FACTOR = 10
+POOL_STALE_DRAWS = 1000
+
+_pools: Dict[Hashable, Tuple[Any, ...]] = {}
+_pools_lock = threading.Lock()
+
+def build_pool(draw: Callable[[], Any], size: int) -> List[Any]:
+    '''
+        Draw up to size unique values
+
+        @param draw: Zero-argument callable returning one value
+        @param size: The number of unique values wanted
+        @returns: The unique values in the order they were first drawn
+    '''
+    values: Dict[Any, None] = {}
+    stale = 0
+    for _ in range(size * POOL_DRAW_FACTOR):
+        value = draw()
+        if value in values:
+            stale += 1
+            if stale == POOL_STALE_DRAWS:
+                break
+            continue
+        values[value] = None
+        stale = 0
+        if len(values) == size:
+            break
+    return list(values)
+
+def pool_path(cache_dir: str, key: Tuple[Any, ...]) -> str:
+    '''
+        Get the cache file of a pool
+
+        @param cache_dir: The cache directory
+        @param key: The pool key, starting with the type name, options, locale, size and seed
+        @returns: The path of the JSON file
+    '''
+    type_name, _, locale, size, seed = key
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=6).hexdigest()
+    return os.path.join(cache_dir, f"{type_name.lower()}-{locale}-{size}-{seed}-{digest}.json")
+
+def _read_pool(path: str) -> Optional[List[Any]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            values = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return values if isinstance(values, list) and values else None
+
+def _write_pool(path: str, values: List[Any]):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Write then rename, so concurrent runs never read a partial pool
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(values, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def load_pool(key: Tuple[Any, ...], make_draw: Callable[[], Callable[[], Any]], size: int,
+              cache_dir: Optional[str] = None) -> Tuple[Any, ...]:
+    '''
+        Get a pool from memory, then from the cache directory, building it on a miss
+
+        @param key: Identifies the pool: (type name, options, locale, size, seed)
+        @param make_draw: Builds the draw callable, only called when the pool is built
+        @param size: The number of unique values wanted
+        @param cache_dir: Directory to read and save the pool in. Defaults to memory only
+        @returns: The pool values
+    '''
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None:
+            return pool
+        path = pool_path(cache_dir, key) if cache_dir else None
+        values = _read_pool(path) if path else None
+        if values is None:
+            values = build_pool(make_draw(), size)
+            if path:
+                _write_pool(path, values)
+        pool = _pools[key] = tuple(values)
+    return pool
+
+def clear_pool_cache():
+    '''
+        Drop every pool held in memory. Pools saved to disk are kept.
+    '''
+    with _pools_lock:
+        _pools.clear()
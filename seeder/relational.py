@@ -0,0 +1,188 @@
+'''
+    Multi-table schemas: tables, primary keys, foreign keys and row ratios.
+'''
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from seeder.types import BaseType, handle_probability, handle_probability_batch
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+class KeyIndex:
+    '''
+        The key values of one parent table column, for foreign keys to sample from
+
+        Integer keys are packed into an array of 64-bit ints, 8 bytes per key.
+        The index switches to a list the first time another kind of key is added.
+    '''
+    def __init__(self):
+        self.keys: Union[array, List[Any]] = array('q')
+
+    def append(self, key: Any):
+        '''
+            Add a key
+
+            @param key: The key value
+        '''
+        if isinstance(self.keys, array):
+            if isinstance(key, int) and not isinstance(key, bool) and INT64_MIN <= key <= INT64_MAX:
+                self.keys.append(key)
+                return
+            self.keys = list(self.keys)
+        self.keys.append(key)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return f"KeyIndex(keys={len(self.keys)}, packed={isinstance(self.keys, array)})"
+
+class ForeignKey(BaseType):
+    '''
+        A column whose values are sampled from the keys of a parent table
+
+        Only usable through Seeder.iter_tables() and Seeder.seed_tables(),
+        which generate the parent first and hand its KeyIndex to the column.
+
+        @param name: The name of the column
+        @param references: The parent column as "table.column", or "table" for its primary key
+        @param probability: The probability of the key being null. Defaults to 100
+    '''
+    def __init__(self, name, references, probability=100):
+        self.name = name
+        self.references = references
+        self.probability = probability
+        self.table, _, self.column = references.partition('.')
+        self.index = None
+
+    def _specialize(self):
+        if self.index is None:
+            raise ValueError(f"Foreign key {self.name} references {self.references}, which has not been generated. "
+                             "Seed it with Seeder.iter_tables()")
+        keys = self.index.keys
+        if not keys:
+            raise ValueError(f"Foreign key {self.name} references {self.references}, which has no rows")
+        randrange, size = self.rng.randrange, len(keys)
+        self._generate = lambda: keys[randrange(size)]
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if '_generate' not in self.__dict__:
+            self._prepare()
+        return handle_probability_batch(self.rng.choices(self.index.keys, k=n), None, self.probability, self.rng)
+
+    def __repr__(self):
+        return f"ForeignKey(name='{self.name}', references='{self.references}', probability={self.probability})"
+
+    def __str__(self):
+        return f'ForeignKey(name={self.name}, references={self.references}, probability={self.probability})'
+
+class Table:
+    '''
+        One table of a multi-table schema
+
+        @param name: The name of the table
+        @param schema: Either a list of generators or a schema definition list
+        @param count: The number of rows
+        @param primary_key: The column foreign keys referencing just the table name point to
+        @param per: Instead of count, generate ratio rows per row of this table
+        @param ratio: The number of rows per row of the per table. Defaults to 1
+    '''
+    def __init__(self, name: str, schema: List[Any], count: Optional[int] = None, primary_key: Optional[str] = None,
+                 per: Optional[str] = None, ratio: float = 1.0):
+        if (count is None) == (per is None):
+            raise ValueError(f"Table {name} needs either count or per")
+        if count is not None and count < 0:
+            raise ValueError(f"Table {name} count must not be negative")
+        if ratio < 0:
+            raise ValueError(f"Table {name} ratio must not be negative")
+        self.name = name
+        self.schema = schema
+        self.count = count
+        self.primary_key = primary_key
+        self.per = per
+        self.ratio = ratio
+
+    @classmethod
+    def from_definition(cls, definition: Dict[str, Any]) -> 'Table':
+        '''
+            Build a table from its schema definition
+
+            @param definition: A dict with "name", "columns" and "count" or "per" and "ratio",
+                and optionally "primary_key"
+            @returns: The table
+        '''
+        return cls(
+            definition['name'],
+            definition['columns'],
+            count=definition.get('count'),
+            primary_key=definition.get('primary_key'),
+            per=definition.get('per'),
+            ratio=definition.get('ratio', 1.0),
+        )
+
+    def __repr__(self):
+        return f"Table(name='{self.name}', count={self.count}, per={self.per}, ratio={self.ratio})"
+
+def resolve_tables(tables: Union[Dict[str, Any], Iterable[Any]]) -> List[Table]:
+    '''
+        Convert a multi-table schema to Table objects
+
+        @param tables: Tables, table definitions, or a dict with a "tables" list
+        @returns: The tables, in the order given
+    '''
+    if isinstance(tables, dict):
+        tables = tables['tables']
+    resolved = [table if isinstance(table, Table) else Table.from_definition(table) for table in tables]
+    names = [table.name for table in resolved]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate table names: {', '.join(sorted(duplicates))}")
+    return resolved
+
+def foreign_key_target(foreign_key: ForeignKey, tables: Dict[str, Table]) -> str:
+    '''
+        Find the parent column of a foreign key
+
+        @param foreign_key: The foreign key
+        @param tables: The tables by name
+        @returns: The referenced column name
+    '''
+    if foreign_key.table not in tables:
+        raise ValueError(f"Foreign key {foreign_key.name} references unknown table {foreign_key.table}")
+    column = foreign_key.column or tables[foreign_key.table].primary_key
+    if not column:
+        raise ValueError(f"Foreign key {foreign_key.name} references {foreign_key.table}, which has no primary_key")
+    return column
+
+def dependency_order(tables: List[Table], foreign_keys: Dict[str, List[ForeignKey]]) -> List[Table]:
+    '''
+        Order tables so every table comes after the tables it references
+
+        @param tables: The tables, in declaration order
+        @param foreign_keys: The foreign key columns of each table
+        @returns: The tables in generation order. Unrelated tables keep their declaration order
+    '''
+    by_name = {table.name: table for table in tables}
+    parents = {}
+    for table in tables:
+        names = {foreign_key.table for foreign_key in foreign_keys[table.name]}
+        if table.per is not None:
+            if table.per not in by_name:
+                raise ValueError(f"Table {table.name} is generated per unknown table {table.per}")
+            names.add(table.per)
+        parents[table.name] = names
+
+    ordered: List[Table] = []
+    done = set()
+    while len(ordered) < len(tables):
+        ready = [table for table in tables if table.name not in done and parents[table.name] <= done]
+        if not ready:
+            cycle = sorted(name for name in by_name if name not in done)
+            raise ValueError(f"Tables reference each other in a cycle: {', '.join(cycle)}")
+        ordered.append(ready[0])
+        done.add(ready[0].name)
+    return ordered
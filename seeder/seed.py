@@ -1,152 +1,790 @@
 '''
     Seeder is the main class for generating fake data.
 '''
-import json
 import os
-import csv
 import random
-from typing import Any, Dict, List, Union
+import itertools
+import hashlib
+import copy
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
-from seeder.types import (
-    Null,
-    Int,
-    Number,
-    Bool,
-    Date,
-    Datetime,
-    Time,
-    Timestamp,
-    TimeZone,
-    DayOfWeek,
-    UUID,
-    Color,
-    JobTitle,
-    CompanyDepartment,
-    FileExtension,
-    SocialMediaHandle,
-    IPAddress,
-    LatitudeLongitude,
-    Version,
-    Sentence,
-    Paragraph,
-    UserAgent,
-    Hash,
-    ISBN,
-    ISBN13,
-    EAN,
-    SKU,
-    MACAddress,
-    CreditCardNumber,
-    IBAN,
-    Enum,
-    BIC,
-    Text,
-    Currency,
-    Email,
-    Phone,
-    Website,
-    DomainName,
-    DomainWord,
-    TLD,
-    Country,
-    State,
-    City,
-    Zip,
-    Address,
-    Name,
-    ID,
+from seeder.plan import SchemaPlan, build_generators, compile_schema
+from seeder.database import connection_pool, write_rows
+from seeder.arrow import write_parquet, write_arrow
+from seeder.output import DEFAULT_BUFFER_SIZE, compression_extension, open_output
+from seeder.checkpoint import CheckpointedRun, run_key, seen_columns
+from seeder.writers import (
+    APPENDABLE_FORMATS,
+    FORMAT_EXTENSIONS,
+    write_sql_inserts,
+    write_pg_copy_text,
+    write_pg_copy_binary,
+    write_mysql_load,
+    write_jsonl,
+    write_json_array,
+    write_csv,
+    write_format,
 )
+from seeder.types import BaseType, LazyFaker
+from seeder.relational import ForeignKey, KeyIndex, Table, dependency_order, foreign_key_target, resolve_tables
+from seeder.vectorized import check_backend
 
-class Seeder:
+# Number of rows generated per generate_batch() call when streaming records
+DEFAULT_CHUNK_SIZE = 1024
+
+# Number of rows per shard when seeding deterministically or in parallel.
+# Fixed so that shard boundaries, and therefore output, never depend on the worker count.
+SHARD_SIZE = 10000
+
+def shard_seed(master_seed: int, index: int) -> int:
     '''
-        Main seeder class
+        Derive the seed of a shard from the master seed
+
+        @param master_seed: The seed the Seeder was created with
+        @param index: The index of the shard
+        @returns: A 64-bit seed, stable across processes and runs
     '''
-    def __init__(self):
+    digest = hashlib.blake2b(f"{master_seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+# Faker instance per locale of each worker process, reseeded for every shard
+_worker_fakers: Dict[str, Any] = {}
+
+def bind_generators(generators: List[Any], rng: random.Random, faker: Any, seed: Optional[int] = None,
+                    offset: int = 0, backend: Optional[str] = None) -> List[Any]:
+    '''
+        Bind generators to an RNG and Faker instance
+
+        @param generators: The generators to bind. Plain callables are passed through
+        @param rng: The random.Random instance to draw from
+        @param faker: The Faker instance to draw from
+        @param seed: The master seed of the run
+        @param offset: The index of the first row the generators produce
+        @param backend: The batch backend, "python" or "numpy". Defaults to each generator's own
+        @returns: Bound copies of the generators
+    '''
+    return [
+        generator.bind(rng, faker, seed, offset, backend) if isinstance(generator, BaseType) else generator
+        for generator in generators
+    ]
+
+def generate_shard(schema: Union[List[Any], List[Dict[str, Any]]], seed: int, count: int, locale: str = "en_US",
+                   master_seed: Optional[int] = None, offset: int = 0, backend: Optional[str] = None) -> List[Dict[str, Any]]:
+    '''
+        Generate one shard of records. Runs inside pool workers, so it must stay picklable.
+
+        @param schema: Either a list of generators or a schema definition list
+        @param seed: The seed of this shard
+        @param count: The number of records in this shard
+        @param locale: The Faker locale
+        @param master_seed: The master seed of the run
+        @param offset: The index of the shard's first row in the whole run
+        @param backend: The batch backend, "python" or "numpy"
+        @returns: The generated records
+    '''
+    faker = _worker_fakers.get(locale)
+    if faker is None:
+        faker = _worker_fakers[locale] = LazyFaker(locale)
+    faker.seed_instance(seed)
+    generators = bind_generators(Seeder.resolve_generators(schema), random.Random(seed), faker, master_seed, offset, backend)
+    return Seeder.generate_rows(generators, count)
+
+def generate_shards_in_pool(shards: List[Tuple[Any, ...]], workers: int) -> Iterator[List[Dict[str, Any]]]:
+    '''
+        Generate shards in a process pool, keeping at most two per worker in flight
+
+        @param shards: The generate_shard() arguments of each shard
+        @param workers: Number of worker processes
+        @returns: Iterator over the shards' records, in order
+    '''
+    # Imported here to keep multiprocessing out of the package import
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for shard in shards:
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+            pending.append(executor.submit(generate_shard, *shard))
+        while pending:
+            yield pending.popleft().result()
+
+class Seeder:  # pylint: disable=too-many-public-methods
+    '''
+        Main seeder class. It is the package's facade, with one public
+        method per exporter, so it carries more methods than pylint's default.
+    '''
+    def __init__(self, seed: Optional[int] = None, locale: str = "en_US", backend: str = "python"):
+        '''
+            Each Seeder owns its random.Random and Faker instances, so
+            seeders never share random state, even across threads.
+
+            @param seed: Master seed. When set, output is reproducible and identical for any number of workers
+            @param locale: The Faker locale of the generated data
+            @param backend: "numpy" generates numeric and temporal columns as NumPy arrays when NumPy is
+                installed, falling back to pure Python otherwise. Defaults to "python"
+        '''
         self.data = {}
-        self.export_path = self.make_export_dir()
+        self.random_seed = seed
+        self.locale = locale
+        self.backend = check_backend(backend)
+        self.rng = random.Random(seed)
+        self.faker = LazyFaker(locale, self.rng.getrandbits(64))
+        self.generators = []
+        # Created by make_export_dir() when the first file is written
+        self.export_path = os.getcwd() + '/exports'
 
-    def seed(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int = 1) -> List[Dict[str, Any]]:
+    def seed(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int = 1, workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Generate seed data based on schema
 
         Args:
             schema: Either a list of generators or a schema definition list
             count: Number of records to generate
+            workers: Number of worker processes to generate shards in parallel
 
         Returns:
             List of generated records
         """
-        # Convert schema to generators if it's a schema definition
-        if schema and isinstance(schema[0], dict):
-            generators = self.schema_to_generators(schema)
+        result = list(self.iter_seed(schema, count, workers=workers))
+
+        self.data = result
+        return result
+
+    def iter_seed(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int = 1, batch_size: Optional[int] = None,
+                  workers: Optional[int] = None) -> Iterator[Any]:
+        """
+        Lazily generate seed data based on schema
+
+        Unlike seed(), records are produced on demand and never collected,
+        so memory use is bounded by batch_size rather than count. The
+        result is not stored on self.data; pass the iterator straight to
+        an exporter instead.
+
+        With a master seed or more than one worker, records are generated
+        in fixed-size shards, each seeded from the master seed, and streamed
+        back in order.
+
+        Args:
+            schema: Either a list of generators or a schema definition list
+            count: Number of records to generate
+            batch_size: If set, yield lists of up to batch_size records instead of single records
+            workers: Number of worker processes to generate shards in parallel
+
+        Returns:
+            Iterator over generated records (or batches of records)
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        generators = self.bind_generators(schema)
+        # Kept so exporters can map columns to their generator types
+        self.generators = generators
+        self.check_workers(generators, workers)
+        if self.random_seed is not None or (workers or 1) > 1:
+            chunks = self.iter_shards(schema, count, workers or 1)
         else:
-            generators = schema
+            chunk_size = batch_size or DEFAULT_CHUNK_SIZE
+            chunks = (
+                self.generate_rows(generators, min(chunk_size, count - start))
+                for start in range(0, count, chunk_size)
+            )
 
-        result = []
-        for _ in range(count):
-            seed = {}
-            for i in range(len(generators)):
-                new = generators[i]()
-                seed[new[1]] = new[0]
-                del new
+        records = itertools.chain.from_iterable(chunks)
+        if batch_size is None:
+            yield from records
+            return
 
-            result.append(seed)
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                return
+            yield batch
 
-        self.data = result
-        return result
+    def iter_shards(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int, workers: int = 1, first_shard: int = 0,
+                    master_seed: Optional[int] = None,
+                    on_bind: Optional[Callable[[List[Any]], None]] = None) -> Iterator[List[Dict[str, Any]]]:
+        '''
+            Generate records shard by shard, optionally across a process pool
+
+            Shards are always SHARD_SIZE rows and seeded from the master seed
+            and their index, so the worker count only decides where a shard
+            runs. At most two shards per worker are in flight at once.
+
+            In process, one set of generators is reseeded for every shard, so
+            unique columns remember their values across the whole run.
+
+            @param schema: Either a list of generators or a schema definition list
+            @param count: Number of records in the whole run
+            @param workers: Number of worker processes
+            @param first_shard: The index of the first shard to generate, skipping the rows before it
+            @param master_seed: The master seed. Defaults to the Seeder's, or a random one
+            @param on_bind: Called with the in-process generators once they are bound, before the first shard
+            @returns: Iterator over the shards, in order
+        '''
+        if master_seed is None:
+            master_seed = self.random_seed
+        if master_seed is None:
+            master_seed = self.rng.getrandbits(64)
+        shards = [
+            (schema, shard_seed(master_seed, index), min(SHARD_SIZE, count - start), self.locale, master_seed, start, self.backend)
+            for index, start in enumerate(range(0, count, SHARD_SIZE))
+        ][first_shard:]
+
+        if workers == 1:
+            # Reseeding the same Random per shard matches a fresh random.Random(seed) in a worker
+            rng = random.Random()
+            generators = bind_generators(self.resolve_generators(schema), rng, self.faker, master_seed,
+                                         first_shard * SHARD_SIZE, self.backend)
+            if on_bind is not None:
+                on_bind(generators)
+            for _, seed, size, *_ in shards:
+                rng.seed(seed)
+                self.faker.seed_instance(seed)
+                yield self.generate_rows(generators, size)
+            return
+
+        yield from generate_shards_in_pool(shards, workers)
+
+    def iter_tables(self, tables: Union[Dict[str, Any], List[Union[Table, Dict[str, Any]]]], batch_size: Optional[int] = None,
+                    workers: Optional[int] = None) -> Iterator[Tuple[str, Iterator[Any]]]:
+        """
+        Lazily generate a multi-table schema, parents before children
+
+        Yields one (table name, records) pair per table, in dependency order.
+        Foreign key columns sample the keys of their parent table, which are
+        kept in a compact KeyIndex per referenced column; no parent rows are
+        held in memory. A table's records are drained automatically when the
+        next table is requested, so consume them before moving on.
+
+        With a master seed, each table is seeded from it and its position in
+        the schema. Tables with foreign keys are generated in this process;
+        workers only applies to the others.
+
+        Args:
+            tables: Table objects or table definitions, or a dict with a "tables" list
+            batch_size: If set, records are lists of up to batch_size records
+            workers: Number of worker processes for tables without foreign keys
+
+        Returns:
+            Iterator over (table name, records) pairs
+        """
+        tables = resolve_tables(tables)
+        by_name = {table.name: table for table in tables}
+        generators = {table.name: self.resolve_generators(table.schema) for table in tables}
+        foreign_keys = {
+            name: [generator for generator in table_generators if isinstance(generator, ForeignKey)]
+            for name, table_generators in generators.items()
+        }
+        indexes = {
+            (foreign_key.table, foreign_key_target(foreign_key, by_name)): KeyIndex()
+            for foreign_key in itertools.chain.from_iterable(foreign_keys.values())
+        }
+
+        counts: Dict[str, int] = {}
+        for table in dependency_order(tables, foreign_keys):
+            count = table.count if table.count is not None else round(counts[table.per] * table.ratio)
+            counts[table.name] = count
+            schema = self._link_foreign_keys(generators[table.name], indexes, by_name)
+            rows = self._table_seeder(tables.index(table)).iter_seed(schema, count, workers=1 if foreign_keys[table.name] else workers)
+            key_columns = [(column, index) for (parent, column), index in indexes.items() if parent == table.name]
+            records = self._table_records(table.name, rows, key_columns, batch_size)
+            yield table.name, records
+            for _ in records:
+                pass
+
+    def _table_seeder(self, position: int) -> 'Seeder':
+        '''
+            Get the seeder of one table of iter_tables()
+
+            @param position: The position of the table in the schema
+            @returns: This seeder, or with a master seed, a new one seeded from it and the position
+        '''
+        if self.random_seed is None:
+            return self
+        return Seeder(seed=shard_seed(self.random_seed, position), locale=self.locale, backend=self.backend)
+
+    @staticmethod
+    def _link_foreign_keys(generators: List[Any], indexes: Dict[Tuple[str, str], KeyIndex], tables: Dict[str, Table]) -> List[Any]:
+        '''
+            Point a table's foreign keys at the key indexes of their parent columns
+
+            Foreign keys are linked on copies, so schemas and cached plans are left untouched.
+
+            @param generators: The generators of the table
+            @param indexes: The key index per (parent table, column)
+            @param tables: The tables by name
+            @returns: The generators, with linked copies of the foreign keys
+        '''
+        schema = []
+        for generator in generators:
+            if isinstance(generator, ForeignKey):
+                generator = copy.copy(generator)
+                generator.index = indexes[(generator.table, foreign_key_target(generator, tables))]
+            schema.append(generator)
+        return schema
+
+    @staticmethod
+    def _table_records(table: str, rows: Iterator[Dict[str, Any]], key_columns: List[Tuple[str, KeyIndex]],
+                       batch_size: Optional[int]) -> Iterator[Any]:
+        if key_columns:
+            rows = Seeder._record_keys(table, rows, key_columns)
+        if batch_size is None:
+            yield from rows
+            return
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def _record_keys(table: str, rows: Iterator[Dict[str, Any]], key_columns: List[Tuple[str, KeyIndex]]) -> Iterator[Dict[str, Any]]:
+        for row in rows:
+            for column, index in key_columns:
+                try:
+                    key = row[column]
+                except KeyError:
+                    raise ValueError(f"Table {table} has no column {column} for foreign keys to reference") from None
+                if key is not None:
+                    index.append(key)
+            yield row
+
+    def seed_tables(self, tables: Union[Dict[str, Any], List[Union[Table, Dict[str, Any]]]],
+                    workers: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate a multi-table schema and keep every table in memory
+
+        Args:
+            tables: Table objects or table definitions, or a dict with a "tables" list
+            workers: Number of worker processes for tables without foreign keys
+
+        Returns:
+            Dict mapping each table name to its records, in dependency order
+        """
+        return {name: list(records) for name, records in self.iter_tables(tables, workers=workers)}
+
+    def seed_columns(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int = 1) -> Dict[str, List[Any]]:
+        """
+        Generate seed data as columns instead of records
+
+        Each generator produces its whole column in one generate_batch()
+        call and no per-row dicts are built.
+
+        Args:
+            schema: Either a list of generators or a schema definition list
+            count: Number of values to generate per column
+
+        Returns:
+            Dict mapping each column name to its list of values
+        """
+        names, columns = self.generate_columns(self.bind_generators(schema), count)
+        return dict(zip(names, columns))
+
+    def seed_to_file(self, schema: Union[List[Any], List[Dict[str, Any]]], count: int, filename: str, output_format: str = 'jsonl',
+                     table: Optional[str] = None, batch_size: int = 1000, workers: Optional[int] = None,
+                     checkpoint: Optional[str] = None, interval: int = 1, dialect: str = 'standard') -> str:
+        """
+        Generate records straight to a file, checkpointing so an interrupted run can resume
+
+        Records are generated in shards as with a master seed in iter_seed().
+        Every interval shards, once the rows are written and synced to disk,
+        a checkpoint records the next shard and the size of the file, and
+        the values unique columns added since the last checkpoint are
+        appended to a seen log next to it. Calling seed_to_file() again with the
+        same arguments after a crash truncates the file to the last
+        checkpoint and carries on from there, so the file ends up identical
+        to one from an uninterrupted run. The checkpoint is removed once the
+        run completes.
+
+        Without a master seed, one is drawn and kept in the checkpoint.
+        Seen-sets of string columns only restore under the same
+        PYTHONHASHSEED; otherwise the shards before the checkpoint are
+        generated again, without writing them, to rebuild them.
+
+        Args:
+            schema: Either a list of generators or a schema definition list
+            count: Number of records to generate
+            filename: The name of the file to export to
+            output_format: "jsonl", "csv", "sql", "pg-copy" or "mysql"
+            table: The name of the table, for the sql format. Defaults to filename
+            batch_size: The maximum number of rows per INSERT statement of the sql format
+            workers: Number of worker processes to generate shards in parallel
+            checkpoint: The checkpoint file. Defaults to the output file with a .checkpoint suffix
+            interval: The number of shards between checkpoints. Each checkpoint syncs the output and
+                the seen log to disk and writes only the fingerprints added since the last one, so its
+                cost does not grow with the rows written; raise it when fsyncs dominate small shards
+            dialect: The SQL dialect of the sql format, "standard" or "mysql"
+
+        Returns:
+            The path to the exported file
+        """
+        if output_format not in APPENDABLE_FORMATS:
+            raise ValueError(f"Checkpointed runs write one of: {', '.join(APPENDABLE_FORMATS)}")
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.check_workers(self.resolve_generators(schema), workers)
+
+        path = self.format_filename(filename) + FORMAT_EXTENSIONS[output_format]
+        key = run_key(schema, count=count, seed=self.random_seed, locale=self.locale, backend=self.backend,
+                      format=output_format, table=table, batch_size=batch_size, dialect=dialect, shard_size=SHARD_SIZE)
+        run = CheckpointedRun(key, path, checkpoint or path + '.checkpoint')
+        write = partial(write_format, output_format=output_format, table=table or filename, batch_size=batch_size, dialect=dialect)
+        self._write_checkpointed(run, schema, count, workers or 1, interval, write)
+        return path
+
+    def _write_checkpointed(self, run: CheckpointedRun, schema: Union[List[Any], List[Dict[str, Any]]], count: int, workers: int,
+                            interval: int, write: Callable[..., int]):
+        '''
+            Write the shards of a seed_to_file() run, resuming it and saving a checkpoint every interval shards
+
+            @param run: The checkpoint and seen log of the run
+            @param schema: Either a list of generators or a schema definition list
+            @param count: Number of records to generate
+            @param workers: Number of worker processes
+            @param interval: The number of shards between checkpoints
+            @param write: write_format() with the format options of the run
+        '''
+        mode = run.resume(self.random_seed, self.rng)
+        written = run.state.rows
+        with open(run.path, mode, encoding='utf-8', newline='') as f:
+            shards = self.iter_shards(schema, count, workers, run.first_shard, run.state.master_seed, run.bind)
+            for index, rows in enumerate(shards, run.first_shard):
+                if index < run.state.shard:
+                    # Replayed only to rebuild the seen-sets
+                    continue
+                if rows:
+                    written += write(f, columns=list(rows[0].keys()), rows=rows, header=written == 0)
+                if (index + 1) % interval == 0 or written == count:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    run.save(index + 1, written, os.fstat(f.fileno()).st_size)
+        run.finish()
+
+    def bind_generators(self, schema: Union[List[Any], List[Dict[str, Any]]]) -> List[Any]:
+        '''
+            Resolve a schema and bind its generators to this seeder's RNG and Faker
+
+            The generators passed in are not modified; bound copies are returned.
+
+            @param schema: A list of generators, a schema definition list or a compiled SchemaPlan
+            @returns: The bound generators
+        '''
+        return bind_generators(self.resolve_generators(schema), self.rng, self.faker, backend=self.backend)
+
+    @staticmethod
+    def check_workers(generators: List[Any], workers: Optional[int]):
+        '''
+            Refuse to split unique columns with a seen-set across worker processes
 
-    def to_sql(self, filename: str, table: str) -> str:
+            @param generators: The generators of the run
+            @param workers: The number of worker processes
+        '''
+        if (workers or 1) > 1:
+            indexed = [generator.name for generator in seen_columns(generators)]
+            if indexed:
+                raise ValueError(
+                    f"Unique columns {', '.join(indexed)} track seen values in memory and cannot be "
+                    "split across worker processes. Use workers=1 for them."
+                )
+
+    @staticmethod
+    def resolve_generators(schema: Union[List[Any], List[Dict[str, Any]]]) -> List[Any]:
+        '''
+            Convert a schema definition to generators, or pass generators through
+
+            Schema definitions are compiled once and cached, see compile_schema().
+
+            @param schema: A list of generators, a schema definition list or a compiled SchemaPlan
+            @returns: A list of generators
+        '''
+        if isinstance(schema, SchemaPlan):
+            return list(schema.generators)
+        if schema and isinstance(schema[0], dict):
+            return list(compile_schema(schema).generators)
+        return schema
+
+    @staticmethod
+    def generate_columns(generators: List[Any], count: int) -> Tuple[List[str], List[List[Any]]]:
+        '''
+            Generate one column of values per generator
+
+            @param generators: The generators to call, one per column
+            @param count: The number of values to generate per column
+            @returns: The column names and the generated columns
+        '''
+        names, columns = [], []
+        for generator in generators:
+            if hasattr(generator, 'generate_batch'):
+                names.append(generator.name)
+                columns.append(generator.generate_batch(count))
+            else:
+                # Plain callables returning (value, name) pairs are still supported
+                pairs = [generator() for _ in range(count)]
+                names.append(pairs[0][1] if pairs else None)
+                columns.append([value for value, _ in pairs])
+        return names, columns
+
+    @staticmethod
+    def generate_rows(generators: List[Any], count: int) -> List[Dict[str, Any]]:
+        '''
+            Generate records by building columns first and zipping them into rows
+
+            @param generators: The generators to call, one per column
+            @param count: The number of records to generate
+            @returns: The generated records
+        '''
+        names, columns = Seeder.generate_columns(generators, count)
+        if not columns:
+            return [{} for _ in range(count)]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def to_sql(self, filename: str, table: str, records: Optional[Iterable[Any]] = None, batch_size: int = 1000,
+               compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False,
+               dialect: str = 'standard') -> str:
         '''
             Export the data to a SQL file
 
+            Rows are streamed to the file as multi-row INSERT statements of
+            at most batch_size rows. None is written as NULL, numbers and
+            booleans unquoted and strings quoted with quotes escaped, and
+            with backslashes escaped too for the mysql dialect.
+
             @param filename: The name of the file to export to
             @param table: The name of the table to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param batch_size: The maximum number of rows per INSERT statement
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
+            @param dialect: "standard" for PostgreSQL and SQLite, or "mysql" for MySQL's default sql_mode
             @returns: The path to the exported file
         '''
-        if self.data == {}:
-            raise FileNotFoundError("No data to export")
-        with open(self.format_filename(filename) + '.sql', 'w', encoding='utf-8') as f:
-            columns = ', '.join(self.data[0].keys())
-            sql_str = f"INSERT INTO {table} ({columns}) VALUES "
-            for row in self.data:
-                values = ', '.join(f"'{value}'" for value in row.values())
-                sql_str += f"({values}), "
-            sql_str = sql_str[:-2] + ';'
-            f.write(sql_str)
+        columns, rows = self.peek_records(records)
+        with self.open_export(filename, '.sql', compression, buffer_size, background) as (f, path):
+            write_sql_inserts(f, table, columns, rows, batch_size, dialect)
+
+            return path
+
+    def to_pg_copy(self, filename: str, records: Optional[Iterable[Any]] = None, binary: bool = False,
+                   column_types: Optional[Dict[str, str]] = None, compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False) -> str:
+        '''
+            Export the data in PostgreSQL's COPY format
+
+            The text format is written to filename.copy and loads with
+            COPY table (columns) FROM 'file'. The binary format is written
+            to filename.pgcopy and loads with ... WITH (FORMAT binary).
 
-            return os.getcwd() + '/' + filename + '.sql'
+            @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param binary: Write the binary COPY format instead of text
+            @param column_types: PostgreSQL type per column for the binary format, e.g. {"id": "int4"}
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
+            @returns: The path to the exported file
+        '''
+        columns, rows = self.peek_records(records)
+        if binary:
+            with self.open_export(filename, '.pgcopy', compression, buffer_size, background, binary=True) as (f, path):
+                write_pg_copy_binary(f, columns, rows, column_types)
+
+                return path
+
+        with self.open_export(filename, '.copy', compression, buffer_size, background) as (f, path):
+            write_pg_copy_text(f, rows)
+
+            return path
 
-    def to_json(self, filename: str) -> str:
+    def to_mysql_load(self, filename: str, records: Optional[Iterable[Any]] = None, compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False) -> str:
+        '''
+            Export the data in MySQL's default LOAD DATA format
+
+            Loads with LOAD DATA INFILE 'file' INTO TABLE table (columns).
+
+            @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
+            @returns: The path to the exported file
+        '''
+        _, rows = self.peek_records(records)
+        with self.open_export(filename, '.tsv', compression, buffer_size, background) as (f, path):
+            write_mysql_load(f, rows)
+
+            return path
+
+    def to_parquet(self, filename: str, records: Optional[Iterable[Any]] = None, schema: Optional[Union[List[Any], List[Dict[str, Any]]]] = None,
+                   row_group_size: int = 65536, compression: Optional[str] = 'snappy') -> str:
+        '''
+            Export the data to a Parquet file. Requires pyarrow.
+
+            Records are written one row group at a time. Columns are typed
+            from their generators: Int as int64, Number as float64, Bool as
+            bool, Timestamp and Datetime as timestamp, Date as date32 and
+            Enum as a dictionary-encoded string; other types are strings.
+
+            @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param schema: The generators or schema definition of the records. Defaults to the last one seeded
+            @param row_group_size: The number of rows per row group
+            @param compression: The compression codec, e.g. "snappy", "zstd", "gzip", "lz4" or None
+            @returns: The path to the exported file
+        '''
+        columns, rows = self.peek_records(records)
+        generators = self.resolve_generators(schema) if schema else self.generators
+        write_parquet(self.format_filename(filename) + '.parquet', columns, rows, generators, row_group_size, compression)
+
+        return os.getcwd() + '/' + filename + '.parquet'
+
+    def to_arrow(self, filename: str, records: Optional[Iterable[Any]] = None, schema: Optional[Union[List[Any], List[Dict[str, Any]]]] = None,
+                 batch_size: int = 65536, compression: Optional[str] = None) -> str:
+        '''
+            Export the data to an Arrow IPC file. Requires pyarrow.
+
+            Columns are typed as in to_parquet().
+
+            @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param schema: The generators or schema definition of the records. Defaults to the last one seeded
+            @param batch_size: The number of rows per record batch
+            @param compression: The buffer compression codec, "lz4", "zstd" or None
+            @returns: The path to the exported file
+        '''
+        columns, rows = self.peek_records(records)
+        generators = self.resolve_generators(schema) if schema else self.generators
+        write_arrow(self.format_filename(filename) + '.arrow', columns, rows, generators, batch_size, compression)
+
+        return os.getcwd() + '/' + filename + '.arrow'
+
+    def to_database(self, target: Any, table: str, records: Optional[Iterable[Any]] = None, batch_size: int = 1000,
+                    writers: int = 1, paramstyle: Optional[str] = None) -> int:
+        '''
+            Insert the data straight into a database table
+
+            Rows are inserted with executemany in batches of batch_size, each
+            batch committed on its own. With writers > 1, batches are written
+            concurrently by threads sharing a pool of up to writers connections.
+
+            @param target: A SQLite database path, a callable returning new DB-API connections
+                (e.g. functools.partial(psycopg2.connect, dsn)), or an open connection
+            @param table: The name of the table to insert into
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param batch_size: The number of rows per executemany call
+            @param writers: The number of concurrent writer threads. An open connection is always written by one
+            @param paramstyle: The DB-API paramstyle. Detected from the driver if not given
+            @returns: The number of rows written
+        '''
+        columns, rows = self.peek_records(records)
+        shared = hasattr(target, 'cursor')
+        pool = connection_pool(target, writers)
+        try:
+            return write_rows(pool, table, columns, rows, batch_size, 1 if shared else writers, paramstyle)
+        finally:
+            if not shared:
+                pool.close()
+
+    def to_json(self, filename: str, records: Optional[Iterable[Any]] = None, indent: Optional[int] = 4,
+                compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False) -> str:
         '''
             Export the data to a JSON file
 
             @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param indent: The indentation of the output. None writes compact JSON without whitespace
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
             @returns: The path to the exported file
         '''
-        if self.data == {}:
-            raise FileNotFoundError("No data to export")
-        with open(self.format_filename(filename) + '.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=4)
+        _, rows = self.peek_records(records)
+        with self.open_export(filename, '.json', compression, buffer_size, background) as (f, path):
+            write_json_array(f, rows, indent)
+
+            return path
+
+    def to_jsonl(self, filename: str, records: Optional[Iterable[Any]] = None, backend: str = 'auto',
+                 compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False) -> str:
+        '''
+            Export the data to a JSON Lines file, one compact record per line
+
+            @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param backend: The JSON encoder: "json", "orjson", or "auto" to use orjson when installed
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
+            @returns: The path to the exported file
+        '''
+        _, rows = self.peek_records(records)
+        with self.open_export(filename, '.jsonl', compression, buffer_size, background) as (f, path):
+            write_jsonl(f, rows, backend)
 
-            return os.getcwd() + '/' + filename + '.json'
+            return path
 
-    def to_csv(self, filename: str) -> str:
+    def to_csv(self, filename: str, records: Optional[Iterable[Any]] = None, compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE, background: bool = False) -> str:
         '''
             Export the data to a CSV file
 
             @param filename: The name of the file to export to
+            @param records: Records to export instead of self.data, e.g. from iter_seed()
+            @param compression: Compress the file with "gzip", "zstd" or "lz4", adding .gz, .zst or .lz4 to its name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread, overlapping with generation
             @returns: The path to the exported file
         '''
-        if self.data == {}:
-            raise FileNotFoundError("No data to export")
-        with open(self.format_filename(filename) + '.csv', 'w', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(self.data[0].keys())
-            for row in self.data:
-                writer.writerow(row.values())
+        columns, rows = self.peek_records(records)
+        with self.open_export(filename, '.csv', compression, buffer_size, background) as (f, path):
+            write_csv(f, columns, rows)
+
+            return path
+
+    @contextmanager
+    def open_export(self, filename: str, extension: str, compression: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                    background: bool = False, binary: bool = False) -> Iterator[Tuple[Any, str]]:
+        '''
+            Open an export file in the exports directory, see open_output()
 
-            return os.getcwd() + '/' + filename + '.csv'
+            @param filename: The name of the file to export to
+            @param extension: The extension of the format, e.g. ".csv"
+            @param compression: "gzip", "zstd", "lz4" or None. Adds its extension to the file name
+            @param buffer_size: The number of bytes buffered per write
+            @param background: Compress and write from a background thread
+            @param binary: Open for bytes instead of UTF-8 text
+            @returns: The open file and the path returned to the caller
+        '''
+        name = filename + extension + compression_extension(compression)
+        with open_output(self.format_filename(name), binary, compression, buffer_size=buffer_size,
+                         background=background, newline='') as f:
+            yield f, os.getcwd() + '/' + name
+
+    def peek_records(self, records: Optional[Iterable[Any]] = None) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        '''
+            Prepare a record source for export without materializing it
+
+            Batches yielded by iter_seed(batch_size=...) are flattened. The
+            first record is read to find the column names and then chained
+            back onto the returned iterator.
+
+            @param records: Records or batches of records. Defaults to self.data
+            @returns: The column names and an iterator over all records
+        '''
+        if records is None:
+            records = self.data if self.data != {} else []
+        rows = itertools.chain.from_iterable(
+            item if isinstance(item, list) else (item,) for item in records
+        )
+        first = next(rows, None)
+        if first is None:
+            raise FileNotFoundError("No data to export")
+        return list(first.keys()), itertools.chain((first,), rows)
 
     def make_export_dir(self):
         '''
@@ -155,19 +793,19 @@ class Seeder:
             @returns: The path to the exports directory
         '''
         try:
-            Path('exports').mkdir(parents=True, exist_ok=True)
-            return os.getcwd() + '/exports'
+            Path(self.export_path).mkdir(parents=True, exist_ok=True)
+            return self.export_path
         except Exception as e:
             raise FileNotFoundError("Failed to create exports directory") from e
 
     def format_filename(self, filename: str) -> str:
         '''
-            Format the filename to include the exports directory
+            Format the filename to include the exports directory, creating the directory
 
             @param filename: The name of the file to format
             @returns: The formatted filename
         '''
-        return self.export_path + '/' + filename
+        return self.make_export_dir() + '/' + filename
 
     def __str__(self):
         return str(self.data)
@@ -175,7 +813,8 @@ class Seeder:
     def __repr__(self):
         return "Seeder()"
 
-    def schema_to_generators(self, schema_json: List[Dict[str, Any]]) -> List[Any]:
+    @staticmethod
+    def schema_to_generators(schema_json: List[Dict[str, Any]]) -> List[Any]:
         '''
             Convert a schema to a list of generators
 
@@ -214,185 +853,4 @@ class Seeder:
                 }
             ]
         '''
-        type_mapping = {
-            'integer': Int,
-            'text': Text,
-            'currency': Currency,
-            'enum': Enum,
-            'boolean': Bool,
-            'string': Text,
-            'float': Number,
-            'number': Number,
-            'date': Date,
-            'datetime': Datetime,
-            'email': Email,
-            'phone': Phone,
-            'address': Address,
-            'url': Website,
-            'id': ID,
-            'name': Name,
-            'country': Country,
-            'state': State,
-            'city': City,
-            'zip': Zip,
-            'time': Time,
-            'timestamp': Timestamp,
-            'timezone': TimeZone,
-            'dayofweek': DayOfWeek,
-            'color': Color,
-            'jobtitle': JobTitle,
-            'department': CompanyDepartment,
-            'fileextension': FileExtension,
-            'socialmedia': SocialMediaHandle,
-            'ipaddress': IPAddress,
-            'latlng': LatitudeLongitude,
-            'version': Version,
-            'sentence': Sentence,
-            'paragraph': Paragraph,
-            'useragent': UserAgent,
-            'hash': Hash,
-            'isbn': ISBN,
-            'isbn13': ISBN13,
-            'ean': EAN,
-            'sku': SKU,
-            'macaddress': MACAddress,
-            'creditcard': CreditCardNumber,
-            'iban': IBAN,
-            'bic': BIC,
-            'null': Null,
-            'uuid': UUID,
-            'domainname': DomainName,
-            'domainword': DomainWord,
-            'tld': TLD,
-        }
-
-        generators = []
-        for field in schema_json:
-            field_type = field['type'].lower()
-            field_name = field['name']
-
-            if field_type not in type_mapping:
-                raise ValueError(f"Unsupported field type: {field_type}")
-
-            generator_class = type_mapping[field_type]
-            # Handle special cases with additional parameters
-            if field_type == 'currency':
-                generators.append(Currency(
-                    name=field_name,
-                    symbol=field.get('symbol', '$'),
-                    min_value=field.get('min_value', 0),
-                    max_value=field.get('max_value', 1000)
-                ))
-            elif field_type == 'integer':
-                generators.append(Int(
-                    name=field_name,
-                    value=random.randint(field.get('min', 1), field.get('max', 99999))
-                ))
-            elif field_type == 'datetime':
-                generators.append(Datetime(
-                    name=field_name,
-                    start_date=field.get('start_date', '1970-01-01'),
-                    end_date=field.get('end_date', 'today'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'timestamp':
-                generators.append(Timestamp(
-                    name=field_name,
-                    start_date=field.get('start_date', '1970-01-01'),
-                    end_date=field.get('end_date', 'today'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'color':
-                generators.append(Color(
-                    name=field_name,
-                    color_type=field.get('color_type', 'name'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'version':
-                generators.append(Version(
-                    name=field_name,
-                    major_min=field.get('major_min', 0),
-                    major_max=field.get('major_max', 10),
-                    minor_min=field.get('minor_min', 0),
-                    minor_max=field.get('minor_max', 10),
-                    patch_min=field.get('patch_min', 0),
-                    patch_max=field.get('patch_max', 10),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'sentence':
-                generators.append(Sentence(
-                    name=field_name,
-                    nb_words=field.get('nb_words', 6),
-                    variable_nb_words=field.get('variable_nb_words', 6),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'paragraph':
-                generators.append(Paragraph(
-                    name=field_name,
-                    nb_sentences=field.get('nb_sentences', 3),
-                    variable_nb_sentences=field.get('variable_nb_sentences', 3),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'hash':
-                generators.append(Hash(
-                    name=field_name,
-                    hash_type=field.get('hash_type', 'sha256'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'creditcard':
-                generators.append(CreditCardNumber(
-                    name=field_name,
-                    card_type=field.get('card_type', 'visa'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'iban':
-                generators.append(IBAN(
-                    name=field_name,
-                    country_code=field.get('country_code'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'sku':
-                generators.append(SKU(
-                    name=field_name,
-                    prefix=field.get('prefix', ''),
-                    length=field.get('length', 8),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'socialmedia':
-                generators.append(SocialMediaHandle(
-                    name=field_name,
-                    platform=field.get('platform'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'ipaddress':
-                generators.append(IPAddress(
-                    name=field_name,
-                    version=field.get('version', 'ipv4'),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'enum':
-                generators.append(Enum(
-                    name=field_name,
-                    choices=field.get('choices', []),
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'latlng':
-                generators.append(LatitudeLongitude(
-                    name=field_name,
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'timezone':
-                generators.append(TimeZone(
-                    name=field_name,
-                    probability=field.get('probability', 100)
-                ))
-            elif field_type == 'user_agent':
-                generators.append(UserAgent(
-                    name=field_name,
-                    probability=field.get('probability', 100)
-                ))
-            else:
-                # For simple types that only need name parameter
-                generators.append(generator_class(name=field_name))
-
-        return generators
+        return build_generators(schema_json)
@@ -0,0 +1,228 @@
+'''
+    Temporal core shared by the date and time types: parsing of range bounds,
+    integer epoch conversion and cached string formatting.
+'''
+import math
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, List, Sequence
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
+
+# Relative bounds such as "-7d" or "+2h": the unit letter and the length of one unit
+RELATIVE_UNITS = {
+    'd': timedelta(days=1),
+    'h': timedelta(hours=1),
+    'm': timedelta(minutes=1),
+    's': timedelta(seconds=1),
+}
+
+# "HH:MM:" for every minute of the day and "SS" for every second, joined to format a time of day
+_HOURS_MINUTES = tuple(f"{hour:02d}:{minute:02d}:" for hour in range(24) for minute in range(60))
+_SECONDS = tuple(f"{second:02d}" for second in range(60))
+
+def parse_relative(value: str, units: str = 'dhms') -> datetime:
+    '''
+        Resolve a relative bound such as "+1d" or "-2h" against the current time
+
+        @param value: The relative bound: a sign, a number and a unit letter
+        @param units: The unit letters allowed
+        @returns: The resolved datetime
+    '''
+    if not value[1:].isalnum():
+        raise ValueError(f"Invalid relative time format: {value}")
+    unit = value[-1].lower()
+    if unit not in RELATIVE_UNITS:
+        raise ValueError(f"Unsupported time unit: {unit}")
+    if unit not in units:
+        allowed = ', '.join(f"'{letter}'" for letter in units)
+        raise ValueError(f"Only {allowed} units are supported here, got '{unit}'")
+    try:
+        number = int(value[1:-1])
+    except ValueError as e:
+        raise ValueError(f"Invalid relative time format: {value}") from e
+    delta = RELATIVE_UNITS[unit] * number
+    now = datetime.now()
+    return now + delta if value.startswith('+') else now - delta
+
+def parse_datetime(value: Any, units: str = 'dhms') -> datetime:
+    '''
+        Parse a datetime bound
+
+        Accepts datetime and date objects, "today" and "now", relative bounds
+        like "-2h", ISO strings and "YYYY-MM-DD[ HH:MM[:SS]]".
+
+        @param value: The bound. None means now
+        @param units: The unit letters allowed in relative bounds
+        @returns: The datetime
+    '''
+    if value is None:
+        return datetime.now()
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time())
+    if not isinstance(value, str):
+        raise ValueError(f"Unsupported datetime type: {type(value)}")
+
+    if value.lower() in ('today', 'now'):
+        return datetime.now()
+    if value.startswith(('+', '-')):
+        return parse_relative(value, units)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for pattern in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M'):
+        try:
+            return datetime.strptime(value, pattern)
+        except ValueError:
+            pass
+    raise ValueError(f"Unsupported datetime format: {value}")
+
+def parse_date(value: Any) -> date:
+    '''
+        Parse a date bound. Relative bounds only take days, e.g. "-7d".
+
+        @param value: The bound. None means today
+        @returns: The date
+    '''
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    return parse_datetime(value, units='d').date()
+
+def parse_time(value: Any) -> time:
+    '''
+        Parse a time of day bound: "HH:MM[:SS]", "now", a datetime, or a
+        relative bound in hours, minutes or seconds
+
+        @param value: The bound. None means now
+        @returns: The time
+    '''
+    if value is None:
+        return datetime.now().time()
+    if isinstance(value, time):
+        return value
+    if isinstance(value, datetime):
+        return value.time()
+    if not isinstance(value, str):
+        raise ValueError(f"Unsupported time type: {type(value)}")
+
+    if value.lower() == 'now':
+        return datetime.now().time()
+    if value.startswith(('+', '-')):
+        return parse_relative(value, units='hms').time()
+    for pattern in ('%H:%M:%S', '%H:%M'):
+        try:
+            return datetime.strptime(value, pattern).time()
+        except ValueError:
+            pass
+    raise ValueError(f"Unsupported time format: {value}")
+
+def epoch_day(value: date) -> int:
+    '''
+        Convert a date to days since 1970-01-01
+
+        @param value: The date
+        @returns: The day number
+    '''
+    return value.toordinal() - EPOCH_ORDINAL
+
+def epoch_seconds(value: datetime) -> float:
+    '''
+        Convert a datetime to seconds since 1970-01-01 00:00 on the wall clock
+
+        The time zone is ignored, so formatting the seconds gives back the
+        datetime as written, whatever the local time zone and DST.
+
+        @param value: The datetime
+        @returns: The seconds, with microseconds as the fraction
+    '''
+    return (value.replace(tzinfo=None) - EPOCH).total_seconds()
+
+def time_seconds(value: time) -> float:
+    '''
+        Convert a time of day to seconds since midnight
+
+        @param value: The time
+        @returns: The seconds, with microseconds as the fraction
+    '''
+    return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+
+def int_bounds(low: float, high: float):
+    '''
+        Get the whole numbers within [low, high]
+
+        @param low: The start of the range
+        @param high: The end of the range
+        @returns: The smallest and largest int in the range, or (floor(low), floor(low)) when it holds none
+    '''
+    first, last = math.ceil(low), math.floor(high)
+    return (first, last) if first <= last else (math.floor(low), math.floor(low))
+
+@lru_cache(maxsize=1 << 16)
+def format_day(day: int) -> str:
+    '''
+        Format a day number as YYYY-MM-DD. Cached, since columns repeat days.
+
+        @param day: Days since 1970-01-01
+        @returns: The ISO date
+    '''
+    return date.fromordinal(day + EPOCH_ORDINAL).isoformat()
+
+def format_time_of_day(seconds: int) -> str:
+    '''
+        Format seconds since midnight as HH:MM:SS
+
+        @param seconds: An int in range(86400)
+        @returns: The time
+    '''
+    minutes, second = divmod(seconds, 60)
+    return _HOURS_MINUTES[minutes] + _SECONDS[second]
+
+def format_datetime(seconds: int) -> str:
+    '''
+        Format epoch seconds as YYYY-MM-DD HH:MM:SS
+
+        @param seconds: Seconds since 1970-01-01 00:00
+        @returns: The datetime
+    '''
+    day, second = divmod(seconds, SECONDS_PER_DAY)
+    minutes, second = divmod(second, 60)
+    return f"{format_day(day)} {_HOURS_MINUTES[minutes]}{_SECONDS[second]}"
+
+def format_days(days: Iterable[int]) -> List[str]:
+    '''
+        Format a column of day numbers
+
+        @param days: Days since 1970-01-01
+        @returns: The ISO dates
+    '''
+    return [format_day(day) for day in days]
+
+def format_times_of_day(seconds: Iterable[int]) -> List[str]:
+    '''
+        Format a column of seconds since midnight
+
+        @param seconds: Ints in range(86400)
+        @returns: The HH:MM:SS times
+    '''
+    hours_minutes, second_strings = _HOURS_MINUTES, _SECONDS
+    return [hours_minutes[value // 60] + second_strings[value % 60] for value in seconds]
+
+def format_datetimes(seconds: Sequence[int]) -> List[str]:
+    '''
+        Format a column of epoch seconds
+
+        @param seconds: Seconds since 1970-01-01 00:00
+        @returns: The YYYY-MM-DD HH:MM:SS datetimes
+    '''
+    day_string, hours_minutes, second_strings = format_day, _HOURS_MINUTES, _SECONDS
+    values = []
+    append = values.append
+    for value in seconds:
+        day, second = divmod(value, SECONDS_PER_DAY)
+        append(f"{day_string(day)} {hours_minutes[second // 60]}{second_strings[second % 60]}")
+    return values
@@ -1,29 +1,592 @@
 '''
     Types are the data types that can be used to generate fake data.
 '''
+import copy
+import math
 import random
+import itertools
+import ipaddress
+from functools import partial
 from typing import Any, List
-from datetime import datetime, timedelta
-from faker import Faker
 
-fake = Faker("en_US")
+from seeder.distributions import AliasTable, make_distribution, rounded_sampler
+from seeder.events import ARRIVALS, event_offsets
+from seeder.pools import load_pool
+from seeder.temporal import (
+    epoch_day,
+    epoch_seconds,
+    format_datetime,
+    format_datetimes,
+    format_day,
+    format_days,
+    format_time_of_day,
+    format_times_of_day,
+    int_bounds,
+    parse_date,
+    parse_datetime,
+    parse_time,
+    time_seconds,
+)
+from seeder.unique import Permutation, SeenSet, permutation_key, unique_draws
+from seeder.vectorized import fits_int64, integers, load_numpy, numpy_rng
+
+def new_faker(locale="en_US", seed=None):
+    """
+    Creates a Faker instance with its own random state.
+
+    @param locale: The Faker locale
+    @param seed: The seed of the instance. If not provided, it is seeded from the random module
+    @return: The Faker instance
+    """
+    # Imported here because importing Faker and loading its providers dominates the import time of this package
+    from faker import Faker  # pylint: disable=import-outside-toplevel
+
+    faker = Faker(locale)
+    # Without seed_instance, every Faker shares one module-level random state
+    faker.seed_instance(random.getrandbits(64) if seed is None else seed)
+    return faker
+
+class LazyFaker:
+    '''
+        Stands in for a Faker instance, which is only created when one of its
+        providers is first used. Seeding before that is recorded and applied
+        on creation, so generators that never touch Faker never pay for it.
+
+        @param locale: The Faker locale
+        @param seed: The seed of the instance. If not provided, it is seeded from the random module
+    '''
+    def __init__(self, locale="en_US", seed=None):
+        self.locale = locale
+        self._seed = seed
+        self._faker = None
+
+    @property
+    def loaded(self):
+        '''
+            Whether the Faker instance has been created
+        '''
+        return self._faker is not None
+
+    def load(self):
+        '''
+            Create the Faker instance if needed
+
+            @returns: The Faker instance
+        '''
+        if self._faker is None:
+            self._faker = new_faker(self.locale, self._seed)
+        return self._faker
+
+    def seed_instance(self, seed):
+        '''
+            Seed the Faker instance, or the one created later
+
+            @param seed: The seed
+        '''
+        if self._faker is None:
+            self._seed = seed
+        else:
+            self._faker.seed_instance(seed)
+
+    def __getattr__(self, name):
+        # Keep copy and pickle protocol lookups from creating the instance
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        return f"LazyFaker(locale={self.locale!r}, loaded={self.loaded})"
+
+fake = LazyFaker("en_US")
+
+def faker_locale(faker):
+    """
+    Gets the locale of a Faker or LazyFaker instance.
+
+    @param faker: The instance
+    @return: The locale
+    """
+    return faker.locale if isinstance(faker, LazyFaker) else faker.locales[0]
+
+SKU_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+OCTETS = [str(octet) for octet in range(256)]
+BOOLS = (True, False)
+
+# Faker methods per option, resolved once when a type is constructed
+EMAIL_METHODS = {"random": "email", "safe": "safe_email", "free": "free_email", "company": "company_email"}
+COLOR_METHODS = {"name": "color_name", "hex": "hex_color", "rgb": "rgb_color"}
+SOCIAL_MEDIA_PREFIXES = {"twitter": "@", "instagram": "instagram_", "facebook": ""}
+HASH_TYPES = ("md5", "sha1", "sha256")
+
+# Tables for the fast=True paths, which draw from the RNG instead of Faker
+HASH_LENGTHS = {"md5": 32, "sha1": 40, "sha256": 64}
+DAYS_OF_WEEK = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+TLDS = ("com", "com", "com", "com", "com", "com", "biz", "info", "net", "org")  # Faker's default weights
+UUID4_MASK = ~((0xc000 << 48) | (0xf000 << 64)) & ((1 << 128) - 1)
+UUID4_BITS = (0x8000 << 48) | (4 << 76)
+MAC_SHIFTS = (40, 32, 24, 16, 8, 0)
+
+# Time-ordered IDs
+CROCKFORD_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ULID_SHIFTS = tuple(range(125, -1, -5))
+SNOWFLAKE_EPOCH_MS = 1288834974657  # Twitter's epoch, 2010-11-04T01:42:54.657Z
+EVENT_OUTPUTS = ('datetime', 'timestamp', 'timestamp_ms')
+CARD_TYPES = ("visa", "mastercard", "amex", "discover")
+
+# Day names per Faker locale, collected once by day_names()
+_day_names = {}
+
+def day_names(faker):
+    """
+    Gets the day names Faker's day_of_week() produces in the instance's locale.
 
-def handle_probability(value, fallback, probability):
+    Faker formats a date drawn up to the current time, so its days depend on
+    the clock. The names are collected once from a separately seeded Faker,
+    so DayOfWeek can pick them from its own RNG instead.
+
+    @param faker: A Faker or LazyFaker instance
+    @return: The seven names: Monday first in English, sorted otherwise
+    """
+    locale = faker_locale(faker)
+    names = _day_names.get(locale)
+    if names is None:
+        draw, found = new_faker(locale, 0).day_of_week, set()
+        # Seven names turn up within a few dozen draws; the bound only guards odd locales
+        for _ in range(1000):
+            found.add(draw())
+            if len(found) == len(DAYS_OF_WEEK):
+                break
+        names = DAYS_OF_WEEK if found == set(DAYS_OF_WEEK) else tuple(sorted(found))
+        _day_names[locale] = names
+    return names
+
+def handle_probability(value, fallback, probability, rng=random):
     """
     Handles probability logic for all types.
 
     @param value: The value to potentially return
     @param fallback: The fallback value (usually None)
     @param probability: The probability (0-100) of returning the value
+    @param rng: The random number generator to draw from. Defaults to the random module
     @return: Either the value or the fallback based on probability
     """
     if probability == 100:
         return value
 
-    sample = random.random() * 100  # Convert to percentage
+    sample = rng.random() * 100  # Convert to percentage
     return value if sample < probability else fallback
 
-class Null:
+def handle_probability_batch(values, fallback, probability, rng=random):
+    """
+    Handles probability logic for a whole column of values.
+
+    @param values: The list of values to potentially return
+    @param fallback: The fallback value (usually None)
+    @param probability: The probability (0-100) of returning each value
+    @param rng: The random number generator to draw from. Defaults to the random module
+    @return: The list with each value kept or replaced by the fallback
+    """
+    if probability == 100:
+        return values
+
+    rand = rng.random
+    return [value if rand() * 100 < probability else fallback for value in values]
+
+# random.choices() scales random() by the population size, which is only
+# uniform, and only fits in a C ssize_t, for ranges below 2**53
+CHOICES_RANGE_LIMIT = 1 << 53
+
+def randint_batch(rng, low, high, n):
+    """
+    Draws a column of ints between low and high inclusive.
+
+    @param rng: The random number generator to draw from
+    @param low: The lowest value
+    @param high: The highest value
+    @param n: The number of values
+    @return: The list of values
+    """
+    if high - low < CHOICES_RANGE_LIMIT:
+        return rng.choices(range(low, high + 1), k=n)
+    randrange, stop = rng.randrange, high + 1
+    return [randrange(low, stop) for _ in range(n)]
+
+def fast_uuid4(rng):
+    """
+    Generates a version 4 UUID string from rng.getrandbits, formatted like str(uuid.UUID).
+
+    @param rng: The random number generator to draw from
+    @return: The UUID string
+    """
+    return format_uuid(rng.getrandbits(128) & UUID4_MASK | UUID4_BITS)
+
+def format_uuid(value):
+    """
+    Formats a 128-bit int like str(uuid.UUID).
+
+    @param value: The int
+    @return: The UUID string
+    """
+    digits = f'{value:032x}'
+    return f'{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}'
+
+def uuid4_from_bits(bits):
+    """
+    Spreads 122 random bits around the version and variant bits of a version 4 UUID.
+
+    @param bits: An int below 2 ** 122
+    @return: The 128-bit UUID int
+    """
+    return (bits >> 74 << 80) | (4 << 76) | ((bits >> 62 & 0xfff) << 64) | (0b10 << 62) | (bits & (1 << 62) - 1)
+
+def fast_hex(rng, length):
+    """
+    Generates a random lowercase hex string, in the format of a hex digest.
+
+    @param rng: The random number generator to draw from
+    @param length: The number of hex digits
+    @return: The hex string
+    """
+    return f'{rng.getrandbits(length * 4):0{length}x}'
+
+def fast_ipv4(rng):
+    """
+    Generates a random dotted-quad IPv4 address.
+
+    @param rng: The random number generator to draw from
+    @return: The address
+    """
+    address = rng.getrandbits(32)
+    return f'{address >> 24}.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255}'
+
+def fast_ipv6(rng):
+    """
+    Generates a random IPv6 address in compressed form.
+
+    @param rng: The random number generator to draw from
+    @return: The address
+    """
+    digits = f'{rng.getrandbits(128):032x}'
+    groups = [digits[i:i + 4].lstrip('0') for i in range(0, 32, 4)]
+    if '' in groups:
+        # Zero groups are compressed to "::", which ipaddress handles
+        return str(ipaddress.IPv6Address(int(digits, 16)))
+    return ':'.join(groups)
+
+def fast_mac(rng):
+    """
+    Generates a MAC address of six decimal octets from a single draw.
+
+    @param rng: The random number generator to draw from
+    @return: The address
+    """
+    return format_mac(rng.getrandbits(48))
+
+def format_mac(address):
+    """
+    Formats a 48-bit int as a MAC address of six decimal octets.
+
+    @param address: The int
+    @return: The address
+    """
+    return ':'.join([OCTETS[address >> shift & 255] for shift in MAC_SHIFTS])
+
+def format_sku(index, length):
+    """
+    Writes an int in base 36 with SKU_ALPHABET digits, padded to length.
+
+    @param index: An int below 36 ** length
+    @param length: The number of digits
+    @return: The digits
+    """
+    digits = []
+    for _ in range(length):
+        index, digit = divmod(index, 36)
+        digits.append(SKU_ALPHABET[digit])
+    return ''.join(reversed(digits))
+
+def format_ulid(value):
+    """
+    Formats a 128-bit int as a 26 character Crockford base32 ULID.
+
+    @param value: The int
+    @return: The ULID string
+    """
+    return ''.join([CROCKFORD_ALPHABET[value >> shift & 31] for shift in ULID_SHIFTS])
+
+def value_source(value):
+    """
+    Builds a zero-argument callable returning a fixed value or the value of another generator.
+
+    @param value: A fixed value or another faked data type
+    @return: The callable
+    """
+    if callable(value):
+        return lambda: value()[0]
+    return itertools.repeat(value).__next__
+
+def value_batch(value, n):
+    """
+    Produces n copies of a fixed value, or n values from a generator.
+
+    @param value: A fixed value or another faked data type
+    @param n: The number of values to produce
+    @return: A list of n values
+    """
+    if callable(value):
+        if hasattr(value, 'generate_batch'):
+            return value.generate_batch(n)
+        return [value()[0] for _ in range(n)]
+    return [value] * n
+
+class BaseType:
+    '''
+        Base class for all types. Subclasses implement __call__ to generate a
+        single (value, name) pair and may override generate_batch with a
+        faster column-at-a-time implementation.
+
+        Types draw from self.rng and self.faker, which default to the shared
+        random module and Faker instance. Seeder gives each run its own
+        through bind().
+
+        Types that take unique=True never repeat a value: by default through
+        a seen-set of fingerprints, or, for types whose values map onto a
+        range of ints, by walking a keyed Permutation of that range.
+
+        With backend set to "numpy", numeric and temporal types generate
+        batches as NumPy arrays, falling back to pure Python when NumPy is
+        not installed.
+    '''
+    # Set by every subclass's __init__
+    name: str
+    probability: int
+    rng = random
+    faker = fake
+    unique = False
+    backend = 'python'
+    # Set by bind(): the run's master seed, keying permutations, and the
+    # index of the first row this copy generates
+    run_seed = None
+    row_offset = 0
+    # The seen-set of a unique column, set when it is specialized
+    _seen = None
+    # Nested generators of the wrapper types, rebound by bind()
+    value = None
+    choices = None
+
+    def bind(self, rng, faker, seed=None, offset=0, backend=None):
+        '''
+            Make a copy of this generator that draws from the given RNG and Faker
+
+            Generators nested in the value or choices are bound too, so the
+            original generator is never modified.
+
+            @param rng: A random.Random instance
+            @param faker: A Faker instance
+            @param seed: The master seed of the run, so unique columns walk the same permutation in every shard
+            @param offset: The index of the first row the copy generates, e.g. the first row of a shard
+            @param backend: "python" or "numpy". Defaults to keeping the generator's backend
+            @returns: The bound copy
+        '''
+        bound = copy.copy(self)
+        bound.rng = rng
+        bound.faker = faker
+        bound.run_seed = seed
+        bound.row_offset = offset
+        if backend is not None:
+            bound.backend = backend
+        if isinstance(getattr(self, 'value', None), BaseType):
+            bound.value = self.value.bind(rng, faker, seed, offset, backend)
+        if isinstance(getattr(self, 'choices', None), list):
+            bound.choices = [
+                choice.bind(rng, faker, seed, offset, backend) if isinstance(choice, BaseType) else choice
+                for choice in self.choices
+            ]
+        # Specialize again on first use, against the new RNG and Faker
+        bound.__dict__.pop('_generate', None)
+        bound.__dict__.pop('_seen', None)
+        return bound
+
+    def __call__(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def generate_batch(self, n):
+        '''
+            Generate a whole column of values in one call
+
+            @param n: The number of values to generate
+            @returns: A list of n values
+        '''
+        return [self()[0] for _ in range(n)]
+
+    def _vectorized_batch(self, n):
+        '''
+            Generate a column with the NumPy backend, if it is selected and installed
+
+            @param n: The number of values to generate
+            @returns: A list of n values before the probability is applied, or None to generate them in Python
+        '''
+        if self.backend != 'numpy' or self.unique:
+            return None
+        np = load_numpy()
+        if np is None:
+            return None
+        return self._numpy_batch(np, numpy_rng(np, self.rng), n)
+
+    def _numpy_batch(self, np, np_rng, n):  # pylint: disable=unused-argument
+        '''
+            Generate a column from NumPy arrays. Types with a vectorized path override this.
+
+            @param np: The numpy module
+            @param np_rng: A numpy.random.Generator seeded from self.rng
+            @param n: The number of values to generate
+            @returns: A list of n values, or None when the options have no vectorized path
+        '''
+        return None
+
+    def _specialize(self):
+        '''
+            Bind self._generate to a callable for the configured options, so
+            __call__ does not re-check the options for every value.
+        '''
+
+    def _generate_column(self, n):
+        '''
+            Generate n values from the specialized callable, then apply the probability to the column
+
+            @param n: The number of values to generate
+            @returns: A list of n values
+        '''
+        if '_generate' not in self.__dict__:
+            self._prepare()
+        generate = self._generate
+        return handle_probability_batch([generate() for _ in range(n)], None, self.probability, self.rng)
+
+    def _prepare(self):
+        self._specialize()
+        if self.unique:
+            self._specialize_unique()
+
+    def _specialize_unique(self):
+        '''
+            Wrap self._generate so it never returns a value twice. Types whose
+            values map onto a range of ints override this to walk a Permutation.
+        '''
+        self._seen = SeenSet()
+        self._generate = unique_draws(self._generate, self.name, seen=self._seen)
+
+    def uses_permutation(self):
+        '''
+            Whether unique values come from a Permutation, which needs no
+            seen-set and stays unique across shards generated in other processes
+        '''
+        return False
+
+    def _permutation(self, size):
+        '''
+            Iterate a permutation of range(size) for this column, from this copy's row offset
+
+            @param size: The number of values
+            @returns: Iterator over the permuted values
+        '''
+        permutation = Permutation(size, permutation_key(self.run_seed, self.name, self.rng))
+        return permutation.values(self.row_offset, self.name)
+
+    def _generate(self):  # pylint: disable=method-hidden
+        # Trampoline: specialize on the first call, after which the instance
+        # attribute set by _specialize() shadows this method on purpose.
+        # Deferring it keeps constructing a type from touching Faker.
+        self._prepare()
+        return self._generate()
+
+    def __getstate__(self):
+        # Bound callables are rebuilt after unpickling, e.g. in worker processes
+        state = self.__dict__.copy()
+        state.pop('_generate', None)
+        state.pop('_seen', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+class PooledType(BaseType):
+    '''
+        Base class for types whose values go through Faker's full formatting
+        pipeline. Subclasses implement _source(faker), which returns a
+        callable drawing one value from the given Faker.
+
+        With a pool_size, up to pool_size unique values are drawn once from a
+        Faker seeded with pool_seed, then each value is a single random choice
+        from the pool. Pools are shared in memory per type options, locale,
+        size and seed, and saved in the pool_cache directory when it is set.
+        A unique pooled column walks the pool in permuted order.
+
+        Subclasses list the attributes their _source() depends on in
+        pool_options. Only those key the pool, so copies bound for other
+        runs and shards share it.
+    '''
+    pool_size = None
+    pool_seed = 0
+    pool_cache = None
+    pool_options = ()
+
+    def set_pool(self, pool_size=None, pool_seed=0, pool_cache=None):
+        '''
+            Configure pooling
+
+            @param pool_size: The number of unique values to sample from. None draws every value from Faker
+            @param pool_seed: The seed the pool is drawn with
+            @param pool_cache: Directory to cache the pool in
+        '''
+        if pool_size is not None and pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.pool_size = pool_size
+        self.pool_seed = pool_seed
+        self.pool_cache = pool_cache
+        self.__dict__.pop('_generate', None)
+
+    def _source(self, faker):
+        raise NotImplementedError
+
+    def pool(self):
+        '''
+            Get the values this generator samples from, drawing them on first use
+
+            @returns: The pool values
+        '''
+        locale = faker_locale(self.faker)
+        options = tuple((option, getattr(self, option)) for option in self.pool_options)
+        key = (type(self).__name__, options, locale, self.pool_size, self.pool_seed)
+        return load_pool(key, lambda: self._source(new_faker(locale, self.pool_seed)), self.pool_size, self.pool_cache)
+
+    def _specialize(self):
+        if self.pool_size:
+            self._generate = partial(self.rng.choice, self.pool())
+        else:
+            self._generate = self._source(self.faker)
+
+    def uses_permutation(self):
+        return bool(self.pool_size)
+
+    def _specialize_unique(self):
+        if not self.uses_permutation():
+            super()._specialize_unique()
+            return
+        pool = self.pool()
+        indices = self._permutation(len(pool))
+        self._generate = lambda: pool[next(indices)]
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.unique:
+            return self._generate_column(n)
+        if self.pool_size:
+            return handle_probability_batch(self.rng.choices(self.pool(), k=n), None, self.probability, self.rng)
+        return super().generate_batch(n)
+
+class Null(BaseType):
     '''
         @param name: The name of the column
         @param value: The possible fallback value if the column is not null. Can be another faked data type
@@ -34,12 +597,14 @@ class Null:
         self.value = value
         self.probability = probability
 
+    def _specialize(self):
+        self._generate = value_source(self.value)
+
     def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            value = self.value()[0]
-        else:
-            value = self.value
-        return (handle_probability(value, None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        return handle_probability_batch(value_batch(self.value, n), None, self.probability, self.rng)
 
     def __str__(self):
         return str(self.value)
@@ -47,22 +612,75 @@ class Null:
     def __repr__(self):
         return "Null()"
 
-class Int:
+class Int(BaseType):
     '''
         @param name: The name of the column
         @param value: The int value to be used. If not provided, a random int will be generated.
+        @param min_value: The minimum of a random int drawn for every value. Overrides value if set. Defaults to 1
+        @param max_value: The maximum of a random int drawn for every value. Overrides value if set. Defaults to 99999999
+        @param unique: Never generate the same value twice. Defaults to False
+        @param distribution: Draw from this distribution instead of uniformly, rounded and clamped to the range.
+            A Distribution or a dict such as {"type": "normal", "mean": 50, "stddev": 10}. Overrides value if set
     '''
-    def __init__(self, name, value=random.randint(1, 99999999), probability=100):
+    def __init__(self, name, value=None, probability=100, min_value=None, max_value=None, unique=False, distribution=None):
         self.name = name
         self.value = value
         self.probability = probability
+        self.min_value = min_value
+        self.max_value = max_value
+        self.unique = unique
+        self.distribution = make_distribution(distribution)
+        if value is None or min_value is not None or max_value is not None or self.distribution is not None:
+            self.min_value = 1 if min_value is None else min_value
+            self.max_value = 99999999 if max_value is None else max_value
+            if self.min_value > self.max_value:
+                raise ValueError("min_value must not be greater than max_value")
+
+    def _specialize(self):
+        if self.distribution is not None:
+            draw = self.distribution.sampler(self.rng, self.min_value, self.max_value)
+            self._generate = rounded_sampler(draw, self.min_value, self.max_value)
+        elif self.min_value is not None:
+            self._generate = partial(self.rng.randint, self.min_value, self.max_value)
+        else:
+            self._generate = value_source(self.value)
+
+    def uses_permutation(self):
+        return self.min_value is not None and self.distribution is None
+
+    def _specialize_unique(self):
+        if not self.uses_permutation():
+            super()._specialize_unique()
+            return
+        values, min_value = self._permutation(self.max_value - self.min_value + 1), self.min_value
+        self._generate = lambda: min_value + next(values)
 
     def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            value = self.value()[0]
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        if self.min_value is None or not fits_int64(self.min_value, self.max_value):
+            return None
+        if self.distribution is None:
+            return integers(np_rng, self.min_value, self.max_value, n).tolist()
+        samples = self.distribution.numpy_batch(np, np_rng, n, self.min_value, self.max_value)
+        if samples is None:
+            return None
+        return np.clip(np.rint(samples), self.min_value, self.max_value).astype(np.int64).tolist()
+
+    def generate_batch(self, n):
+        if self.unique:
+            return self._generate_column(n)
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        if self.distribution is not None:
+            return self._generate_column(n)
+        if self.min_value is not None:
+            values = randint_batch(self.rng, self.min_value, self.max_value, n)
         else:
-            value = self.value
-        return (handle_probability(value, None, self.probability), self.name)
+            values = value_batch(self.value, n)
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __str__(self):
         return str(self.value)
@@ -70,22 +688,63 @@ class Int:
     def __repr__(self):
         return "Int()"
 
-class Number:
+class Number(BaseType):
     '''
         @param name: The name of the column
         @param value: The float or int value to be used. If not provided, a random int will be generated.
+        @param unique: Never generate the same value twice. Defaults to False
+        @param distribution: Draw unrounded samples from this distribution instead of uniform ints.
+            Distributions over a range, such as zipf, use 1 to 99999999. Overrides value if set
     '''
-    def __init__(self, name, value=random.randint(1, 99999999), probability=100):
+    def __init__(self, name, value=None, probability=100, unique=False, distribution=None):
         self.name = name
         self.value = value
         self.probability = probability
+        self.unique = unique
+        self.distribution = make_distribution(distribution)
+
+    def _specialize(self):
+        if self.distribution is not None:
+            self._generate = self.distribution.sampler(self.rng, 1, 99999999)
+        elif self.value is None:
+            self._generate = partial(self.rng.randint, 1, 99999999)
+        else:
+            self._generate = value_source(self.value)
+
+    def uses_permutation(self):
+        return self.value is None and self.distribution is None
+
+    def _specialize_unique(self):
+        if not self.uses_permutation():
+            super()._specialize_unique()
+            return
+        values = self._permutation(99999999)
+        self._generate = lambda: 1 + next(values)
 
     def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            value = self.value()[0]
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        if self.distribution is not None:
+            samples = self.distribution.numpy_batch(np, np_rng, n, 1, 99999999)
+            return None if samples is None else samples.tolist()
+        if self.value is not None:
+            return None
+        return integers(np_rng, 1, 99999999, n).tolist()
+
+    def generate_batch(self, n):
+        if self.unique:
+            return self._generate_column(n)
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        if self.distribution is not None:
+            return self._generate_column(n)
+        if self.value is None:
+            values = self.rng.choices(range(1, 100000000), k=n)
         else:
-            value = self.value
-        return (handle_probability(value, None, self.probability), self.name)
+            values = value_batch(self.value, n)
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __str__(self):
         return str(self.value)
@@ -93,22 +752,45 @@ class Number:
     def __repr__(self):
         return "Number()"
 
-class Bool:
+class Bool(BaseType):
     '''
         @param name: The name of the column
         @param value: The bool value to be used. If not provided, a random bool will be generated.
+        @param fast: Draw single random bools from one random bit instead of random.choice.
+            Batches are always drawn in bulk. Defaults to False
     '''
-    def __init__(self, name, value=random.choice([True, False]), probability=100):
+    def __init__(self, name, value=None, probability=100, fast=False):
         self.name = name
         self.value = value
         self.probability = probability
+        self.fast = fast
+
+    def _specialize(self):
+        if self.value is None and self.fast:
+            getrandbits = self.rng.getrandbits
+            self._generate = lambda: getrandbits(1) == 1
+        elif self.value is None:
+            self._generate = partial(self.rng.choice, BOOLS)
+        else:
+            self._generate = value_source(self.value)
 
     def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            value = self.value()[0]
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        if self.value is not None:
+            return None
+        return (np_rng.random(n) < 0.5).tolist()
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        if self.value is None:
+            values = self.rng.choices(BOOLS, k=n)
         else:
-            value = self.value
-        return (handle_probability(value, None, self.probability), self.name)
+            values = value_batch(self.value, n)
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __str__(self):
         return str(self.value)
@@ -116,23 +798,33 @@ class Bool:
     def __repr__(self):
         return "Bool()"
 
-class Text:
+class Text(BaseType):
     '''
         @param name: The name of the column
-        @param value: The str value to be used. If not provided, an empty str will be generated.
+        @param value: The str value to be used. If not provided, a random sentence will be generated.
         @param probability: The probability of the text being empty. Defaults to 100
     '''
-    def __init__(self, name, value=fake.sentence(nb_words=10), probability=100):
+    def __init__(self, name, value=None, probability=100):
         self.name = name
         self.value = value
         self.probability = probability
 
-    def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            value = str(self.value()[0])
+    def _specialize(self):
+        if self.value is None:
+            self._generate = partial(self.faker.sentence, nb_words=10)
+        elif callable(self.value):
+            self._generate = lambda: str(self.value()[0])
         else:
-            value = str(self.value)
-        return (handle_probability(value, None, self.probability), self.name)
+            self._generate = itertools.repeat(str(self.value)).__next__
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.value is None:
+            return super().generate_batch(n)
+        values = [str(value) for value in value_batch(self.value, n)]
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __str__(self):
         return str(self.value)
@@ -140,7 +832,42 @@ class Text:
     def __repr__(self):
         return "Text()"
 
-class Date:
+class TemporalType(BaseType):
+    '''
+        Base class for the date and time types. Bounds are resolved once, when
+        the type is built, to a range of ints (days or seconds since the
+        epoch, or seconds since midnight), so values are drawn as ints and
+        only formatted at the end, with cached formatters.
+
+        Subclasses set self.low and self.high, and override _format and
+        _format_batch to turn the ints into strings.
+    '''
+    low = 0
+    high = 0
+
+    def _format(self, value):
+        return value
+
+    def _format_batch(self, values):
+        return values
+
+    def _specialize(self):
+        randint, format_value = partial(self.rng.randint, self.low, self.high), self._format
+        self._generate = lambda: format_value(randint())
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        return self._format_batch(integers(np_rng, self.low, self.high, n).tolist())
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is None:
+            values = self._format_batch(randint_batch(self.rng, self.low, self.high, n))
+        return handle_probability_batch(values, None, self.probability, self.rng)
+
+class Date(TemporalType):
     """
     Generates date values between specified start and end dates.
 
@@ -159,97 +886,78 @@ class Date:
     def __init__(self, name, start_date=None, end_date=None, probability=100):
         self.name = name
         self.probability = probability
-
-        # Set default values if None
-        start_date = start_date or "1970-01-01"
-        end_date = end_date or "now"
-
-        # Parse dates
-        self.start_date = self._parse_date(start_date)
-        self.end_date = self._parse_date(end_date)
+        self.start_date = parse_date(start_date or "1970-01-01")
+        self.end_date = parse_date(end_date or "now")
 
         # Validate date range
         if self.start_date > self.end_date:
             raise ValueError("start_date must be before end_date")
+        self.low, self.high = epoch_day(self.start_date), epoch_day(self.end_date)
 
-    def _parse_date(self, date_value):
-        """Parse various date input formats"""
-        if date_value is None:
-            return datetime.now().date()
-
-        if isinstance(date_value, datetime):
-            return date_value.date()
-
-        if isinstance(date_value, str):
-            # Handle keywords
-            if date_value.lower() in ['today', 'now']:
-                return datetime.now().date()
-
-            # Handle relative times
-            if date_value.startswith(('+', '-')):
-                return self._parse_relative_time(date_value).date()
-
-            # Try parsing different formats
-            try:
-                # Try ISO format first
-                return datetime.fromisoformat(date_value).date()
-            except ValueError:
-                pass
+    def _format(self, value):
+        return format_day(value)
 
-            try:
-                # Try date-only format
-                return datetime.strptime(date_value, '%Y-%m-%d').date()
-            except ValueError as e:
-                raise ValueError(f"Unsupported date format: {date_value}") from e
-
-        raise ValueError(f"Unsupported date type: {type(date_value)}")
-
-    def _parse_relative_time(self, relative_time):
-        """Parse relative time strings like +1d, -2d"""
-        if not relative_time[1:].isalnum():
-            raise ValueError(f"Invalid relative time format: {relative_time}")
-
-        # Get the number and unit
-        number = int(relative_time[:-1])
-        unit = relative_time[-1].lower()
-
-        if unit != 'd':
-            raise ValueError("Only days ('d') are supported for relative dates")
-
-        # Get current date as base
-        base_time = datetime.now()
-        delta = timedelta(days=number)
-
-        return base_time + delta if relative_time.startswith('+') else base_time - delta
-
-    def __call__(self, *args, **kwargs):
-        result = fake.date_between(
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
-        return (handle_probability(result.strftime('%Y-%m-%d'), None, self.probability), self.name)
+    def _format_batch(self, values):
+        return format_days(values)
 
     def __repr__(self):
         return f"Date(name='{self.name}', start_date='{self.start_date}', end_date='{self.end_date}', probability={self.probability})"
 
-class Currency:
+class Currency(BaseType):
     '''
         @param name: The name of the column
         @param symbol: The symbol of the currency. Defaults to $
         @param min_value: The minimum value of the currency. Defaults to 0
         @param max_value: The maximum value of the currency. Defaults to 1000
         @param probability: The probability of the currency being null. Defaults to 100
+        @param distribution: Draw amounts in whole currency units from this distribution, clamped to
+            [min_value, max_value] and shown to two decimals, instead of uniform whole amounts. A Distribution or a dict such as {"type": "lognormal", "mu": 3, "sigma": 1}
     '''
-    def __init__(self, name, symbol="$", min_value=0, max_value=1000, probability=100):
+    def __init__(self, name, symbol="$", min_value=0, max_value=1000, probability=100, distribution=None):
         self.name = name
         self.symbol = symbol
         self.min_value = min_value
         self.max_value = max_value
         self.probability = probability
+        self.distribution = make_distribution(distribution)
+
+    def _specialize(self):
+        low, high = self.min_value, self.max_value
+        if self.distribution is not None:
+            draw = self.distribution.sampler(self.rng, low, high)
+            self._generate = lambda: min(max(draw(), low), high)
+        else:
+            self._generate = partial(self.rng.randint, low, high)
 
     def __call__(self, *args, **kwargs):
-        value = f"{self.symbol}{random.randint(self.min_value, self.max_value):.2f}"
-        return (handle_probability(value, None, self.probability), self.name)
+        value = f"{self.symbol}{self._generate():.2f}"
+        return (handle_probability(value, None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        if not fits_int64(self.min_value, self.max_value):
+            return None
+        symbol = self.symbol
+        if self.distribution is not None:
+            samples = self.distribution.numpy_batch(np, np_rng, n, self.min_value, self.max_value)
+            if samples is None:
+                return None
+            return [f"{symbol}{amount:.2f}" for amount in np.clip(samples, self.min_value, self.max_value).tolist()]
+        # Amounts are whole numbers, so f"{amount:.2f}" always ends in .00
+        return [f"{symbol}{amount}.00" for amount in integers(np_rng, self.min_value, self.max_value, n).tolist()]
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        if self.distribution is not None:
+            if '_generate' not in self.__dict__:
+                self._prepare()
+            generate, symbol = self._generate, self.symbol
+            values = [f"{symbol}{generate():.2f}" for _ in range(n)]
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        symbol = self.symbol
+        amounts = randint_batch(self.rng, self.min_value, self.max_value, n)
+        return handle_probability_batch([f"{symbol}{amount:.2f}" for amount in amounts], None, self.probability, self.rng)
 
     def __str__(self):
         return f'Currency(name={self.name}, symbol={self.symbol}, min_value={self.min_value}, max_value={self.max_value}, probability={self.probability})'
@@ -257,22 +965,97 @@ class Currency:
     def __repr__(self):
         return "Currency()"
 
-class Enum:
+class Enum(BaseType):
     '''
+        Only the chosen choice is evaluated: a generator choice contributes its
+        value and any other callable its return value.
+
         @param name: The name of the column
         @param choices: The list of choices to be used. If not provided, an empty list will be generated.
         @param probability: The probability of the enum being null. Defaults to 100
+        @param weights: Relative weight of each choice, drawn in O(1) through an alias table. Defaults to equal weights
     '''
-    def __init__(self, name, choices: List[Any], probability=100):
+    def __init__(self, name, choices: List[Any], probability=100, weights=None):
         if not choices:
             raise ValueError("Enum must have at least one choice.")
+        if weights is not None and len(weights) != len(choices):
+            raise ValueError("Enum must have one weight per choice.")
         self.name = name
         self.choices = choices
         self.probability = probability
+        self.weights = weights
+        self.table = AliasTable(weights) if weights is not None else None
+
+    def _choice_source(self, choice):
+        if isinstance(choice, BaseType):
+            return lambda: choice()[0]
+        if callable(choice):
+            return choice
+        return itertools.repeat(choice).__next__
+
+    def _indices(self, n):
+        if self.table is not None:
+            return self.table.sample_batch(self.rng, n)
+        return self.rng.choices(range(len(self.choices)), k=n)
+
+    def _specialize(self):
+        choices = self.choices
+        if not any(callable(choice) for choice in choices):
+            if self.table is None:
+                self._generate = partial(self.rng.choice, choices)
+            else:
+                pick = self.table.sampler(self.rng)
+                self._generate = lambda: choices[pick()]
+            return
+        sources = [self._choice_source(choice) for choice in choices]
+        pick = self.table.sampler(self.rng) if self.table is not None else partial(self.rng.randrange, len(choices))
+
+        def generate():
+            # Pick a source per value, then call it
+            return sources[pick()]()
+        self._generate = generate
 
     def __call__(self, *args, **kwargs):
-        choices = [(choice() if callable(choice) else choice) for choice in self.choices]
-        return (handle_probability(random.choice(choices), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        choices = self.choices
+        if any(callable(choice) for choice in choices):
+            return None
+        if self.table is not None:
+            indices = self.table.numpy_batch(np, np_rng, n)
+        else:
+            indices = np_rng.integers(0, len(choices), size=n)
+        return [choices[index] for index in indices.tolist()]
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        choices = self.choices
+        if not any(callable(choice) for choice in choices):
+            if self.table is None:
+                values = self.rng.choices(choices, k=n)
+            else:
+                values = [choices[index] for index in self.table.sample_batch(self.rng, n)]
+            return handle_probability_batch(values, None, self.probability, self.rng)
+
+        # Group the rows by choice, so each generator fills all of its rows with one batch
+        rows_by_choice = {}
+        for row, index in enumerate(self._indices(n)):
+            rows_by_choice.setdefault(index, []).append(row)
+        values = [None] * n
+        for index, rows in rows_by_choice.items():
+            choice = choices[index]
+            if isinstance(choice, BaseType):
+                column = choice.generate_batch(len(rows))
+            elif callable(choice):
+                column = [choice() for _ in rows]
+            else:
+                column = itertools.repeat(choice)
+            for row, value in zip(rows, column):
+                values[row] = value
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __str__(self):
         return f'Enum(name={self.name}, choices={self.choices}, probability={self.probability})'
@@ -280,23 +1063,30 @@ class Enum:
     def __repr__(self):
         return "Enum()"
 
-class ID:
+class ID(BaseType):
     '''
         @param name: The name of the column
         @param prefix: The prefix of the id. Defaults to an empty str
         @param probability: The probability of the id being null. Defaults to 100
+        @param fast: Generate the underlying UUID from the RNG instead of Faker. Defaults to False
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, prefix="", probability=100):
+    def __init__(self, name, prefix="", probability=100, fast=False, unique=False):
         self.name = name
         self.prefix = prefix
         self.probability = probability
+        self.fast = fast
+        self.unique = unique
+
+    def _specialize(self):
+        uuid4 = partial(fast_uuid4, self.rng) if self.fast else self.faker.uuid4
+        prefix = self.prefix
+        self._generate = lambda: prefix + uuid4()[len(prefix):]
 
     def __call__(self, *args, **kwargs):
-        uuid = fake.uuid4()
-        if len(self.prefix) > len(uuid):
+        if len(self.prefix) > 36:
             raise ValueError('Prefix cannot be longer than the id')
-        id_value = self.prefix + uuid[len(self.prefix):]
-        return (handle_probability(id_value, None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'ID(name={self.name}, prefix={self.prefix}, probability={self.probability})'
@@ -304,17 +1094,23 @@ class ID:
     def __repr__(self):
         return "ID()"
 
-class Name:
+class Name(PooledType):
     '''
         @param name: The name of the column
         @param probability: The probability of the name being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.name(), None, self.probability), self.name)
+    def _source(self, faker):
+        return faker.name
 
     def __str__(self):
         return f'Name(name={self.name}, probability={self.probability})'
@@ -322,17 +1118,23 @@ class Name:
     def __repr__(self):
         return "Name()"
 
-class Address:
+class Address(PooledType):
     '''
         @param name: The name of the column
         @param probability: The probability of the address being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.address(), None, self.probability), self.name)
+    def _source(self, faker):
+        return faker.address
 
     def __str__(self):
         return f'Address(name={self.name}, probability={self.probability})'
@@ -340,35 +1142,35 @@ class Address:
     def __repr__(self):
         return "Address()"
 
-class Email:
+class Email(PooledType):
     '''
         @param name: The name of the column
         @param email_type: The type of the email. Defaults to random
         @param domain: The domain of the email. Defaults to None
         @param probability: The probability of the email being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, email_type="random", domain=None, probability=100):
+    pool_options = ('email_type', 'domain')
+
+    def __init__(self, name, email_type="random", domain=None, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.email_type = email_type.lower()
         self.domain = domain
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
         if self.email_type not in ("random", "safe", "free", "company", "specific"):
             raise ValueError("Invalid email type. Must be one of: random, safe, free, company, specific")
         if self.email_type == "specific" and self.domain is None:
             raise ValueError("Domain must be specified when email_type is 'specific'")
 
-    def __call__(self, *args, **kwargs):
-        if self.email_type == "random":
-            email = fake.email()
-        elif self.email_type == "safe":
-            email = fake.safe_email()
-        elif self.email_type == "free":
-            email = fake.free_email()
-        elif self.email_type == "company":
-            email = fake.company_email()
-        else:  # specific
-            email = fake.email(domain=self.domain)
-        return (handle_probability(email, None, self.probability), self.name)
+    def _source(self, faker):
+        if self.email_type == "specific":
+            return partial(faker.email, domain=self.domain)
+        return getattr(faker, EMAIL_METHODS[self.email_type])
 
     def __str__(self):
         return f'Email(name={self.name}, email_type={self.email_type}, domain={self.domain}, probability={self.probability})'
@@ -376,7 +1178,7 @@ class Email:
     def __repr__(self):
         return "Email()"
 
-class Phone:
+class Phone(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the phone being null. Defaults to 100
@@ -388,12 +1190,12 @@ class Phone:
         self.locale = locale
         if self.locale:
             try:
-                Faker(self.locale)
+                new_faker(self.locale)
             except AttributeError as e:
                 raise ValueError(f"Invalid locale: {self.locale}") from e
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.phone_number(), None, self.probability), self.name)
+        return (handle_probability(self.faker.phone_number(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'Phone(name={self.name}, probability={self.probability}, locale={self.locale})'
@@ -401,7 +1203,7 @@ class Phone:
     def __repr__(self):
         return "Phone()"
 
-class Website:
+class Website(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the website being null. Defaults to 100
@@ -411,7 +1213,7 @@ class Website:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.url(), None, self.probability), self.name)
+        return (handle_probability(self.faker.url(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'Website(name={self.name}, probability={self.probability})'
@@ -419,7 +1221,7 @@ class Website:
     def __repr__(self):
         return "Website()"
 
-class DomainName:
+class DomainName(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the domain name being null. Defaults to 100
@@ -429,7 +1231,7 @@ class DomainName:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.domain_name(), None, self.probability), self.name)
+        return (handle_probability(self.faker.domain_name(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'DomainName(name={self.name}, probability={self.probability})'
@@ -437,7 +1239,7 @@ class DomainName:
     def __repr__(self):
         return "DomainName()"
 
-class DomainWord:
+class DomainWord(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the domain word being null. Defaults to 100
@@ -447,7 +1249,7 @@ class DomainWord:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.domain_word(), None, self.probability), self.name)
+        return (handle_probability(self.faker.domain_word(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'DomainWord(name={self.name}, probability={self.probability})'
@@ -455,17 +1257,25 @@ class DomainWord:
     def __repr__(self):
         return "DomainWord()"
 
-class TLD:
+class TLD(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the TLD being null. Defaults to 100
+        @param fast: Pick from Faker's default TLDs with the RNG, ignoring the locale. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, fast=False):
         self.name = name
         self.probability = probability
+        self.fast = fast
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.tld(), None, self.probability), self.name)
+        tld = self.rng.choice(TLDS) if self.fast else self.faker.tld()
+        return (handle_probability(tld, None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.fast:
+            return handle_probability_batch(self.rng.choices(TLDS, k=n), None, self.probability, self.rng)
+        return super().generate_batch(n)
 
     def __str__(self):
         return f'TLD(name={self.name}, probability={self.probability})'
@@ -473,7 +1283,7 @@ class TLD:
     def __repr__(self):
         return "TLD()"
 
-class Country:
+class Country(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the country being null. Defaults to 100
@@ -483,7 +1293,7 @@ class Country:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.country(), None, self.probability), self.name)
+        return (handle_probability(self.faker.country(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'Country(name={self.name}, probability={self.probability})'
@@ -491,7 +1301,7 @@ class Country:
     def __repr__(self):
         return "Country()"
 
-class State:
+class State(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the state being null. Defaults to 100
@@ -502,9 +1312,11 @@ class State:
         self.probability = probability
         self.state_abbr = state_abbr
 
+    def _specialize(self):
+        self._generate = self.faker.state_abbr if self.state_abbr else self.faker.state
+
     def __call__(self, *args, **kwargs):
-        state = fake.state_abbr() if self.state_abbr else fake.state()
-        return (handle_probability(state, None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'State(name={self.name}, probability={self.probability}, state_abbr={self.state_abbr})'
@@ -512,7 +1324,7 @@ class State:
     def __repr__(self):
         return "State()"
 
-class City:
+class City(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the city being null. Defaults to 100
@@ -522,7 +1334,7 @@ class City:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.city(), None, self.probability), self.name)
+        return (handle_probability(self.faker.city(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'City(name={self.name}, probability={self.probability})'
@@ -530,7 +1342,7 @@ class City:
     def __repr__(self):
         return "City()"
 
-class Zip:
+class Zip(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the zip code being null. Defaults to 100
@@ -540,7 +1352,7 @@ class Zip:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.postcode(), None, self.probability), self.name)
+        return (handle_probability(self.faker.postcode(), None, self.probability, self.rng), self.name)
 
     def __str__(self):
         return f'Zip(name={self.name}, probability={self.probability})'
@@ -548,7 +1360,7 @@ class Zip:
     def __repr__(self):
         return "Zip()"
 
-class Datetime:
+class Datetime(TemporalType):
     """
         Generates datetime values between specified start and end dates/times.
 
@@ -568,91 +1380,19 @@ class Datetime:
     def __init__(self, name, start_date=None, end_date=None, probability=100):
         self.name = name
         self.probability = probability
-
-        # Set default values if None
-        start_date = start_date or "1970-01-01"
-        end_date = end_date or "now"
-
-        # Parse dates
-        self.start_date = self._parse_datetime(start_date)
-        self.end_date = self._parse_datetime(end_date)
+        self.start_date = parse_datetime(start_date or "1970-01-01")
+        self.end_date = parse_datetime(end_date or "now")
 
         # Validate date range
         if self.start_date > self.end_date:
             raise ValueError("start_date must be before end_date")
+        self.low, self.high = int_bounds(epoch_seconds(self.start_date), epoch_seconds(self.end_date))
 
-    def _parse_datetime(self, dt_value):
-        """Parse various datetime input formats"""
-        if dt_value is None:
-            return datetime.now()
-
-        if isinstance(dt_value, datetime):
-            return dt_value
-
-        if isinstance(dt_value, str):
-            # Handle keywords
-            if dt_value.lower() in ['today', 'now']:
-                return datetime.now()
+    def _format(self, value):
+        return format_datetime(value)
 
-            # Handle relative times
-            if dt_value.startswith(('+', '-')):
-                return self._parse_relative_time(dt_value)
-            # Try parsing different formats
-            try:
-                # Try ISO format first
-                return datetime.fromisoformat(dt_value)
-            except ValueError:
-                pass
-            try:
-                # Try date-only format
-                return datetime.strptime(dt_value, '%Y-%m-%d')
-            except ValueError:
-                pass
-            try:
-                # Try with seconds
-                return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                pass
-            try:
-                # Try without seconds
-                return datetime.strptime(dt_value, '%Y-%m-%d %H:%M')
-            except ValueError as e:
-                raise ValueError(f"Unsupported datetime format: {dt_value}") from e
-
-        raise ValueError(f"Unsupported datetime type: {type(dt_value)}")
-
-    def _parse_relative_time(self, relative_time):
-        """Parse relative time strings like +1d, -2h, etc."""
-        if not relative_time[1:].isalnum():
-            raise ValueError(f"Invalid relative time format: {relative_time}")
-
-        # Get the number and unit
-        number = int(relative_time[:-1])
-        unit = relative_time[-1].lower()
-
-        # Get current time as base
-        base_time = datetime.now()
-
-        # Calculate delta based on unit
-        if unit == 'd':
-            delta = timedelta(days=number)
-        elif unit == 'h':
-            delta = timedelta(hours=number)
-        elif unit == 'm':
-            delta = timedelta(minutes=number)
-        elif unit == 's':
-            delta = timedelta(seconds=number)
-        else:
-            raise ValueError(f"Unsupported time unit: {unit}")
-
-        return base_time + delta if relative_time.startswith('+') else base_time - delta
-
-    def __call__(self, *args, **kwargs):
-        result = fake.date_time_between(
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
-        return (handle_probability(result.strftime('%Y-%m-%d %H:%M:%S'), None, self.probability), self.name)
+    def _format_batch(self, values):
+        return format_datetimes(values)
 
     def __str__(self):
         return f'Datetime(name={self.name}, start_date={self.start_date}, end_date={self.end_date}, probability={self.probability})'
@@ -660,8 +1400,7 @@ class Datetime:
     def __repr__(self):
         return f"Datetime(name='{self.name}', start_date='{self.start_date}', end_date='{self.end_date}', probability={self.probability})"
 
-
-class Time:
+class Time(TemporalType):
     """
         Generates time values between specified start and end times.
 
@@ -680,86 +1419,19 @@ class Time:
     def __init__(self, name, start_time=None, end_time=None, probability=100):
         self.name = name
         self.probability = probability
-
-        # Set default values if None
-        start_time = start_time or "00:00:00"
-        end_time = end_time or "23:59:59"
-
-        # Parse times
-        self.start_time = self._parse_time(start_time)
-        self.end_time = self._parse_time(end_time)
+        self.start_time = parse_time(start_time or "00:00:00")
+        self.end_time = parse_time(end_time or "23:59:59")
 
         # Validate time range
         if self.start_time > self.end_time:
             raise ValueError("start_time must be before end_time")
+        self.low, self.high = int_bounds(time_seconds(self.start_time), time_seconds(self.end_time))
 
-    def _parse_time(self, time_value):
-        """Parse various time input formats"""
-        if time_value is None:
-            return datetime.now().time()
-
-        if isinstance(time_value, datetime):
-            return time_value.time()
-
-        if isinstance(time_value, str):
-            # Handle keywords
-            if time_value.lower() == 'now':
-                return datetime.now().time()
-
-            # Handle relative times
-            if time_value.startswith(('+', '-')):
-                return self._parse_relative_time(time_value).time()
-
-            # Try parsing different formats
-            try:
-                # Try with seconds
-                return datetime.strptime(time_value, '%H:%M:%S').time()
-            except ValueError:
-                pass
-            try:
-                # Try without seconds
-                return datetime.strptime(time_value, '%H:%M').time()
-            except ValueError as e:
-                raise ValueError(f"Unsupported time format: {time_value}") from e
-
-        raise ValueError(f"Unsupported time type: {type(time_value)}")
+    def _format(self, value):
+        return format_time_of_day(value)
 
-    def _parse_relative_time(self, relative_time):
-        """Parse relative time strings like +1h, -2h"""
-        if not relative_time[1:].isalnum():
-            raise ValueError(f"Invalid relative time format: {relative_time}")
-
-        # Get the number and unit
-        number = int(relative_time[:-1])
-        unit = relative_time[-1].lower()
-
-        if unit not in ['h', 'm', 's']:
-            raise ValueError("Only hours ('h'), minutes ('m'), or seconds ('s') are supported for relative times")
-
-        # Get current time as base
-        base_time = datetime.now()
-
-        # Calculate delta based on unit
-        if unit == 'h':
-            delta = timedelta(hours=number)
-        elif unit == 'm':
-            delta = timedelta(minutes=number)
-        else:  # seconds
-            delta = timedelta(seconds=number)
-
-        return base_time + delta if relative_time.startswith('+') else base_time - delta
-
-    def __call__(self, *args, **kwargs):
-        # Generate a datetime between today's start_time and end_time
-        today = datetime.now().date()
-        start_dt = datetime.combine(today, self.start_time)
-        end_dt = datetime.combine(today, self.end_time)
-
-        result = fake.date_time_between(
-            start_date=start_dt,
-            end_date=end_dt
-        )
-        return (handle_probability(result.strftime('%H:%M:%S'), None, self.probability), self.name)
+    def _format_batch(self, values):
+        return format_times_of_day(values)
 
     def __repr__(self):
         return f"Time(name='{self.name}', start_time='{self.start_time}', end_time='{self.end_time}', probability={self.probability})"
@@ -767,7 +1439,7 @@ class Time:
     def __str__(self):
         return f'Time(name={self.name}, probability={self.probability})'
 
-class Timestamp:
+class Timestamp(TemporalType):
     """
         Generates Unix timestamp values between specified start and end dates/times.
 
@@ -787,26 +1459,13 @@ class Timestamp:
     def __init__(self, name, start_date=None, end_date=None, probability=100):
         self.name = name
         self.probability = probability
-
-        # Set default values if None
-        start_date = start_date or "1970-01-01"
-        end_date = end_date or "now"
-
-        # Parse dates using Datetime's parser
-        datetime_parser = Datetime(name)
-        self.start_date = datetime_parser._parse_datetime(start_date)
-        self.end_date = datetime_parser._parse_datetime(end_date)
+        self.start_date = parse_datetime(start_date or "1970-01-01")
+        self.end_date = parse_datetime(end_date or "now")
 
         # Validate date range
         if self.start_date > self.end_date:
             raise ValueError("start_date must be before end_date")
-
-    def __call__(self, *args, **kwargs):
-        result = fake.date_time_between(
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
-        return (handle_probability(int(result.timestamp()), None, self.probability), self.name)
+        self.low, self.high = int(self.start_date.timestamp()), int(self.end_date.timestamp())
 
     def __repr__(self):
         return f"Timestamp(name='{self.name}', start_date='{self.start_date}', end_date='{self.end_date}', probability={self.probability})"
@@ -814,7 +1473,7 @@ class Timestamp:
     def __str__(self):
         return f'Timestamp(name={self.name}, probability={self.probability})'
 
-class TimeZone:
+class TimeZone(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the timezone being null. Defaults to 100
@@ -824,7 +1483,7 @@ class TimeZone:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.timezone(), None, self.probability), self.name)
+        return (handle_probability(self.faker.timezone(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"TimeZone(name='{self.name}', probability={self.probability})"
@@ -832,17 +1491,30 @@ class TimeZone:
     def __str__(self):
         return f'TimeZone(name={self.name}, probability={self.probability})'
 
-class DayOfWeek:
+class DayOfWeek(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the day of week being null. Defaults to 100
+        @param fast: Always use English day names instead of the Faker locale's. Defaults to False
+
+        Days are picked from self.rng either way, so seeded runs are reproducible.
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, fast=False):
         self.name = name
         self.probability = probability
+        self.fast = fast
+
+    def _names(self):
+        return DAYS_OF_WEEK if self.fast else day_names(self.faker)
+
+    def _specialize(self):
+        self._generate = partial(self.rng.choice, self._names())
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.day_of_week(), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        return handle_probability_batch(self.rng.choices(self._names(), k=n), None, self.probability, self.rng)
 
     def __repr__(self):
         return f"DayOfWeek(name='{self.name}', probability={self.probability})"
@@ -850,17 +1522,38 @@ class DayOfWeek:
     def __str__(self):
         return f'DayOfWeek(name={self.name}, probability={self.probability})'
 
-class UUID:
+class UUID(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the UUID being null. Defaults to 100
+        @param fast: Generate the UUID from the RNG instead of Faker. Defaults to False
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, fast=False, unique=False):
         self.name = name
         self.probability = probability
+        self.fast = fast
+        self.unique = unique
+
+    def _specialize(self):
+        # Default to v4
+        self._generate = partial(fast_uuid4, self.rng) if self.fast else self.faker.uuid4
+
+    def uses_permutation(self):
+        return True
+
+    def _specialize_unique(self):
+        # Every version 4 UUID has 122 random bits, walked in permuted order
+        values = self._permutation(1 << 122)
+        self._generate = lambda: format_uuid(uuid4_from_bits(next(values)))
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.uuid4(), None, self.probability), self.name)  # Default to v4
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.fast or self.unique:
+            return self._generate_column(n)
+        return super().generate_batch(n)
 
     def __repr__(self):
         return f"UUID(name='{self.name}', probability={self.probability})"
@@ -868,7 +1561,7 @@ class UUID:
     def __str__(self):
         return f'UUID(name={self.name}, probability={self.probability})'
 
-class Color:
+class Color(BaseType):
     '''
         @param name: The name of the column
         @param color_type: The type of color to generate. Defaults to "name"
@@ -879,14 +1572,12 @@ class Color:
         self.color_type = color_type.lower()
         self.probability = probability
 
+    def _specialize(self):
+        # Default to color name
+        self._generate = getattr(self.faker, COLOR_METHODS.get(self.color_type, 'color_name'))
+
     def __call__(self, *args, **kwargs):
-        if self.color_type == "name":
-            return (handle_probability(fake.color_name(), None, self.probability), self.name)
-        if self.color_type == "hex":
-            return (handle_probability(fake.hex_color(), None, self.probability), self.name)
-        if self.color_type == "rgb":
-            return (handle_probability(fake.rgb_color(), None, self.probability), self.name)
-        return (handle_probability(fake.color_name(), None, self.probability), self.name)  # Default to color name
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"Color(name='{self.name}', color_type='{self.color_type}', probability={self.probability})"
@@ -894,17 +1585,23 @@ class Color:
     def __str__(self):
         return f'Color(name={self.name}, color_type={self.color_type}, probability={self.probability})'
 
-class JobTitle:
+class JobTitle(PooledType):
     '''
         @param name: The name of the column
         @param probability: The probability of the job title being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.job(), None, self.probability), self.name)
+    def _source(self, faker):
+        return faker.job
 
     def __repr__(self):
         return f"JobTitle(name='{self.name}', probability={self.probability})"
@@ -912,7 +1609,7 @@ class JobTitle:
     def __str__(self):
         return f'JobTitle(name={self.name}, probability={self.probability})'
 
-class CompanyDepartment:
+class CompanyDepartment(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the company department being null. Defaults to 100
@@ -922,7 +1619,7 @@ class CompanyDepartment:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.job(), None, self.probability), self.name)
+        return (handle_probability(self.faker.job(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"CompanyDepartment(name='{self.name}', probability={self.probability})"
@@ -930,7 +1627,7 @@ class CompanyDepartment:
     def __str__(self):
         return f'CompanyDepartment(name={self.name}, probability={self.probability})'
 
-class FileExtension:
+class FileExtension(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the file extension being null. Defaults to 100
@@ -940,7 +1637,7 @@ class FileExtension:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.file_extension(), None, self.probability), self.name)
+        return (handle_probability(self.faker.file_extension(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"FileExtension(name='{self.name}', probability={self.probability})"
@@ -948,7 +1645,7 @@ class FileExtension:
     def __str__(self):
         return f'FileExtension(name={self.name}, probability={self.probability})'
 
-class SocialMediaHandle:
+class SocialMediaHandle(BaseType):
     '''
         @param name: The name of the column
         @param platform: The platform of the social media handle. Defaults to None
@@ -959,16 +1656,14 @@ class SocialMediaHandle:
         self.platform = platform
         self.probability = probability
 
+    def _specialize(self):
+        # Default to Twitter-like handle
+        prefix = SOCIAL_MEDIA_PREFIXES.get(self.platform.lower(), "") if self.platform else "@"
+        user_name = self.faker.user_name
+        self._generate = lambda: prefix + user_name()
+
     def __call__(self, *args, **kwargs):
-        if self.platform:
-            if self.platform.lower() == "twitter":
-                return (handle_probability(f"@{fake.user_name()}", None, self.probability), self.name)
-            if self.platform.lower() == "instagram":
-                return (handle_probability(f"instagram_{fake.user_name()}", None, self.probability), self.name)
-            if self.platform.lower() == "facebook":
-                return (handle_probability(f"{fake.user_name()}", None, self.probability), self.name)
-            return (handle_probability(f"{fake.user_name()}", None, self.probability), self.name)
-        return (handle_probability(f"@{fake.user_name()}", None, self.probability), self.name)  # Default to Twitter-like handle
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"SocialMediaHandle(name='{self.name}', platform='{self.platform}', probability={self.probability})"
@@ -976,23 +1671,36 @@ class SocialMediaHandle:
     def __str__(self):
         return f'SocialMediaHandle(name={self.name}, platform={self.platform}, probability={self.probability})'
 
-class IPAddress:
+class IPAddress(BaseType):
     '''
         @param name: The name of the column
         @param version: The version of the IP address. Defaults to "ipv4"
         @param probability: The probability of the IP address being null. Defaults to 100
+        @param fast: Draw the address from the RNG instead of Faker. Any address may be drawn,
+            including private and reserved ones. Defaults to False
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, version="ipv4", probability=100):
+    def __init__(self, name, version="ipv4", probability=100, fast=False, unique=False):
         self.name = name
         self.version = version.lower()
         self.probability = probability
+        self.fast = fast
+        self.unique = unique
+
+    def _specialize(self):
+        # Default to IPv4
+        if self.fast:
+            self._generate = partial(fast_ipv6 if self.version == "ipv6" else fast_ipv4, self.rng)
+        else:
+            self._generate = self.faker.ipv6 if self.version == "ipv6" else self.faker.ipv4
 
     def __call__(self, *args, **kwargs):
-        if self.version == "ipv4":
-            return (handle_probability(fake.ipv4(), None, self.probability), self.name)
-        if self.version == "ipv6":
-            return (handle_probability(fake.ipv6(), None, self.probability), self.name)
-        return (handle_probability(fake.ipv4(), None, self.probability), self.name)  # Default to IPv4
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.fast or self.unique:
+            return self._generate_column(n)
+        return super().generate_batch(n)
 
     def __repr__(self):
         return f"IPAddress(name='{self.name}', version='{self.version}', probability={self.probability})"
@@ -1000,7 +1708,7 @@ class IPAddress:
     def __str__(self):
         return f'IPAddress(name={self.name}, version={self.version}, probability={self.probability})'
 
-class LatitudeLongitude:
+class LatitudeLongitude(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the latitude and longitude being null. Defaults to 100
@@ -1010,7 +1718,18 @@ class LatitudeLongitude:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(f'{fake.latitude()}, {fake.longitude()}', None, self.probability), self.name)
+        return (handle_probability(f'{self.faker.latitude()}, {self.faker.longitude()}', None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        latitudes = np_rng.uniform(-90, 90, n).tolist()
+        longitudes = np_rng.uniform(-180, 180, n).tolist()
+        return [f'{latitude:.6f}, {longitude:.6f}' for latitude, longitude in zip(latitudes, longitudes)]
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        return super().generate_batch(n)
 
     def __repr__(self):
         return f"LatitudeLongitude(name='{self.name}', probability={self.probability})"
@@ -1018,7 +1737,7 @@ class LatitudeLongitude:
     def __str__(self):
         return f'LatitudeLongitude(name={self.name}, probability={self.probability})'
 
-class Version:
+class Version(BaseType):
     '''
         @param name: The name of the column
         @param major_min: The minimum major version. Defaults to 0
@@ -1040,10 +1759,26 @@ class Version:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        major = random.randint(self.major_min, self.major_max)
-        minor = random.randint(self.minor_min, self.minor_max)
-        patch = random.randint(self.patch_min, self.patch_max)
-        return (handle_probability(f"{major}.{minor}.{patch}", None, self.probability), self.name)
+        major = self.rng.randint(self.major_min, self.major_max)
+        minor = self.rng.randint(self.minor_min, self.minor_max)
+        patch = self.rng.randint(self.patch_min, self.patch_max)
+        return (handle_probability(f"{major}.{minor}.{patch}", None, self.probability, self.rng), self.name)
+
+    def _numpy_batch(self, np, np_rng, n):
+        majors = integers(np_rng, self.major_min, self.major_max, n).tolist()
+        minors = integers(np_rng, self.minor_min, self.minor_max, n).tolist()
+        patches = integers(np_rng, self.patch_min, self.patch_max, n).tolist()
+        return [f"{major}.{minor}.{patch}" for major, minor, patch in zip(majors, minors, patches)]
+
+    def generate_batch(self, n):
+        values = self._vectorized_batch(n)
+        if values is not None:
+            return handle_probability_batch(values, None, self.probability, self.rng)
+        majors = randint_batch(self.rng, self.major_min, self.major_max, n)
+        minors = randint_batch(self.rng, self.minor_min, self.minor_max, n)
+        patches = randint_batch(self.rng, self.patch_min, self.patch_max, n)
+        values = [f"{major}.{minor}.{patch}" for major, minor, patch in zip(majors, minors, patches)]
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __repr__(self):
         return f"Version(name='{self.name}', probability={self.probability})"
@@ -1051,7 +1786,7 @@ class Version:
     def __str__(self):
         return f'Version(name={self.name}, probability={self.probability})'
 
-class URL:
+class URL(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the URL being null. Defaults to 100
@@ -1061,7 +1796,7 @@ class URL:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.url(), None, self.probability), self.name)
+        return (handle_probability(self.faker.url(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"URL(name='{self.name}', probability={self.probability})"
@@ -1069,21 +1804,29 @@ class URL:
     def __str__(self):
         return f'URL(name={self.name}, probability={self.probability})'
 
-class Sentence:
+class Sentence(PooledType):
     '''
         @param name: The name of the column
         @param nb_words: The number of words in the sentence. Defaults to 6
         @param variable_nb_words: The number of words in the sentence. Defaults to 6
         @param probability: The probability of the sentence being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, nb_words=6, variable_nb_words=6, probability=100):
+    pool_options = ('nb_words', 'variable_nb_words')
+
+    def __init__(self, name, nb_words=6, variable_nb_words=6, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.nb_words = nb_words
         self.variable_nb_words = variable_nb_words
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.sentence(nb_words=self.nb_words, variable_nb_words=self.variable_nb_words), None, self.probability), self.name)
+    def _source(self, faker):
+        return partial(faker.sentence, nb_words=self.nb_words, variable_nb_words=self.variable_nb_words)
 
     def __repr__(self):
         return f"Sentence(name='{self.name}', nb_words={self.nb_words}, variable_nb_words={self.variable_nb_words}, probability={self.probability})"
@@ -1091,7 +1834,7 @@ class Sentence:
     def __str__(self):
         return f'Sentence(name={self.name}, probability={self.probability})'
 
-class Paragraph:
+class Paragraph(PooledType):
     '''
         @param name: The name of the column
         @param nb_sentences: The number of sentences in the paragraph. Defaults to 3
@@ -1099,15 +1842,23 @@ class Paragraph:
         @param nb_words: The number of words in the paragraph. Defaults to 6
         @param variable_nb_words: The number of words in the paragraph. Defaults to 6
         @param probability: The probability of the paragraph being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, nb_sentences=3, variable_nb_sentences=3, probability=100):
+    pool_options = ('nb_sentences', 'variable_nb_sentences')
+
+    def __init__(self, name, nb_sentences=3, variable_nb_sentences=3, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.nb_sentences = nb_sentences
         self.variable_nb_sentences = variable_nb_sentences
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.paragraph(nb_sentences=self.nb_sentences, variable_nb_sentences=self.variable_nb_sentences), None, self.probability), self.name)
+    def _source(self, faker):
+        return partial(faker.paragraph, nb_sentences=self.nb_sentences, variable_nb_sentences=self.variable_nb_sentences)
 
     def __repr__(self):
         return f"Paragraph(name='{self.name}', nb_sentences={self.nb_sentences}, variable_nb_sentences={self.variable_nb_sentences}, probability={self.probability})"
@@ -1115,17 +1866,23 @@ class Paragraph:
     def __str__(self):
         return f'Paragraph(name={self.name}, probability={self.probability})'
 
-class UserAgent:
+class UserAgent(PooledType):
     '''
         @param name: The name of the column
         @param probability: The probability of the user agent being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
+        @param pool_size: Sample from this many unique values drawn once, instead of calling Faker per value. Defaults to None
+        @param pool_seed: The seed the pool is drawn with. Defaults to 0
+        @param pool_cache: Directory to cache the pool in. Defaults to None
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False, pool_size=None, pool_seed=0, pool_cache=None):
         self.name = name
         self.probability = probability
+        self.unique = unique
+        self.set_pool(pool_size, pool_seed, pool_cache)
 
-    def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.user_agent(), None, self.probability), self.name)
+    def _source(self, faker):
+        return faker.user_agent
 
     def __repr__(self):
         return f"UserAgent(name='{self.name}', probability={self.probability})"
@@ -1133,25 +1890,36 @@ class UserAgent:
     def __str__(self):
         return f'UserAgent(name={self.name}, probability={self.probability})'
 
-class Hash:
+class Hash(BaseType):
     '''
         @param name: The name of the column
         @param hash_type: The type of hash to generate. Defaults to "sha256"
         @param probability: The probability of the hash being null. Defaults to 100
+        @param fast: Generate random hex digits of the digest length instead of hashing through Faker. Defaults to False
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, hash_type="sha256", probability=100):
+    def __init__(self, name, hash_type="sha256", probability=100, fast=False, unique=False):
         self.name = name
         self.hash_type = hash_type.lower()
         self.probability = probability
+        self.fast = fast
+        self.unique = unique
+
+    def _specialize(self):
+        # Default to SHA256
+        hash_type = self.hash_type if self.hash_type in HASH_TYPES else "sha256"
+        if self.fast:
+            self._generate = partial(fast_hex, self.rng, HASH_LENGTHS[hash_type])
+        else:
+            self._generate = getattr(self.faker, hash_type)
 
     def __call__(self, *args, **kwargs):
-        if self.hash_type == "md5":
-            return (handle_probability(fake.md5(), None, self.probability), self.name)
-        if self.hash_type == "sha1":
-            return (handle_probability(fake.sha1(), None, self.probability), self.name)
-        if self.hash_type == "sha256":
-            return (handle_probability(fake.sha256(), None, self.probability), self.name)
-        return (handle_probability(fake.sha256(), None, self.probability), self.name)  # Default to SHA256
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.fast or self.unique:
+            return self._generate_column(n)
+        return super().generate_batch(n)
 
     def __repr__(self):
         return f"Hash(name='{self.name}', hash_type='{self.hash_type}', probability={self.probability})"
@@ -1159,17 +1927,22 @@ class Hash:
     def __str__(self):
         return f'Hash(name={self.name}, hash_type={self.hash_type}, probability={self.probability})'
 
-class ISBN:
+class ISBN(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the ISBN being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False):
         self.name = name
         self.probability = probability
+        self.unique = unique
+
+    def _specialize(self):
+        self._generate = self.faker.isbn10
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.isbn10(), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"ISBN(name='{self.name}', probability={self.probability})"
@@ -1177,17 +1950,22 @@ class ISBN:
     def __str__(self):
         return f'ISBN(name={self.name}, probability={self.probability})'
 
-class ISBN13:
+class ISBN13(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the ISBN13 being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False):
         self.name = name
         self.probability = probability
+        self.unique = unique
+
+    def _specialize(self):
+        self._generate = self.faker.isbn13
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.isbn13(), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"ISBN13(name='{self.name}', probability={self.probability})"
@@ -1195,17 +1973,22 @@ class ISBN13:
     def __str__(self):
         return f'ISBN13(name={self.name}, probability={self.probability})'
 
-class EAN:
+class EAN(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the EAN being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, unique=False):
         self.name = name
         self.probability = probability
+        self.unique = unique
+
+    def _specialize(self):
+        self._generate = self.faker.ean
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.ean(), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"EAN(name='{self.name}', probability={self.probability})"
@@ -1213,21 +1996,43 @@ class EAN:
     def __str__(self):
         return f'EAN(name={self.name}, probability={self.probability})'
 
-class SKU:
+class SKU(BaseType):
     '''
         @param name: The name of the column
         @param prefix: The prefix of the SKU. Defaults to ""
         @param length: The length of the SKU. Defaults to 8
         @param probability: The probability of the SKU being null. Defaults to 100
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, prefix="", length=8, probability=100):
+    def __init__(self, name, prefix="", length=8, probability=100, unique=False):
         self.name = name
         self.prefix = prefix
         self.length = length
         self.probability = probability
+        self.unique = unique
+
+    def _specialize(self):
+        prefix, length, choices = self.prefix, self.length, self.rng.choices
+        self._generate = lambda: prefix + ''.join(choices(SKU_ALPHABET, k=length))
+
+    def uses_permutation(self):
+        return True
+
+    def _specialize_unique(self):
+        prefix, length = self.prefix, self.length
+        values = self._permutation(len(SKU_ALPHABET) ** length)
+        self._generate = lambda: prefix + format_sku(next(values), length)
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(self.prefix + ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=self.length)), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.unique:
+            return self._generate_column(n)
+        prefix, length = self.prefix, self.length
+        chars = ''.join(self.rng.choices(SKU_ALPHABET, k=n * length))
+        values = [prefix + chars[i:i + length] for i in range(0, n * length, length)]
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __repr__(self):
         return f"SKU(name='{self.name}', prefix='{self.prefix}', length={self.length}, probability={self.probability})"
@@ -1235,17 +2040,43 @@ class SKU:
     def __str__(self):
         return f'SKU(name={self.name}, probability={self.probability})'
 
-class MACAddress:
+class MACAddress(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the MAC address being null. Defaults to 100
+        @param fast: Draw all six octets of a single value from one getrandbits call. Batches are
+            always drawn in bulk. Defaults to False
+        @param unique: Never generate the same value twice. Defaults to False
     '''
-    def __init__(self, name, probability=100):
+    def __init__(self, name, probability=100, fast=False, unique=False):
         self.name = name
         self.probability = probability
+        self.fast = fast
+        self.unique = unique
+
+    def _specialize(self):
+        if self.fast:
+            self._generate = partial(fast_mac, self.rng)
+        else:
+            randint = self.rng.randint
+            self._generate = lambda: ':'.join([f'{randint(0, 255)}' for _ in range(6)])
+
+    def uses_permutation(self):
+        return True
+
+    def _specialize_unique(self):
+        values = self._permutation(1 << 48)
+        self._generate = lambda: format_mac(next(values))
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(':'.join([f'{random.randint(0, 255)}' for _ in range(6)]), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if self.unique:
+            return self._generate_column(n)
+        octets = self.rng.choices(OCTETS, k=n * 6)
+        values = [':'.join(octets[i:i + 6]) for i in range(0, n * 6, 6)]
+        return handle_probability_batch(values, None, self.probability, self.rng)
 
     def __repr__(self):
         return f"MACAddress(name='{self.name}', probability={self.probability})"
@@ -1253,7 +2084,7 @@ class MACAddress:
     def __str__(self):
         return f'MACAddress(name={self.name}, probability={self.probability})'
 
-class CreditCardNumber:
+class CreditCardNumber(BaseType):
     '''
         @param name: The name of the column
         @param card_type: The type of credit card to generate. Defaults to "visa"
@@ -1264,16 +2095,14 @@ class CreditCardNumber:
         self.card_type = card_type.lower()
         self.probability = probability
 
+    def _specialize(self):
+        if self.card_type in CARD_TYPES:
+            self._generate = partial(self.faker.credit_card_number, card_type=self.card_type)
+        else:
+            self._generate = self.faker.credit_card_number
+
     def __call__(self, *args, **kwargs):
-        if self.card_type == "visa":
-            return (handle_probability(fake.credit_card_number(card_type="visa"), None, self.probability), self.name)
-        if self.card_type == "mastercard":
-            return (handle_probability(fake.credit_card_number(card_type="mastercard"), None, self.probability), self.name)
-        if self.card_type == "amex":
-            return (handle_probability(fake.credit_card_number(card_type="amex"), None, self.probability), self.name)
-        if self.card_type == "discover":
-            return (handle_probability(fake.credit_card_number(card_type="discover"), None, self.probability), self.name)
-        return (handle_probability(fake.credit_card_number(), None, self.probability), self.name)
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"CreditCardNumber(name='{self.name}', card_type='{self.card_type}', probability={self.probability})"
@@ -1281,7 +2110,7 @@ class CreditCardNumber:
     def __str__(self):
         return f'CreditCardNumber(name={self.name}, probability={self.probability})'
 
-class IBAN:
+class IBAN(BaseType):
     '''
     @param name: The name of the column
     @param country_code: The country code of the IBAN. Defaults to None
@@ -1292,11 +2121,16 @@ class IBAN:
         self.country_code = country_code
         self.probability = probability
 
-    def __call__(self, *args, **kwargs):
+    def _specialize(self):
         if self.country_code:
             # Implement country-specific IBAN generation (requires more complex logic)
-            return (handle_probability(f"{self.country_code}{fake.iban()}", None, self.probability), self.name)
-        return (handle_probability(fake.iban(), None, self.probability), self.name)
+            country_code, iban = self.country_code, self.faker.iban
+            self._generate = lambda: f"{country_code}{iban()}"
+        else:
+            self._generate = self.faker.iban
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"IBAN(name='{self.name}', probability={self.probability})"
@@ -1304,7 +2138,7 @@ class IBAN:
     def __str__(self):
         return f'IBAN(name={self.name}, probability={self.probability})'
 
-class BIC:
+class BIC(BaseType):
     '''
         @param name: The name of the column
         @param probability: The probability of the BIC being null. Defaults to 100
@@ -1314,10 +2148,220 @@ class BIC:
         self.probability = probability
 
     def __call__(self, *args, **kwargs):
-        return (handle_probability(fake.swift(), None, self.probability), self.name)
+        return (handle_probability(self.faker.swift(), None, self.probability, self.rng), self.name)
 
     def __repr__(self):
         return f"BIC(name='{self.name}', probability={self.probability})"
 
     def __str__(self):
         return f'BIC(name={self.name}, probability={self.probability})'
+
+class Sequence(BaseType):
+    '''
+        Auto-increment integers, for primary keys that append to the index
+
+        Values follow the row number, so shards generated in parallel
+        continue the sequence where the previous shard stopped.
+
+        @param name: The name of the column
+        @param start: The first value. Defaults to 1
+        @param step: The increment between rows. Defaults to 1
+        @param probability: The probability of the value being null. Nulls still use up their value. Defaults to 100
+    '''
+    def __init__(self, name, start=1, step=1, probability=100):
+        self.name = name
+        self.start = start
+        self.step = step
+        self.probability = probability
+        if step == 0:
+            raise ValueError("step must not be 0")
+        # Created by _specialize(), from the bound copy's row offset
+        self._counter = None
+
+    def _specialize(self):
+        self._counter = itertools.count(self.start + self.row_offset * self.step, self.step)
+        self._generate = self._counter.__next__
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        if '_generate' not in self.__dict__:
+            self._prepare()
+        return handle_probability_batch(list(itertools.islice(self._counter, n)), None, self.probability, self.rng)
+
+    def __repr__(self):
+        return f"Sequence(name='{self.name}', start={self.start}, step={self.step}, probability={self.probability})"
+
+    def __str__(self):
+        return f'Sequence(name={self.name}, start={self.start}, step={self.step}, probability={self.probability})'
+
+class TimeOrderedType(BaseType):
+    '''
+        Base class for IDs that sort by creation time
+
+        The row number decides each ID's timestamp and counter: every
+        millisecond from start holds ids_per_ms rows, so IDs increase with
+        the row number, also across shards generated in parallel.
+        Subclasses implement _encode(ms, counter).
+
+        @param name: The name of the column
+        @param start: The time of the first ID. Accepts the formats of Datetime. Defaults to "now"
+        @param probability: The probability of the ID being null. Defaults to 100
+    '''
+    ids_per_ms = 1
+
+    def __init__(self, name, start=None, probability=100):
+        self.name = name
+        self.probability = probability
+        # Resolved once here, so every shard and worker shares the same start
+        self.start = parse_datetime(start or "now")
+        self.start_ms = int(self.start.timestamp() * 1000)
+
+    def _encode(self, ms, counter):
+        raise NotImplementedError
+
+    def _specialize(self):
+        indices = itertools.count(self.row_offset)
+        start_ms, ids_per_ms, encode = self.start_ms, self.ids_per_ms, self._encode
+
+        def generate():
+            elapsed_ms, counter = divmod(next(indices), ids_per_ms)
+            return encode(start_ms + elapsed_ms, counter)
+        self._generate = generate
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        return self._generate_column(n)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name='{self.name}', start='{self.start}', probability={self.probability})"
+
+    def __str__(self):
+        return f'{type(self).__name__}(name={self.name}, probability={self.probability})'
+
+class UUIDv7(TimeOrderedType):
+    '''
+        Version 7 UUIDs: a millisecond timestamp, a 12-bit counter and 62 random bits
+
+        @param name: The name of the column
+        @param start: The time of the first UUID. Defaults to "now"
+        @param probability: The probability of the UUID being null. Defaults to 100
+    '''
+    ids_per_ms = 1 << 12
+
+    def _encode(self, ms, counter):
+        return format_uuid((ms << 80) | (7 << 76) | (counter << 64) | (0b10 << 62) | self.rng.getrandbits(62))
+
+class ULID(TimeOrderedType):
+    '''
+        ULIDs: a millisecond timestamp and 80 bits, of which the top 16 count up within the millisecond
+
+        @param name: The name of the column
+        @param start: The time of the first ULID. Defaults to "now"
+        @param probability: The probability of the ULID being null. Defaults to 100
+    '''
+    ids_per_ms = 1 << 16
+
+    def _encode(self, ms, counter):
+        return format_ulid((ms << 80) | (counter << 64) | self.rng.getrandbits(64))
+
+class Snowflake(TimeOrderedType):
+    '''
+        Snowflake IDs: 64-bit ints of 41 bits of milliseconds since epoch_ms, a 10-bit worker id and a 12-bit sequence
+
+        @param name: The name of the column
+        @param start: The time of the first ID. Defaults to "now"
+        @param worker_id: The worker id, 0 to 1023. Defaults to 0
+        @param epoch_ms: The epoch in Unix milliseconds. Defaults to Twitter's epoch
+        @param probability: The probability of the ID being null. Defaults to 100
+    '''
+    ids_per_ms = 1 << 12
+
+    def __init__(self, name, start=None, worker_id=0, epoch_ms=SNOWFLAKE_EPOCH_MS, probability=100):
+        super().__init__(name, start, probability)
+        self.worker_id = worker_id
+        self.epoch_ms = epoch_ms
+        if not 0 <= worker_id < 1 << 10:
+            raise ValueError("worker_id must be between 0 and 1023")
+        if self.start_ms < epoch_ms:
+            raise ValueError("start must not be before epoch_ms")
+
+    def _encode(self, ms, counter):
+        return ((ms - self.epoch_ms) << 22) | (self.worker_id << 12) | counter
+
+class EventTime(BaseType):
+    '''
+        Event times in increasing order, for ordered event streams
+
+        Times follow an arrival process at a mean rate, so rows come out
+        sorted and need no sort afterwards. Events are generated in blocks
+        seeded from the column, so memory stays constant and shards
+        generated in parallel continue the same stream.
+
+        @param name: The name of the column
+        @param start: The start of the stream. Accepts the formats of Datetime. Defaults to "now"
+        @param rate: The mean number of events per second. Defaults to 1
+        @param arrival: "poisson" for random arrivals, "regular" for evenly spaced events, or "bursty"
+            for random arrivals with bursts. Defaults to "poisson"
+        @param jitter: Scale every gap between events by a random factor in [1 - jitter, 1 + jitter]. Defaults to 0
+        @param burst_factor: How many times faster events arrive during a burst. Defaults to 10
+        @param burst_probability: The chance that a burst starts after each event outside one. Defaults to 0.01
+        @param burst_length: The mean number of events in a burst. Defaults to 50
+        @param output: "datetime" for YYYY-MM-DD HH:MM:SS strings, "timestamp" for Unix seconds or
+            "timestamp_ms" for Unix milliseconds. Defaults to "datetime"
+        @param probability: The probability of the time being null. Defaults to 100
+    '''
+    def __init__(self, name, start=None, rate=1.0, arrival='poisson', jitter=0.0, burst_factor=10.0, burst_probability=0.01,
+                 burst_length=50.0, output='datetime', probability=100):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if arrival not in ARRIVALS:
+            raise ValueError(f"arrival must be one of: {', '.join(ARRIVALS)}")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be at least 0 and below 1")
+        if burst_factor <= 0 or burst_length < 1 or not 0 <= burst_probability <= 1:
+            raise ValueError("burst_factor must be positive, burst_length at least 1 and burst_probability between 0 and 1")
+        if output not in EVENT_OUTPUTS:
+            raise ValueError(f"output must be one of: {', '.join(EVENT_OUTPUTS)}")
+        self.name = name
+        self.rate = rate
+        self.arrival = arrival
+        self.jitter = jitter
+        self.burst_factor = burst_factor
+        self.burst_probability = burst_probability
+        self.burst_length = burst_length
+        self.output = output
+        self.probability = probability
+        # Resolved once here, so every shard and worker shares the same start
+        self.start = parse_datetime(start or "now")
+
+    def _specialize(self):
+        offsets = event_offsets(
+            permutation_key(self.run_seed, self.name, self.rng), self.row_offset, self.rate,
+            arrival=self.arrival, jitter=self.jitter, burst_factor=self.burst_factor,
+            burst_probability=self.burst_probability, burst_length=self.burst_length,
+        )
+        if self.output == 'datetime':
+            start = epoch_seconds(self.start)
+            self._generate = lambda: format_datetime(math.floor(start + next(offsets)))
+        elif self.output == 'timestamp':
+            start = self.start.timestamp()
+            self._generate = lambda: math.floor(start + next(offsets))
+        else:
+            start = self.start.timestamp()
+            self._generate = lambda: math.floor((start + next(offsets)) * 1000)
+
+    def __call__(self, *args, **kwargs):
+        return (handle_probability(self._generate(), None, self.probability, self.rng), self.name)
+
+    def generate_batch(self, n):
+        return self._generate_column(n)
+
+    def __repr__(self):
+        return f"EventTime(name='{self.name}', start='{self.start}', rate={self.rate}, arrival='{self.arrival}', output='{self.output}')"
+
+    def __str__(self):
+        return f'EventTime(name={self.name}, rate={self.rate}, arrival={self.arrival}, probability={self.probability})'
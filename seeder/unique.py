@@ -0,0 +1,182 @@
+'''
+    Unique-value support: a fingerprint seen-set with retry limits, and keyed
+    permutations that produce collision-free values without any set.
+'''
+import hashlib
+import random
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# Consecutive duplicate draws after which a column's value space is taken as exhausted
+UNIQUE_MAX_RETRIES = 1000
+
+# Rounds of the Feistel network behind Permutation
+FEISTEL_ROUNDS = 4
+
+class UniqueValuesExhausted(ValueError):
+    '''
+        Raised when a unique column cannot produce another new value
+    '''
+
+class SeenSet:
+    '''
+        Remembers which values were produced, storing only a fingerprint per value
+
+        Fingerprints are the values' hash(), kept as machine-sized ints rather
+        than the values themselves. A fingerprint collision only makes a new
+        value count as seen, so it costs a retry but never lets a duplicate through.
+    '''
+    def __init__(self):
+        self._fingerprints = set()
+        # Fingerprints added since the last drain(), once track() is called
+        self._added: Optional[List[int]] = None
+
+    def add(self, value: Any) -> bool:
+        '''
+            Record a value
+
+            @param value: The value to record
+            @returns: True if the value was new
+        '''
+        fingerprint = hash(value)
+        if fingerprint in self._fingerprints:
+            return False
+        self._fingerprints.add(fingerprint)
+        if self._added is not None:
+            self._added.append(fingerprint)
+        return True
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def snapshot(self) -> List[int]:
+        '''
+            Copy the fingerprints, e.g. into a checkpoint
+
+            Fingerprints of strings and bytes depend on the process's hash
+            seed (PYTHONHASHSEED), so they can only be restored in a process
+            with the same one.
+
+            @returns: The fingerprints
+        '''
+        return list(self._fingerprints)
+
+    def restore(self, fingerprints: Iterable[int]):
+        '''
+            Add fingerprints from a snapshot
+
+            @param fingerprints: The fingerprints of values already produced
+        '''
+        self._fingerprints.update(fingerprints)
+
+    def track(self):
+        '''
+            Start recording the fingerprints added from now on, for drain()
+        '''
+        if self._added is None:
+            self._added = []
+
+    def drain(self) -> List[int]:
+        '''
+            Take the fingerprints added since track() or the last drain(), e.g. for an incremental checkpoint
+
+            @returns: The new fingerprints, in the order they were added
+        '''
+        added = self._added or []
+        if self._added is not None:
+            self._added = []
+        return added
+
+def unique_draws(draw: Callable[[], Any], name: str, max_retries: int = UNIQUE_MAX_RETRIES,
+                 seen: Optional[SeenSet] = None) -> Callable[[], Any]:
+    '''
+        Wrap a draw callable so it never returns the same value twice
+
+        @param draw: Zero-argument callable returning one value
+        @param name: The column name, used in errors
+        @param max_retries: Consecutive duplicates allowed before giving up
+        @param seen: The seen-set to record values in. Defaults to a new one
+        @returns: The wrapped callable. It raises UniqueValuesExhausted when no new value is found
+    '''
+    if seen is None:
+        seen = SeenSet()
+    add = seen.add
+
+    def unique():
+        for _ in range(max_retries):
+            value = draw()
+            if add(value):
+                return value
+        raise UniqueValuesExhausted(
+            f"Column {name}: no new unique value after {max_retries} attempts ({len(seen)} values generated). "
+            "Widen the value range or generate fewer rows."
+        )
+    return unique
+
+def permutation_key(seed: Optional[int], name: str, rng: Any = random) -> int:
+    '''
+        Derive the key of a column's permutation
+
+        @param seed: The run's master seed. Without one, the key is drawn from rng
+        @param name: The column name, so columns of one run get different permutations
+        @param rng: The random number generator used when there is no seed
+        @returns: A 64-bit key
+    '''
+    if seed is None:
+        return rng.getrandbits(64)
+    digest = hashlib.blake2b(f"{seed}:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+class Permutation:
+    '''
+        A keyed bijection on range(size), for drawing unique values without a seen-set
+
+        Indices go through a balanced Feistel network on the smallest even
+        number of bits covering size, cycle-walking results that fall outside
+        the range. Each index maps to a distinct value, so walking the indices
+        0, 1, 2, ... yields every value in range(size) exactly once, in an
+        order that looks random.
+
+        @param size: The number of values
+        @param key: The key picking the permutation
+    '''
+    def __init__(self, size: int, key: int):
+        if size < 1:
+            raise ValueError("Permutation size must be at least 1")
+        self.size = size
+        half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_bits = half_bits
+        self._mask = (1 << half_bits) - 1
+        rng = random.Random(key)
+        self._keys = [rng.getrandbits(64) | 1 for _ in range(FEISTEL_ROUNDS)]
+
+    def _encrypt(self, value: int) -> int:
+        mask = self._mask
+        bits = self._half_bits
+        left, right = value >> bits, value & mask
+        for key in self._keys:
+            mixed = (right * key) & 0xFFFFFFFFFFFFFFFF
+            left, right = right, left ^ ((mixed ^ (mixed >> 29)) & mask)
+        return (left << bits) | right
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError("Permutation index out of range")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def __len__(self):
+        return self.size
+
+    def values(self, start: int = 0, name: str = '') -> Iterator[int]:
+        '''
+            Iterate the permuted values from an index onwards
+
+            @param start: The index to start from, e.g. the row offset of a shard
+            @param name: The column name, used in errors
+            @returns: Iterator over the values. It raises UniqueValuesExhausted after the last one
+        '''
+        for index in range(start, self.size):
+            yield self[index]
+        raise UniqueValuesExhausted(f"Column {name}: all {self.size} unique values have been used.")
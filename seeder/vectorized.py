@@ -0,0 +1,81 @@
+'''
+    Optional NumPy backend: numeric and temporal columns drawn as whole arrays.
+'''
+from typing import Any, Optional
+
+BACKENDS = ('python', 'numpy')
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+_NUMPY = None
+
+def load_numpy() -> Optional[Any]:
+    '''
+        Import NumPy on first use, so the package import stays light
+
+        @returns: The numpy module, or None if it is not installed
+    '''
+    global _NUMPY  # pylint: disable=global-statement
+    if _NUMPY is None:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            _NUMPY = False
+        else:
+            _NUMPY = numpy
+    return _NUMPY or None
+
+def numpy_available() -> bool:
+    '''
+        Check whether the NumPy backend can run
+
+        @returns: True if NumPy is installed
+    '''
+    return load_numpy() is not None
+
+def check_backend(backend: str) -> str:
+    '''
+        Validate a backend name
+
+        @param backend: "python" or "numpy"
+        @returns: The backend name
+    '''
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of: {', '.join(BACKENDS)}")
+    return backend
+
+def numpy_rng(np: Any, rng: Any) -> Any:
+    '''
+        Make a NumPy generator seeded from a random.Random
+
+        Drawing the seed from rng keeps NumPy columns reproducible under the
+        Seeder's master seed, per shard and in every worker process.
+
+        @param np: The numpy module
+        @param rng: The random.Random instance of the generator
+        @returns: A numpy.random.Generator
+    '''
+    return np.random.default_rng(rng.getrandbits(64))
+
+def fits_int64(low: int, high: int) -> bool:
+    '''
+        Check whether an int range can be drawn as int64
+
+        @param low: The smallest value
+        @param high: The largest value
+        @returns: True if both bounds fit in an int64
+    '''
+    return INT64_MIN <= low and high <= INT64_MAX
+
+def integers(np_rng: Any, low: int, high: int, n: int) -> Any:
+    '''
+        Draw uniform ints in a closed range
+
+        @param np_rng: The numpy.random.Generator
+        @param low: The smallest value
+        @param high: The largest value, inclusive
+        @param n: The number of values
+        @returns: An int64 array
+    '''
+    return np_rng.integers(low, high, size=n, endpoint=True)
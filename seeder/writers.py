@@ -0,0 +1,360 @@
+'''
+    Writers encode generated records into export formats, one record at a time.
+'''
+import csv
+import json
+import math
+import textwrap
+import struct
+import uuid
+from datetime import date, datetime, timezone
+from functools import partial
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, TextIO
+
+# SQL dialects of write_sql_inserts(). "standard" strings only escape quotes, as
+# PostgreSQL and SQLite expect; MySQL also treats backslash as an escape character.
+SQL_DIALECTS = ('standard', 'mysql')
+
+MYSQL_STRING_ESCAPES = str.maketrans({'\\': '\\\\', "'": "''", '\0': '\\0'})
+
+def sql_literal(value: Any, dialect: str = 'standard') -> str:
+    '''
+        Convert a Python value to a SQL literal
+
+        None becomes NULL, booleans TRUE/FALSE and numbers are written bare.
+        Everything else is written as a quoted string with embedded quotes
+        doubled. The mysql dialect also escapes backslashes and NUL, so
+        strings survive MySQL's default sql_mode.
+
+        @param value: The value to convert
+        @param dialect: "standard" or "mysql"
+        @returns: The SQL literal
+    '''
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isfinite(value):
+            return repr(value)
+        return f"'{value}'"
+    if dialect == 'mysql':
+        return "'" + str(value).translate(MYSQL_STRING_ESCAPES) + "'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+def write_sql_inserts(f: TextIO, table: str, columns: List[str], rows: Iterable[Dict[str, Any]], batch_size: int = 1000,
+                      dialect: str = 'standard') -> int:
+    '''
+        Write rows as multi-row INSERT statements
+
+        @param f: The file handle to write to
+        @param table: The name of the table to insert into
+        @param columns: The column names
+        @param rows: The records to write
+        @param batch_size: The maximum number of rows per INSERT statement
+        @param dialect: "standard" for PostgreSQL and SQLite, or "mysql"
+        @returns: The number of rows written
+    '''
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if dialect not in SQL_DIALECTS:
+        raise ValueError(f"Unknown SQL dialect {dialect!r}, expected one of: {', '.join(SQL_DIALECTS)}")
+    literal = partial(sql_literal, dialect=dialect)
+
+    header = f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+    written = 0
+    for row in rows:
+        if written % batch_size == 0:
+            if written:
+                f.write(';\n')
+            f.write(header)
+        else:
+            f.write(',\n')
+        f.write('(' + ', '.join(map(literal, row.values())) + ')')
+        written += 1
+    if written:
+        f.write(';\n')
+    return written
+
+PG_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+MYSQL_LOAD_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+PG_COPY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+PG_EPOCH = datetime(2000, 1, 1)
+PG_EPOCH_DATE = PG_EPOCH.date()
+PG_EPOCH_UNIX = 946684800
+
+def pg_copy_field(value: Any) -> str:
+    '''
+        Convert a Python value to a field of PostgreSQL's COPY text format
+
+        @param value: The value to convert
+        @returns: The escaped field
+    '''
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return str(value).translate(PG_COPY_ESCAPES)
+
+def mysql_load_field(value: Any) -> str:
+    '''
+        Convert a Python value to a field of MySQL's default LOAD DATA format
+
+        @param value: The value to convert
+        @returns: The escaped field
+    '''
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return str(value).translate(MYSQL_LOAD_ESCAPES)
+
+def write_pg_copy_text(f: TextIO, rows: Iterable[Dict[str, Any]]) -> int:
+    '''
+        Write rows in PostgreSQL's COPY text format (tab separated, \\N for NULL)
+
+        Load with: COPY table (columns) FROM 'file'
+
+        @param f: The file handle to write to
+        @param rows: The records to write
+        @returns: The number of rows written
+    '''
+    written = 0
+    for row in rows:
+        f.write('\t'.join(map(pg_copy_field, row.values())) + '\n')
+        written += 1
+    return written
+
+def write_mysql_load(f: TextIO, rows: Iterable[Dict[str, Any]]) -> int:
+    '''
+        Write rows in MySQL's default LOAD DATA format (tab separated, \\N for NULL)
+
+        Load with: LOAD DATA INFILE 'file' INTO TABLE table (columns)
+
+        @param f: The file handle to write to
+        @param rows: The records to write
+        @returns: The number of rows written
+    '''
+    written = 0
+    for row in rows:
+        f.write('\t'.join(map(mysql_load_field, row.values())) + '\n')
+        written += 1
+    return written
+
+def _pg_date(value: Any) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    elif isinstance(value, str):
+        value = date.fromisoformat(value)
+    return struct.pack('>i', (value - PG_EPOCH_DATE).days)
+
+def _pg_timestamp(value: Any) -> bytes:
+    if isinstance(value, (int, float)):
+        # Unix timestamps, as produced by the Timestamp type
+        return struct.pack('>q', round((value - PG_EPOCH_UNIX) * 1000000))
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - PG_EPOCH
+    return struct.pack('>q', (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+def _pg_text(value: Any) -> bytes:
+    return str(value).encode('utf-8')
+
+PG_BINARY_ENCODERS = {
+    'bool': lambda value: b'\x01' if value else b'\x00',
+    'int2': lambda value: struct.pack('>h', value),
+    'int4': lambda value: struct.pack('>i', value),
+    'int8': lambda value: struct.pack('>q', value),
+    'float4': lambda value: struct.pack('>f', value),
+    'float8': lambda value: struct.pack('>d', value),
+    'text': _pg_text,
+    'varchar': _pg_text,
+    'uuid': lambda value: uuid.UUID(str(value)).bytes,
+    'date': _pg_date,
+    'timestamp': _pg_timestamp,
+}
+
+def _pg_infer_encoder(value: Any):
+    if isinstance(value, bool):
+        return PG_BINARY_ENCODERS['bool']
+    if isinstance(value, int):
+        return PG_BINARY_ENCODERS['int8']
+    if isinstance(value, float):
+        return PG_BINARY_ENCODERS['float8']
+    return _pg_text
+
+def write_pg_copy_binary(f: BinaryIO, columns: List[str], rows: Iterable[Dict[str, Any]], column_types: Optional[Dict[str, str]] = None) -> int:
+    '''
+        Write rows in PostgreSQL's binary COPY format
+
+        Binary COPY requires each field to match its column's type exactly.
+        Columns without an entry in column_types are encoded from the Python
+        value: bool as bool, int as int8, float as float8 and anything else
+        as text. Load with: COPY table (columns) FROM 'file' WITH (FORMAT binary)
+
+        @param f: The binary file handle to write to
+        @param columns: The column names
+        @param rows: The records to write
+        @param column_types: Optional PostgreSQL type per column, one of PG_BINARY_ENCODERS
+        @returns: The number of rows written
+    '''
+    column_types = column_types or {}
+    unknown = {pg_type for pg_type in column_types.values() if pg_type not in PG_BINARY_ENCODERS}
+    if unknown:
+        raise ValueError(f"Unsupported PostgreSQL binary types: {', '.join(sorted(unknown))}")
+    encoders = [PG_BINARY_ENCODERS[column_types[column]] if column in column_types else None for column in columns]
+
+    f.write(PG_COPY_SIGNATURE + struct.pack('>ii', 0, 0))
+    field_count = struct.pack('>h', len(columns))
+    null_field = struct.pack('>i', -1)
+    written = 0
+    for row in rows:
+        parts = [field_count]
+        for encoder, value in zip(encoders, row.values()):
+            if value is None:
+                parts.append(null_field)
+                continue
+            data = (encoder or _pg_infer_encoder(value))(value)
+            parts.append(struct.pack('>i', len(data)))
+            parts.append(data)
+        f.write(b''.join(parts))
+        written += 1
+    f.write(struct.pack('>h', -1))
+    return written
+
+def json_encoder(backend: str = 'auto') -> Callable[[Any], str]:
+    '''
+        Get a function that encodes one value as compact JSON
+
+        @param backend: "json" for the standard library, "orjson" for orjson,
+            or "auto" to use orjson when it is installed
+        @returns: The encoding function
+    '''
+    if backend not in ('auto', 'json', 'orjson'):
+        raise ValueError("Invalid JSON backend. Must be one of: auto, json, orjson")
+
+    if backend != 'json':
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            if backend == 'orjson':
+                raise ImportError("The orjson backend requires the orjson package: pip install orjson") from e
+        else:
+            # orjson is a C extension, so pylint cannot see its members
+            dumps = orjson.dumps  # pylint: disable=no-member
+            return lambda value: dumps(value).decode('utf-8')
+
+    return json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+def write_jsonl(f: TextIO, rows: Iterable[Dict[str, Any]], backend: str = 'auto') -> int:
+    '''
+        Write rows as JSON Lines, one compact record per line
+
+        @param f: The file handle to write to
+        @param rows: The records to write
+        @param backend: The JSON encoder backend, see json_encoder()
+        @returns: The number of rows written
+    '''
+    encode = json_encoder(backend)
+    written = 0
+    for row in rows:
+        f.write(encode(row) + '\n')
+        written += 1
+    return written
+
+def write_json_array(f: TextIO, rows: Iterable[Dict[str, Any]], indent: Optional[int] = 4) -> int:
+    '''
+        Write rows as a JSON array, one record at a time
+
+        @param f: The file handle to write to
+        @param rows: The records to write
+        @param indent: The indentation, laid out like json.dump(rows, indent=indent). None writes compact JSON
+        @returns: The number of rows written
+    '''
+    written = 0
+    if indent is None:
+        encode = json.JSONEncoder(separators=(',', ':')).encode
+        f.write('[')
+        for row in rows:
+            f.write((',' if written else '') + encode(row))
+            written += 1
+        f.write(']')
+        return written
+
+    f.write('[\n')
+    padding = ' ' * indent
+    for row in rows:
+        f.write((',\n' if written else '') + textwrap.indent(json.dumps(row, indent=indent), padding))
+        written += 1
+    f.write('\n]')
+    return written
+
+def write_csv(f: TextIO, columns: List[str], rows: Iterable[Dict[str, Any]], header: bool = True) -> int:
+    '''
+        Write a header line and the rows as CSV
+
+        @param f: The file handle to write to
+        @param columns: The column names
+        @param rows: The records to write
+        @param header: Write the header line. False when appending to a file that has one
+        @returns: The number of rows written
+    '''
+    writer = csv.writer(f)
+    if header:
+        writer.writerow(columns)
+    written = 0
+    for row in rows:
+        writer.writerow(row.values())
+        written += 1
+    return written
+
+# Text formats by name, with the file extension the exporters give them
+FORMAT_EXTENSIONS = {
+    'jsonl': '.jsonl',
+    'json': '.json',
+    'csv': '.csv',
+    'sql': '.sql',
+    'pg-copy': '.copy',
+    'mysql': '.tsv',
+}
+
+# Formats whose output can be written in chunks appended to one file
+APPENDABLE_FORMATS = ('jsonl', 'csv', 'sql', 'pg-copy', 'mysql')
+
+def write_format(f: TextIO, output_format: str, table: str, columns: List[str], rows: Iterable[Dict[str, Any]],
+                 batch_size: int = 1000, header: bool = True, dialect: str = 'standard') -> int:
+    '''
+        Write rows in a text format chosen by name
+
+        @param f: The file handle to write to
+        @param output_format: A key of FORMAT_EXTENSIONS
+        @param table: The name of the table, used by the sql format
+        @param columns: The column names
+        @param rows: The records to write
+        @param batch_size: The maximum number of rows per INSERT statement of the sql format
+        @param header: Write the csv header line
+        @param dialect: The SQL dialect of the sql format, "standard" or "mysql"
+        @returns: The number of rows written
+    '''
+    if output_format == 'jsonl':
+        return write_jsonl(f, rows)
+    if output_format == 'json':
+        return write_json_array(f, rows, indent=None)
+    if output_format == 'csv':
+        return write_csv(f, columns, rows, header)
+    if output_format == 'sql':
+        return write_sql_inserts(f, table, columns, rows, batch_size, dialect)
+    if output_format == 'pg-copy':
+        return write_pg_copy_text(f, rows)
+    if output_format == 'mysql':
+        return write_mysql_load(f, rows)
+    raise ValueError(f"Unknown format {output_format!r}, expected one of: {', '.join(FORMAT_EXTENSIONS)}")
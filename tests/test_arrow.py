@@ -0,0 +1,63 @@
+'''
+    Test the Arrow and Parquet exporters
+'''
+from datetime import date
+
+import pytest
+
+from seeder import Seeder
+from seeder.types import Int, Number, Bool, Date, Timestamp, Enum, Name, Null
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+GENERATORS = [
+    Int('id', value=5),
+    Number('score', value=1.5),
+    Bool('active', value=True),
+    Date('born', start_date='2000-01-01', end_date='2000-12-31'),
+    Timestamp('seen', start_date='2024-01-01', end_date='2024-01-31'),
+    Enum('status', ['new', 'done']),
+    Name('name'),
+    Null('partner', Int('partner', value=3), probability=50),
+]
+
+def test_parquet_types():
+    '''
+        Test that Parquet columns are typed from their generators
+    '''
+    seeder = Seeder()
+    seeder.seed(GENERATORS, count=250)
+    path = seeder.to_parquet('test_parquet', row_group_size=100, compression='zstd')
+    assert path.endswith('.parquet')
+
+    parquet = pq.ParquetFile(seeder.format_filename('test_parquet') + '.parquet')
+    assert parquet.metadata.num_rows == 250
+    assert parquet.metadata.num_row_groups == 3
+    schema = parquet.schema_arrow
+    assert schema.field('id').type == pa.int64()
+    assert schema.field('score').type == pa.float64()
+    assert schema.field('active').type == pa.bool_()
+    assert schema.field('born').type == pa.date32()
+    assert pa.types.is_timestamp(schema.field('seen').type)
+    assert pa.types.is_dictionary(schema.field('status').type)
+    assert schema.field('name').type == pa.string()
+    assert schema.field('partner').type == pa.int64()
+
+    table = parquet.read()
+    assert set(table.column('status').to_pylist()) <= {'new', 'done'}
+    assert all(date(2000, 1, 1) <= born <= date(2000, 12, 31) for born in table.column('born').to_pylist())
+
+def test_arrow_streaming():
+    '''
+        Test streaming records from iter_seed into an Arrow IPC file
+    '''
+    seeder = Seeder()
+    records = seeder.iter_seed(GENERATORS, count=300, batch_size=64)
+    assert seeder.to_arrow('test_arrow', records=records, batch_size=128, compression='lz4').endswith('.arrow')
+
+    with pa.ipc.open_file(seeder.format_filename('test_arrow') + '.arrow') as reader:
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+    assert table.num_rows == 300
+    assert table.schema.field('seen').type == pa.timestamp('s')
@@ -0,0 +1,55 @@
+'''
+    Test the benchmark suite
+'''
+import json
+
+from seeder import bench
+from seeder.types import SKU
+
+def test_type_classes():
+    '''
+        Test that every type is found
+    '''
+    classes = bench.type_classes()
+    assert 'Int' in classes and 'Email' in classes and 'BIC' in classes
+    assert 'BaseType' not in classes and 'PooledType' not in classes
+
+def test_bench_type():
+    '''
+        Test the result layout of a type benchmark
+    '''
+    result = bench.bench_type(SKU('sku'), 200)
+    assert result['count'] == 200
+    assert result['scalar']['values_per_sec'] > 0
+    assert set(result['scalar']['latency_ns']) == {'p50', 'p90', 'p99'}
+    assert result['batch']['values_per_sec'] > 0
+    assert result['batch']['peak_bytes_per_value'] > 0
+
+def test_bench_main(tmp_path):
+    '''
+        Test the command line writes JSON results
+    '''
+    output = tmp_path / 'bench.json'
+    assert bench.main(['--count', '20', '--rows', '20', '--output', str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert results['import']['runs'] == 5
+    assert set(results['types']) == set(bench.type_classes())
+    assert results['seed']['seed']['rows'] == 20
+    assert results['seed']['to_csv']['rows'] == 20
+    assert 'to_database' in results['seed']
+
+def test_bench_seed_without_rows():
+    '''
+        Test that a run with no rows skips the exporters instead of failing
+    '''
+    assert bench.main(['--count', '5', '--rows', '0', '--import-runs', '0', '--types', 'Int']) == 0
+    assert set(bench.bench_seed(0)) == {'seed'}
+
+def test_import_is_lazy():
+    '''
+        Test that importing the package does not load Faker. The time budget
+        is only reported by the bench, since wall-clock time varies between machines.
+    '''
+    result = bench.bench_import(runs=1)
+    assert not result['faker_loaded']
+    assert set(result) >= {'budget_seconds', 'within_budget'}
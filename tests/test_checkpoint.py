@@ -0,0 +1,168 @@
+'''
+    Test checkpointed, resumable seed runs
+'''
+import os
+import pickle
+
+import pytest
+
+from seeder import Seeder
+from seeder import seed as seed_module
+from seeder.checkpoint import Checkpoint, SeenLog, run_key
+from seeder.unique import SeenSet
+from seeder.writers import FORMAT_EXTENSIONS
+
+SCHEMA = [
+    {"name": "id", "type": "sequence"},
+    {"name": "code", "type": "integer", "min": 1, "max": 100000, "unique": True},
+    {"name": "name", "type": "name", "unique": True},
+    {"name": "at", "type": "event_time", "start": "2024-01-01", "rate": 10},
+    {"name": "score", "type": "number"},
+]
+
+class Crash(Exception):
+    '''
+        Stands in for the process dying part way through a run
+    '''
+
+def crash_after(monkeypatch, shards):
+    '''
+        Make the writer fail once it has written a number of shards
+    '''
+    write_format = seed_module.write_format
+    calls = []
+
+    def failing(*args, **kwargs):
+        if len(calls) == shards:
+            raise Crash()
+        calls.append(None)
+        return write_format(*args, **kwargs)
+    monkeypatch.setattr(seed_module, "write_format", failing)
+
+def read(path):
+    '''
+        Read a whole text file
+    '''
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+@pytest.fixture(autouse=True)
+def small_shards(monkeypatch, tmp_path):
+    '''
+        Use small shards, and run every test in its own directory
+    '''
+    monkeypatch.setattr(seed_module, "SHARD_SIZE", 50)
+    monkeypatch.chdir(tmp_path)
+
+@pytest.mark.parametrize("output_format", ["jsonl", "csv", "sql"])
+def test_resume_matches_uninterrupted_run(monkeypatch, output_format):
+    '''
+        Test that a run resumed after a crash writes the same file as one that never stopped
+    '''
+    expected = read(Seeder(seed=4).seed_to_file(SCHEMA, 420, "full", output_format, table="people", batch_size=20))
+
+    with monkeypatch.context() as patch:
+        crash_after(patch, 3)
+        with pytest.raises(Crash):
+            Seeder(seed=4).seed_to_file(SCHEMA, 420, "resumed", output_format, table="people", batch_size=20)
+    path = "exports/resumed" + FORMAT_EXTENSIONS[output_format]
+    checkpoint = Checkpoint.load(path + ".checkpoint")
+    assert checkpoint.shard == 3 and checkpoint.rows == 150
+    # Permuted unique columns resume from their row offset and need no seen-set
+    seen = SeenLog(path + ".checkpoint.seen").read(checkpoint.seen_offset)
+    assert list(seen) == ["name"] and len(set(seen["name"])) == 150
+
+    # Rows and seen values written after the checkpoint are cut off on resume
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("partial row")
+    with open(path + ".checkpoint.seen", "ab") as f:
+        f.write(b"partial record")
+    assert read(Seeder(seed=4).seed_to_file(SCHEMA, 420, "resumed", output_format, table="people", batch_size=20)) == expected
+    assert not os.path.exists(path + ".checkpoint") and not os.path.exists(path + ".checkpoint.seen")
+
+def test_seen_log_holds_deltas(monkeypatch):
+    '''
+        Test that each checkpoint appends only the fingerprints added since the one before
+    '''
+    with monkeypatch.context() as patch:
+        crash_after(patch, 4)
+        with pytest.raises(Crash):
+            Seeder(seed=6).seed_to_file(SCHEMA, 300, "deltas")
+    records = []
+    with open("exports/deltas.jsonl.checkpoint.seen", "rb") as f:
+        while f.tell() < Checkpoint.load("exports/deltas.jsonl.checkpoint").seen_offset:
+            records.append(pickle.load(f))
+    assert [len(record["name"]) for record in records] == [50, 50, 50, 50]
+    assert len(set().union(*(record["name"] for record in records))) == 200
+
+def test_resume_rebuilds_seen_sets(monkeypatch):
+    '''
+        Test that seen-sets saved under another hash seed are rebuilt by replaying the earlier shards
+    '''
+    expected = read(Seeder(seed=5).seed_to_file(SCHEMA, 300, "full", interval=2))
+    with monkeypatch.context() as patch:
+        crash_after(patch, 5)
+        with pytest.raises(Crash):
+            Seeder(seed=5).seed_to_file(SCHEMA, 300, "resumed", interval=2)
+    path = "exports/resumed.jsonl.checkpoint"
+    checkpoint = Checkpoint.load(path)
+    assert checkpoint.shard == 4
+    checkpoint.hash_probe += 1
+    assert not checkpoint.seen_restorable()
+    checkpoint.save(path)
+
+    assert read(Seeder(seed=5).seed_to_file(SCHEMA, 300, "resumed", interval=2)) == expected
+
+def test_unseeded_runs_keep_their_seed(monkeypatch):
+    '''
+        Test that a run without a master seed resumes with the one it drew, also across workers
+    '''
+    schema = [{"name": "id", "type": "sequence"}, {"name": "score", "type": "integer"}]
+    with monkeypatch.context() as patch:
+        crash_after(patch, 2)
+        with pytest.raises(Crash):
+            Seeder().seed_to_file(schema, 200, "unseeded")
+    master_seed = Checkpoint.load("exports/unseeded.jsonl.checkpoint").master_seed
+    resumed = read(Seeder().seed_to_file(schema, 200, "unseeded", workers=2))
+    assert resumed == read(Seeder(seed=master_seed).seed_to_file(schema, 200, "seeded"))
+    assert len(resumed.splitlines()) == 200
+
+def test_checkpoint_errors(monkeypatch):
+    '''
+        Test that checkpoints of other runs and bad options are refused
+    '''
+    with monkeypatch.context() as patch:
+        crash_after(patch, 1)
+        with pytest.raises(Crash):
+            Seeder(seed=1).seed_to_file(SCHEMA, 200, "errors")
+    with pytest.raises(ValueError, match="different run"):
+        Seeder(seed=2).seed_to_file(SCHEMA, 200, "errors")
+    with pytest.raises(ValueError, match="different run"):
+        Seeder(seed=1).seed_to_file(SCHEMA, 300, "errors")
+    os.remove("exports/errors.jsonl")
+    with pytest.raises(ValueError, match="shorter"):
+        Seeder(seed=1).seed_to_file(SCHEMA, 200, "errors")
+
+    with pytest.raises(ValueError):
+        Seeder().seed_to_file(SCHEMA, 10, "bad", "json")
+    with pytest.raises(ValueError):
+        Seeder().seed_to_file(SCHEMA, 10, "bad", workers=2)
+    with pytest.raises(ValueError):
+        Seeder().seed_to_file(SCHEMA, 10, "bad", interval=0)
+    assert run_key(SCHEMA, count=1) != run_key(SCHEMA, count=2)
+
+def test_seen_set_snapshot():
+    '''
+        Test that a restored seen-set rejects the values of the original
+    '''
+    seen = SeenSet()
+    for value in ("a", "b", 3):
+        seen.add(value)
+    restored = SeenSet()
+    restored.restore(seen.snapshot())
+    assert len(restored) == 3 and not restored.add("a") and restored.add("c")
+
+    restored.track()
+    assert restored.add("d") and not restored.add("d") and restored.add("e")
+    assert restored.drain() == [hash("d"), hash("e")] and not restored.drain()
+    assert not seen.drain()
@@ -0,0 +1,128 @@
+'''
+    Test the quick-seeders command
+'''
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from seeder.cli import main
+
+SCHEMA = [
+    {"name": "id", "type": "sequence"},
+    {"name": "name", "type": "name"},
+    {"name": "score", "type": "integer", "min": 1, "max": 10},
+]
+
+@pytest.fixture(name="schema_file")
+def fixture_schema_file(tmp_path):
+    '''
+        Write SCHEMA to a JSON schema file
+    '''
+    path = tmp_path / "user-accounts.json"
+    path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+    return path
+
+def test_cli_formats(schema_file, capsys):
+    '''
+        Test that each format streams the requested rows to stdout
+    '''
+    assert main([str(schema_file), "-n", "5", "--seed", "1"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+
+    assert main([str(schema_file), "-n", "5", "-f", "csv"]) == 0
+    lines = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert lines[0] == ["id", "name", "score"] and len(lines) == 6
+
+    assert main([str(schema_file), "-n", "5", "-f", "sql", "--batch-size", "2"]) == 0
+    out = capsys.readouterr().out
+    assert out.count("INSERT INTO user_accounts (id, name, score) VALUES") == 3
+
+    assert main([str(schema_file), "-n", "3", "-f", "json", "--table", "ignored"]) == 0
+    assert len(json.loads(capsys.readouterr().out)) == 3
+
+def test_cli_output_file(schema_file, tmp_path, capsys):
+    '''
+        Test that seeded runs write the same file, in parallel too
+    '''
+    first, second = tmp_path / "first.jsonl", tmp_path / "second.jsonl"
+    assert main([str(schema_file), "-n", "50", "--seed", "3", "-o", str(first)]) == 0
+    assert main([str(schema_file), "-n", "50", "--seed", "3", "--workers", "2", "--batch-size", "7", "-o", str(second)]) == 0
+    assert capsys.readouterr().out == ""
+    assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+    assert len(first.read_text(encoding="utf-8").splitlines()) == 50
+
+    compressed = tmp_path / "first.jsonl.gz"
+    assert main([str(schema_file), "-n", "50", "--seed", "3", "-o", str(compressed), "--compression", "gzip", "--background"]) == 0
+    assert gzip.decompress(compressed.read_bytes()).decode("utf-8") == first.read_text(encoding="utf-8")
+
+def test_cli_multi_table(tmp_path, capsys):
+    '''
+        Test that multi-table schemas are written parents first
+    '''
+    path = tmp_path / "shop.json"
+    path.write_text(json.dumps({"tables": [
+        {"name": "users", "count": 3, "columns": [{"name": "id", "type": "sequence"}]},
+        {"name": "orders", "count": 4, "columns": [
+            {"name": "id", "type": "sequence"},
+            {"name": "user_id", "type": "foreign_key", "references": "users.id"},
+        ]},
+    ]}), encoding="utf-8")
+    assert main([str(path), "-f", "sql", "--seed", "1"]) == 0
+    out = capsys.readouterr().out
+    assert out.index("INSERT INTO users") < out.index("INSERT INTO orders")
+
+    assert main([str(path), "--seed", "1"]) == 0
+    tables = [json.loads(line)["table"] for line in capsys.readouterr().out.splitlines()]
+    assert tables == ["users"] * 3 + ["orders"] * 4
+
+    assert main([str(path), "-f", "csv"]) == 1
+    assert "sql or jsonl" in capsys.readouterr().err
+
+def test_cli_errors(schema_file, tmp_path, capsys):
+    '''
+        Test that bad arguments and schemas fail with a message
+    '''
+    with pytest.raises(SystemExit):
+        main([str(schema_file), "-n", "-1"])
+    with pytest.raises(SystemExit):
+        main([str(schema_file), "-f", "xml"])
+    capsys.readouterr()
+
+    assert main([str(tmp_path / "missing.json")]) == 1
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"fields": []}', encoding="utf-8")
+    assert main([str(bad)]) == 1
+    assert capsys.readouterr().err.startswith("quick-seeders: error:")
+
+    for schema, message in (([{"type": "name"}], 'Field 0 of the schema has no "name"'),
+                            ([{"name": "id", "type": "sequence"}, "name"], "Field 1 of the schema is not an object"),
+                            ([{"name": "id", "type": "nope"}], "Unsupported field type: nope"),
+                            ({"tables": [{"name": "users", "count": 1, "columns": [{"name": "id"}]}]},
+                             'Table users: Field 0 of the schema has no "type"')):
+        bad.write_text(json.dumps(schema), encoding="utf-8")
+        assert main([str(bad)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out == "" and captured.err == f"quick-seeders: error: {message}\n"
+
+def test_cli_stdout_creates_no_exports(schema_file, tmp_path, monkeypatch, capsys):
+    '''
+        Test that streaming to stdout leaves the working directory untouched
+    '''
+    monkeypatch.chdir(tmp_path)
+    assert main([str(schema_file), "-n", "3"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 3
+    assert not (tmp_path / "exports").exists()
+
+def test_cli_yaml(tmp_path, capsys):
+    '''
+        Test YAML schema files
+    '''
+    pytest.importorskip("yaml")
+    path = tmp_path / "schema.yaml"
+    path.write_text("- name: id\n  type: sequence\n- name: active\n  type: boolean\n", encoding="utf-8")
+    assert main([str(path), "-n", "4"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 4
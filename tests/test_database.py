@@ -0,0 +1,71 @@
+'''
+    Test the database sink
+'''
+import sqlite3
+
+import pytest
+
+from seeder import Seeder
+from seeder.database import ConnectionPool, insert_statement, write_rows
+from seeder.types import Int, Name, SKU, Bool, Null
+
+def create_table(path):
+    '''
+        Create the test table
+    '''
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE items (id INTEGER, name TEXT, sku TEXT, active BOOLEAN, note TEXT)")
+    connection.commit()
+    connection.close()
+
+GENERATORS = [Int('id', value=1), Name('name'), SKU('sku'), Bool('active', value=True), Null('note')]
+
+def test_to_database_sqlite_file(tmp_path):
+    '''
+        Test streaming rows into a SQLite file with concurrent writers
+    '''
+    path = str(tmp_path / 'seed.db')
+    create_table(path)
+
+    seeder = Seeder()
+    written = seeder.to_database(path, 'items', records=seeder.iter_seed(GENERATORS, count=1050), batch_size=100, writers=3)
+    assert written == 1050
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT COUNT(*), COUNT(note), SUM(active) FROM items").fetchone() == (1050, 0, 1050)
+
+def test_to_database_connection():
+    '''
+        Test writing into an open connection, which is left open
+    '''
+    connection = sqlite3.connect(':memory:')
+    connection.execute("CREATE TABLE items (id INTEGER, name TEXT, sku TEXT, active BOOLEAN, note TEXT)")
+
+    seeder = Seeder()
+    seeder.seed(GENERATORS, count=10)
+    assert seeder.to_database(connection, 'items', writers=4) == 10
+    assert connection.execute("SELECT COUNT(*) FROM items").fetchone() == (10,)
+
+def test_insert_statement_paramstyles():
+    '''
+        Test placeholders for each DB-API paramstyle
+    '''
+    assert insert_statement('t', ['a', 'b'], 'qmark') == "INSERT INTO t (a, b) VALUES (?, ?)"
+    assert insert_statement('t', ['a', 'b'], 'format') == "INSERT INTO t (a, b) VALUES (%s, %s)"
+    assert insert_statement('t', ['a', 'b'], 'numeric') == "INSERT INTO t (a, b) VALUES (:1, :2)"
+    assert insert_statement('t', ['a', 'b'], 'named') == "INSERT INTO t (a, b) VALUES (:p0, :p1)"
+    with pytest.raises(ValueError):
+        insert_statement('t', ['a'], 'unknown')
+
+def test_write_rows_named_paramstyle_and_errors():
+    '''
+        Test named parameters and that writer errors are raised
+    '''
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    pool = ConnectionPool(lambda: connection, 1)
+    rows = [{"a": i, "b": str(i)} for i in range(5)]
+    assert write_rows(pool, 't', ['a', 'b'], rows, batch_size=2, paramstyle='named') == 5
+
+    with pytest.raises(sqlite3.OperationalError):
+        write_rows(pool, 'missing', ['a', 'b'], rows, batch_size=2, writers=2)
@@ -0,0 +1,119 @@
+'''
+    Test value distributions
+'''
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+from seeder import Seeder
+from seeder.distributions import AliasTable, Exponential, Histogram, LogNormal, Normal, Zipf, make_distribution
+from seeder.plan import build_generators
+from seeder.types import Int, Number, Currency, fake
+
+def test_alias_table():
+    '''
+        Test that indices are drawn in proportion to their weights
+    '''
+    table = AliasTable([1, 0, 3, 6])
+    counts = Counter(table.sample_batch(random.Random(1), 100000))
+    assert counts[1] == 0
+    for index, weight in ((0, 0.1), (2, 0.3), (3, 0.6)):
+        assert abs(counts[index] / 100000 - weight) < 0.01
+
+    draw = table.sampler(random.Random(1))
+    assert [draw() for _ in range(10)] == table.sample_batch(random.Random(1), 10)
+    for weights in ([], [0, 0], [1, -1]):
+        with pytest.raises(ValueError):
+            AliasTable(weights)
+
+def test_zipf():
+    '''
+        Test that Zipf draws follow 1 / k ** s over the range
+    '''
+    draw = Zipf(1.2).sampler(random.Random(2), 11, 20)
+    counts = Counter(draw() for _ in range(100000))
+    assert set(counts) <= set(range(11, 21))
+    total = sum(1 / k ** 1.2 for k in range(1, 11))
+    for rank in (1, 2, 5, 10):
+        assert abs(counts[10 + rank] / 100000 - 1 / rank ** 1.2 / total) < 0.01
+
+    huge = Zipf(1.1).sampler(random.Random(2), 1, 10 ** 12)
+    assert all(1 <= huge() <= 10 ** 12 for _ in range(100))
+
+def test_int_distributions():
+    '''
+        Test that Int rounds and clamps samples to its range
+    '''
+    normal = Int("test_int", min_value=0, max_value=100, distribution=Normal(50, 5))
+    values = normal.bind(random.Random(3), fake).generate_batch(10000)
+    assert all(isinstance(value, int) and 0 <= value <= 100 for value in values)
+    assert abs(statistics.mean(values) - 50) < 0.5
+
+    clamped = Int("test_int", min_value=0, max_value=10, distribution={"type": "normal", "mean": 50, "stddev": 1})
+    assert set(clamped.generate_batch(100)) == {10}
+
+    exponential = Int("test_int", min_value=100, max_value=10 ** 6, distribution=Exponential(10))
+    values = exponential.generate_batch(10000)
+    assert min(values) >= 100 and statistics.mean(values) < 120
+
+    unique = Int("test_int", min_value=1, max_value=100, distribution=Zipf(1.0), unique=True)
+    assert not unique.uses_permutation()
+    assert len(set(unique.generate_batch(50))) == 50
+
+def test_number_and_currency_distributions():
+    '''
+        Test that Number keeps raw samples and Currency clamps amounts in cents
+    '''
+    values = Number("test_number", distribution=LogNormal(0, 1)).generate_batch(1000)
+    assert all(isinstance(value, float) and value > 0 for value in values)
+
+    histogram = Histogram([(10, 20, 9), (500, 1000, 1)])
+    amounts = Currency("test_currency", min_value=0, max_value=1000, distribution=histogram).generate_batch(10000)
+    parsed = [float(amount[1:]) for amount in amounts]
+    assert all(10 <= amount <= 20 or 500 <= amount <= 1000 for amount in parsed)
+    assert 0.88 < sum(amount <= 20 for amount in parsed) / 10000 < 0.92
+    assert Currency("test_currency", distribution=histogram)()[0].startswith("$")
+
+def test_schema_distributions():
+    '''
+        Test distributions set from a schema definition
+    '''
+    schema = [
+        {"name": "user_id", "type": "integer", "min": 1, "max": 1000, "distribution": {"type": "zipf", "s": 1.5}},
+        {"name": "total", "type": "currency", "distribution": {"type": "histogram", "bins": [[1, 5, 1]]}},
+    ]
+    generators = build_generators(schema)
+    assert isinstance(generators[0].distribution, Zipf)
+
+    rows = Seeder(seed=5).seed(schema, count=2000)
+    hot = Counter(row["user_id"] for row in rows).most_common(1)[0]
+    assert hot[0] == 1 and hot[1] > 600
+    assert rows == Seeder(seed=5).seed(schema, count=2000)
+
+    with pytest.raises(ValueError):
+        build_generators([{"name": "email", "type": "email", "distribution": {"type": "zipf"}}])
+    with pytest.raises(ValueError):
+        make_distribution({"type": "pareto"})
+    with pytest.raises(ValueError):
+        make_distribution({"type": "normal", "mean": 1})
+    with pytest.raises(ValueError):
+        Normal(0, 0)
+
+def test_numpy_distributions():
+    '''
+        Test the vectorized distribution paths
+    '''
+    pytest.importorskip("numpy")
+    normal = Int("test_int", min_value=0, max_value=100, distribution=Normal(50, 5))
+    values = normal.bind(random.Random(3), fake, backend="numpy").generate_batch(10000)
+    assert all(isinstance(value, int) and 0 <= value <= 100 for value in values)
+    assert abs(statistics.mean(values) - 50) < 0.5
+
+    histogram = Histogram([(10, 20, 9), (500, 1000, 1)])
+    amounts = Currency("test_currency", distribution=histogram).bind(random.Random(3), fake, backend="numpy").generate_batch(10000)
+    assert 0.88 < sum(float(amount[1:]) <= 20 for amount in amounts) / 10000 < 0.92
+
+    zipf = Int("test_int", min_value=1, max_value=10, distribution=Zipf(1.0)).bind(random.Random(3), fake, backend="numpy")
+    assert all(1 <= value <= 10 for value in zipf.generate_batch(100))
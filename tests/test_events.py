@@ -0,0 +1,80 @@
+'''
+    Test ordered event streams
+'''
+import itertools
+import random
+import statistics
+from datetime import datetime
+
+import pytest
+
+from seeder import Seeder
+from seeder import seed as seed_module
+from seeder.events import EVENT_BLOCK_SIZE, arrival_gaps, event_offsets
+from seeder.types import EventTime
+
+def variation(gaps):
+    '''
+        Return the coefficient of variation of the gaps
+    '''
+    return statistics.pstdev(gaps) / statistics.mean(gaps)
+
+def test_arrival_gaps():
+    '''
+        Test the spread of the gaps of each arrival process
+    '''
+    rng = random.Random(1)
+    assert arrival_gaps(rng, 5, 'regular') == [1.0] * 5
+    assert all(0.9 <= gap <= 1.1 for gap in arrival_gaps(rng, 1000, 'regular', jitter=0.1))
+    assert 0.95 < variation(arrival_gaps(rng, 20000, 'poisson')) < 1.05
+    assert variation(arrival_gaps(rng, 20000, 'bursty', burst_factor=50, burst_probability=0.05)) > 1.2
+    with pytest.raises(ValueError):
+        arrival_gaps(rng, 5, 'random')
+
+def test_event_offsets():
+    '''
+        Test that offsets increase, keep the rate and can start at any event
+    '''
+    offsets = list(itertools.islice(event_offsets(7, 0, rate=20.0), 3 * EVENT_BLOCK_SIZE))
+    assert all(earlier < later for earlier, later in zip(offsets, offsets[1:]))
+    assert offsets[-1] < 3 * EVENT_BLOCK_SIZE / 20.0
+    assert abs(offsets[-1] - 3 * EVENT_BLOCK_SIZE / 20.0) < 1
+
+    resumed = list(itertools.islice(event_offsets(7, EVENT_BLOCK_SIZE + 10, rate=20.0), 100))
+    assert resumed == offsets[EVENT_BLOCK_SIZE + 10:EVENT_BLOCK_SIZE + 110]
+
+def test_event_time_outputs():
+    '''
+        Test that every output format is ordered and starts at the start time
+    '''
+    start = datetime(2024, 1, 1)
+    times = EventTime("ts", start=start, rate=5).generate_batch(2000)
+    assert times == sorted(times) and times[0].startswith("2024-01-01 00:0")
+
+    seconds = EventTime("ts", start=start, rate=5, output="timestamp").generate_batch(2000)
+    assert seconds == sorted(seconds) and seconds[0] >= int(start.timestamp())
+    assert abs(seconds[-1] - (int(start.timestamp()) + 400)) < 5
+
+    millis = EventTime("ts", start=start, rate=1000, arrival="regular", output="timestamp_ms").generate_batch(1000)
+    assert millis == list(range(millis[0], millis[0] + 1000))
+
+    for options in ({"rate": 0}, {"arrival": "random"}, {"jitter": 1}, {"output": "iso"}, {"burst_length": 0}):
+        with pytest.raises(ValueError):
+            EventTime("ts", **options)
+
+def test_event_streams_across_workers(monkeypatch):
+    '''
+        Test that sharded and parallel runs produce the same ordered stream
+    '''
+    monkeypatch.setattr(seed_module, "SHARD_SIZE", 700)
+    schema = [
+        {"name": "id", "type": "sequence"},
+        {"name": "at", "type": "event_time", "start": "2024-01-01", "rate": 50, "arrival": "bursty", "output": "timestamp_ms"},
+    ]
+    serial = Seeder(seed=2).seed(schema, count=2500)
+    assert serial == Seeder(seed=2).seed(schema, count=2500, workers=2)
+    times = [row["at"] for row in serial]
+    assert times == sorted(times)
+
+    streamed = [row["at"] for row in Seeder().iter_seed(schema, count=3000)]
+    assert streamed == sorted(streamed)
@@ -0,0 +1,115 @@
+'''
+    Test compressed, buffered and background export output
+'''
+import gzip
+import io
+import json
+
+import pytest
+
+from seeder import Seeder
+from seeder.output import BackgroundWriter, compression_extension, open_output
+
+SCHEMA = [
+    {"name": "id", "type": "sequence"},
+    {"name": "name", "type": "name"},
+    {"name": "score", "type": "integer", "min": 1, "max": 100},
+]
+
+def decompress(data, compression):
+    '''
+        Decompress the output of one codec
+    '''
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    if compression == 'zstd':
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+    lz4_frame = pytest.importorskip("lz4.frame")
+    return lz4_frame.decompress(data)
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd", "lz4"])
+@pytest.mark.parametrize("background", [False, True])
+def test_open_output(compression, background):
+    '''
+        Test that every layer is flushed and a target stream is left open
+    '''
+    if compression != 'gzip':
+        pytest.importorskip({"zstd": "zstandard", "lz4": "lz4.frame"}[compression])
+    target = io.BytesIO()
+    lines = [f"line {index}\n" for index in range(20000)]
+    with open_output(target, compression=compression, buffer_size=4096, background=background) as f:
+        for line in lines:
+            f.write(line)
+    assert not target.closed
+    assert decompress(target.getvalue(), compression).decode("utf-8") == "".join(lines)
+
+def test_open_output_plain(tmp_path):
+    '''
+        Test uncompressed text and binary output to a path
+    '''
+    path = tmp_path / "plain.txt"
+    with open_output(str(path), buffer_size=1) as f:
+        f.write("Zoë\n")
+    assert path.read_bytes() == "Zoë\n".encode("utf-8")
+    with open_output(path, binary=True, background=True) as f:
+        f.write(b"\x00\x01")
+    assert path.read_bytes() == b"\x00\x01"
+
+    with pytest.raises(ValueError):
+        compression_extension("bzip2")
+    with pytest.raises(ValueError):
+        with open_output(path, buffer_size=0):
+            pass
+
+def test_background_writer_errors():
+    '''
+        Test that a failed write in the background thread is raised in the caller
+    '''
+    class Broken(io.RawIOBase):
+        '''
+            A stream whose writes always fail
+        '''
+        def writable(self):
+            return True
+
+        def write(self, data):
+            raise OSError("disk full")
+
+    writer = BackgroundWriter(Broken(), queue_size=1)
+    writer.write(b"a")
+    with pytest.raises(OSError, match="disk full"):
+        for _ in range(100):
+            writer.write(b"b")
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+    with pytest.raises(ValueError):
+        BackgroundWriter(io.BytesIO(), queue_size=0)
+
+def test_compressed_exports(tmp_path, monkeypatch):
+    '''
+        Test that compressed and background exports hold the same data as plain ones
+    '''
+    monkeypatch.chdir(tmp_path)
+    seeder = Seeder(seed=1)
+    seeder.seed(SCHEMA, count=500)
+
+    seeder.to_jsonl("people")
+    with open(tmp_path / "exports" / "people.jsonl", "rb") as f:
+        expected = f.read()
+    path = seeder.to_jsonl("people", compression="gzip", background=True, buffer_size=1024)
+    assert path.endswith("people.jsonl.gz")
+    with open(tmp_path / "exports" / "people.jsonl.gz", "rb") as f:
+        assert gzip.decompress(f.read()) == expected
+    assert [json.loads(line) for line in expected.splitlines()] == seeder.data
+
+    for export, name in ((lambda: seeder.to_csv("people", compression="gzip"), "people.csv.gz"),
+                         (lambda: seeder.to_sql("people", "people", compression="gzip"), "people.sql.gz"),
+                         (lambda: seeder.to_json("people", compression="gzip", background=True), "people.json.gz"),
+                         (lambda: seeder.to_pg_copy("people", binary=True, compression="gzip"), "people.pgcopy.gz"),
+                         (lambda: seeder.to_mysql_load("people", compression="gzip"), "people.tsv.gz")):
+        export()
+        with gzip.open(tmp_path / "exports" / name) as f:
+            assert f.read()
+    with open(tmp_path / "exports" / "people.json.gz", "rb") as f:
+        assert json.loads(gzip.decompress(f.read())) == seeder.data
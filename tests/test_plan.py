@@ -0,0 +1,94 @@
+'''
+    Test compiled schema plans
+'''
+import pickle
+
+import pytest
+
+from seeder import Seeder
+from seeder.plan import SchemaPlan, compile_schema, schema_fingerprint, clear_plan_cache
+from seeder.types import Email, Hash, Int
+
+SCHEMA = [
+    {"name": "id", "type": "integer", "min": 1, "max": 10},
+    {"name": "email", "type": "email", "email_type": "free"},
+    {"name": "digest", "type": "hash", "hash_type": "md5"},
+]
+
+def test_compile_schema_is_cached():
+    '''
+        Test that compiling the same schema twice returns the cached plan
+    '''
+    clear_plan_cache()
+    plan = compile_schema(SCHEMA)
+    assert isinstance(plan, SchemaPlan)
+    assert plan.names == ("id", "email", "digest")
+    assert compile_schema([dict(field) for field in SCHEMA]) is plan
+    assert compile_schema(SCHEMA, cache=False) is not plan
+    assert compile_schema(SCHEMA, cache=False) == plan
+    assert len({plan, compile_schema(SCHEMA, cache=False)}) == 1
+
+def test_schema_fingerprint_ignores_key_order():
+    '''
+        Test that the fingerprint does not depend on key order
+    '''
+    reordered = [{key: field[key] for key in reversed(list(field))} for field in SCHEMA]
+    assert schema_fingerprint(reordered) == schema_fingerprint(SCHEMA)
+    assert schema_fingerprint(SCHEMA[:1]) != schema_fingerprint(SCHEMA)
+
+def test_schema_fingerprint_embedded_generators():
+    '''
+        Test that generators in a definition are fingerprinted by their options, not their repr
+    '''
+    def enum_schema(high):
+        return [{"name": "pick", "type": "enum", "choices": [Int("low", min_value=1, max_value=high)]}]
+
+    clear_plan_cache()
+    assert schema_fingerprint(enum_schema(5)) != schema_fingerprint(enum_schema(500))
+    assert schema_fingerprint(enum_schema(5)) == schema_fingerprint(enum_schema(5))
+    assert compile_schema(enum_schema(5)) is not compile_schema(enum_schema(500))
+    assert all(value <= 5 for value in compile_schema(enum_schema(5)).generators[0].generate_batch(100))
+
+    # Functions have no stable fingerprint, so their schemas are compiled every time
+    dynamic = [{"name": "x", "type": "integer", "value": lambda: 1}]
+    assert schema_fingerprint(dynamic) is None
+    assert compile_schema(dynamic) is not compile_schema(dynamic)
+
+def test_seed_from_plan():
+    '''
+        Test seeding from a compiled plan
+    '''
+    seeder = Seeder()
+    result = seeder.seed(compile_schema(SCHEMA), count=20)
+    assert len(result) == 20
+    assert all(1 <= record["id"] <= 10 for record in result)
+    assert all(len(record["digest"]) == 32 for record in result)
+
+def test_plan_generators_pickle():
+    '''
+        Test that specialized generators survive pickling, as in worker processes
+    '''
+    email = pickle.loads(pickle.dumps(Email("email", email_type="specific", domain="example.com")))
+    assert email()[0].endswith("@example.com")
+    assert len(pickle.loads(pickle.dumps(Hash("hash", hash_type="sha1")))()[0]) == 40
+    assert pickle.loads(pickle.dumps(Int("id", min_value=5, max_value=5)))() == (5, "id")
+
+def test_fast_fields():
+    '''
+        Test that "fast" in a field definition selects the fast path
+    '''
+    plan = compile_schema([
+        {"name": "id", "type": "uuid", "fast": True},
+        {"name": "digest", "type": "hash", "hash_type": "sha1", "fast": True},
+        {"name": "ip", "type": "ipaddress"},
+    ])
+    assert [generator.fast for generator in plan.generators] == [True, True, False]
+
+def test_pooled_fields():
+    '''
+        Test that "pool_size" in a field definition enables pooling
+    '''
+    plan = compile_schema([{"name": "name", "type": "name", "pool_size": 20, "pool_seed": 3}], cache=False)
+    assert plan.generators[0].pool_size == 20 and plan.generators[0].pool_seed == 3
+    with pytest.raises(ValueError):
+        compile_schema([{"name": "id", "type": "integer", "pool_size": 20}], cache=False)
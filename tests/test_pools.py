@@ -0,0 +1,69 @@
+'''
+    Test value pools
+'''
+import itertools
+import json
+import random
+
+from seeder import Seeder
+from seeder.pools import build_pool, clear_pool_cache, load_pool, pool_path
+from seeder.types import Name, JobTitle, Sentence
+
+def test_build_pool():
+    '''
+        Test that pools hold unique values and stop when the source runs out
+    '''
+    counter = itertools.count()
+    assert build_pool(lambda: next(counter), 5) == [0, 1, 2, 3, 4]
+    cycle = itertools.cycle('abc')
+    assert build_pool(lambda: next(cycle), 10) == ['a', 'b', 'c']
+
+def test_load_pool_caches_to_disk(tmp_path):
+    '''
+        Test that pools are kept in memory and saved to the cache directory
+    '''
+    clear_pool_cache()
+    key = ('Test', (), 'en_US', 3, 0)
+    calls = []
+
+    def make_draw():
+        calls.append(1)
+        counter = itertools.count()
+        return lambda: f'value-{next(counter)}'
+
+    pool = load_pool(key, make_draw, 3, str(tmp_path))
+    assert pool == ('value-0', 'value-1', 'value-2')
+    assert load_pool(key, make_draw, 3, str(tmp_path)) is pool
+    with open(pool_path(str(tmp_path), key), encoding='utf-8') as f:
+        assert json.load(f) == list(pool)
+
+    clear_pool_cache()
+    assert load_pool(key, make_draw, 3, str(tmp_path)) == pool
+    assert len(calls) == 1
+
+def test_pooled_types():
+    '''
+        Test that pooled types sample from a bounded, reproducible set of values
+    '''
+    clear_pool_cache()
+    pooled = Name("name", pool_size=25)
+    values = [row["name"] for row in Seeder(seed=1).seed([pooled], count=2000)]
+    assert len(set(values)) == 25
+    assert set(values) == set(pooled.bind(random.Random(), pooled.faker).pool())
+    assert Seeder(seed=1).seed([pooled], count=50) == Seeder(seed=1).seed([pooled], count=50)
+
+    clear_pool_cache()
+    assert set(Sentence("text", pool_size=10).generate_batch(500)) == set(Sentence("text", pool_size=10).pool())
+    assert Sentence("text", pool_size=10, pool_seed=1).pool() != Sentence("text", pool_size=10).pool()
+    assert len(JobTitle("job", pool_size=100000, probability=0).generate_batch(5)) == 5
+
+def test_bound_copies_share_pools(tmp_path):
+    '''
+        Test that copies bound for other shards, seeds and backends use the same pool
+    '''
+    clear_pool_cache()
+    pooled = Name("name", pool_size=50, pool_cache=str(tmp_path))
+    first = pooled.bind(random.Random(1), pooled.faker, seed=1, offset=0).pool()
+    assert pooled.bind(random.Random(2), pooled.faker, seed=2, offset=1000, backend="numpy").pool() is first
+    assert len(list(tmp_path.iterdir())) == 1
+    assert Sentence("text", nb_words=3, pool_size=10).pool() != Sentence("text", pool_size=10).pool()
@@ -0,0 +1,112 @@
+'''
+    Test multi-table seeding with foreign keys
+'''
+from array import array
+
+import pytest
+
+from seeder import Seeder, ForeignKey, Table, Sequence, Name, Int
+from seeder.relational import KeyIndex, dependency_order
+
+def customers_and_orders():
+    '''
+        Build a schema of 50 customers with three orders each
+    '''
+    return [
+        Table("orders", [Sequence("id"), ForeignKey("customer_id", "customers.id"), Int("total", 1, 500)],
+              per="customers", ratio=3),
+        Table("customers", [Sequence("id"), Name("name")], count=50),
+    ]
+
+def test_key_index():
+    '''
+        Test that integer keys are packed and other keys fall back to a list
+    '''
+    index = KeyIndex()
+    for key in range(5):
+        index.append(key)
+    assert isinstance(index.keys, array) and len(index) == 5
+
+    index.append("abc")
+    assert index.keys == [0, 1, 2, 3, 4, "abc"]
+    index.append(1 << 70)
+    assert len(index) == 7
+
+def test_dependency_order():
+    '''
+        Test that parents come first, unrelated tables keep their order and cycles fail
+    '''
+    a = Table("a", [], count=1)
+    b = Table("b", [], per="c")
+    c = Table("c", [], count=1)
+    order = dependency_order([a, b, c], {"a": [], "b": [], "c": []})
+    assert [table.name for table in order] == ["a", "c", "b"]
+
+    x = Table("x", [], count=1)
+    y = Table("y", [], count=1)
+    with pytest.raises(ValueError, match="cycle"):
+        dependency_order([x, y], {"x": [ForeignKey("y_id", "y.id")], "y": [ForeignKey("x_id", "x.id")]})
+
+def test_seed_tables():
+    '''
+        Test that foreign keys only reference generated parent keys and ratios set row counts
+    '''
+    data = Seeder().seed_tables(customers_and_orders())
+    assert list(data) == ["customers", "orders"]
+    assert len(data["customers"]) == 50
+    assert len(data["orders"]) == 150
+
+    customer_ids = {customer["id"] for customer in data["customers"]}
+    assert {order["customer_id"] for order in data["orders"]} <= customer_ids
+
+def test_table_definitions():
+    '''
+        Test dict definitions, references to primary keys and null foreign keys
+    '''
+    schema = {"tables": [
+        {"name": "users", "count": 20, "primary_key": "user_id", "columns": [
+            {"name": "user_id", "type": "uuid"},
+        ]},
+        {"name": "posts", "per": "users", "ratio": 0.5, "columns": [
+            {"name": "author", "type": "foreign_key", "references": "users"},
+            {"name": "editor", "type": "foreign_key", "references": "users", "probability": 50},
+        ]},
+    ]}
+    data = Seeder(seed=3).seed_tables(schema)
+    user_ids = {user["user_id"] for user in data["users"]}
+    assert len(data["posts"]) == 10
+    assert {post["author"] for post in data["posts"]} <= user_ids
+    assert {post["editor"] for post in data["posts"]} <= user_ids | {None}
+
+def test_iter_tables():
+    '''
+        Test that tables stream in batches, are drained when skipped and are reproducible
+    '''
+    def run():
+        tables = {}
+        for name, records in Seeder(seed=7).iter_tables(customers_and_orders(), batch_size=40):
+            if name == "customers":
+                continue
+            tables[name] = [record for batch in records for record in batch]
+        return tables
+
+    first = run()
+    assert list(first) == ["orders"]
+    assert len(first["orders"]) == 150
+    assert first == run()
+
+def test_table_errors():
+    '''
+        Test that broken multi-table schemas are rejected
+    '''
+    with pytest.raises(ValueError, match="unknown table"):
+        Seeder().seed_tables([Table("orders", [ForeignKey("customer_id", "customers.id")], count=1)])
+    with pytest.raises(ValueError, match="primary_key"):
+        Seeder().seed_tables([Table("customers", [Sequence("id")], count=1),
+                              Table("orders", [ForeignKey("customer_id", "customers")], count=1)])
+    with pytest.raises(ValueError, match="count or per"):
+        Table("customers", [Sequence("id")])
+    with pytest.raises(ValueError, match="Duplicate"):
+        Seeder().seed_tables([Table("a", [], count=1), Table("a", [], count=1)])
+    with pytest.raises(ValueError, match="has not been generated"):
+        ForeignKey("customer_id", "customers.id")()
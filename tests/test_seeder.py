@@ -1,7 +1,13 @@
 '''
     Test the seeder package
 '''
+import json
+import threading
+
+import pytest
+
 from seeder import Seeder
+from seeder import seed as seed_module
 from seeder.types import (
     ID,
     Name,
@@ -33,7 +39,11 @@ from seeder.types import (
     MACAddress,
     CreditCardNumber,
     IBAN,
-    BIC
+    BIC,
+    Sequence,
+    UUIDv7,
+    Snowflake,
+    DAYS_OF_WEEK,
 )
 
 def test_seeder_initialization():
@@ -150,3 +160,182 @@ def test_complex_schema_from_generators():
 
     assert len(result) == 5
     assert all("id" in record for record in result)
+
+def test_iter_seed_is_lazy():
+    '''
+        Test that iter_seed yields records without storing them
+    '''
+    seeder = Seeder()
+    schema = [{"name": "name", "type": "name"}]
+
+    records = seeder.iter_seed(schema, count=3)
+    assert not isinstance(records, list)
+    result = list(records)
+    assert len(result) == 3
+    assert all("name" in record for record in result)
+    assert seeder.data == {}
+
+def test_iter_seed_batches():
+    '''
+        Test that iter_seed groups records into batches
+    '''
+    seeder = Seeder()
+    batches = list(seeder.iter_seed([Name('name')], count=7, batch_size=3))
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+
+def test_export_from_iterator():
+    '''
+        Test that exporters consume an iterator instead of self.data
+    '''
+    seeder = Seeder()
+    schema = [{"name": "name", "type": "name"}, {"name": "email", "type": "email"}]
+
+    seeder.to_csv('test_stream', records=seeder.iter_seed(schema, count=5, batch_size=2))
+    with open(seeder.format_filename('test_stream') + '.csv', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines[0] == 'name,email'
+    assert len(lines) == 6
+
+    seeder.to_json('test_stream', records=seeder.iter_seed(schema, count=5))
+    with open(seeder.format_filename('test_stream') + '.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == 5
+
+    assert seeder.data == {}
+
+def test_seed_columns():
+    '''
+        Test columnar generation
+    '''
+    seeder = Seeder()
+    columns = seeder.seed_columns([
+        SKU('sku', prefix='S-', length=4),
+        MACAddress('mac_address'),
+        Version('version')
+    ], count=50)
+    assert list(columns) == ['sku', 'mac_address', 'version']
+    assert all(len(column) == 50 for column in columns.values())
+    assert all(value.startswith('S-') and len(value) == 6 for value in columns['sku'])
+    assert all(len(value.split(':')) == 6 for value in columns['mac_address'])
+
+def test_seed_assembles_rows_from_columns():
+    '''
+        Test that seed rows line up with the columns each generator produced
+    '''
+    seeder = Seeder()
+    result = seeder.seed([Name('name'), Email('email')], count=2500)
+    assert len(result) == 2500
+    assert all(list(record) == ['name', 'email'] for record in result)
+
+def test_seed_is_reproducible_across_workers():
+    '''
+        Test that a master seed gives the same output for any worker count
+    '''
+    schema = [
+        {"name": "id", "type": "integer", "min": 1, "max": 100},
+        {"name": "sku", "type": "sku", "length": 6},
+        {"name": "created_at", "type": "datetime", "start_date": "2024-01-01", "end_date": "2024-12-31"}
+    ]
+
+    serial = Seeder(seed=42).seed(schema, count=25000)
+    parallel = Seeder(seed=42).seed(schema, count=25000, workers=3)
+    assert len(serial) == 25000
+    assert serial == parallel
+    assert Seeder(seed=7).seed(schema, count=10) != serial[:10]
+
+    faker_schema = [{"name": "name", "type": "name"}]
+    assert Seeder(seed=42).seed(faker_schema, count=20) == Seeder(seed=42).seed(faker_schema, count=20)
+
+def test_day_of_week_is_reproducible():
+    '''
+        Test that day names do not depend on the clock, across runs and worker counts
+    '''
+    schema = [Sequence("id"), DayOfWeek("day"), DayOfWeek("fast_day", fast=True)]
+    serial = Seeder(seed=7).seed(schema, count=25000)
+    assert serial == Seeder(seed=7).seed(schema, count=25000)
+    assert serial == Seeder(seed=7).seed(schema, count=25000, workers=3)
+    assert {row["day"] for row in serial} == {row["fast_day"] for row in serial} == set(DAYS_OF_WEEK)
+
+    german = {row["day"] for row in Seeder(seed=7, locale="de_DE").seed([DayOfWeek("day")], count=500)}
+    assert german == {"Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"}
+
+def test_parallel_iter_seed_batches():
+    '''
+        Test that parallel seeding streams batches in order
+    '''
+    seeder = Seeder()
+    batches = list(seeder.iter_seed([SKU('sku')], count=21000, batch_size=5000, workers=2))
+    assert [len(batch) for batch in batches] == [5000, 5000, 5000, 5000, 1000]
+
+def test_bulk_load_exports():
+    '''
+        Test the PostgreSQL COPY and MySQL LOAD DATA exporters
+    '''
+    seeder = Seeder()
+    seeder.seed([Name('name'), Version('version')], count=3)
+
+    assert seeder.to_pg_copy('test_export').endswith('.copy')
+    assert seeder.to_pg_copy('test_export', binary=True).endswith('.pgcopy')
+    assert seeder.to_mysql_load('test_export').endswith('.tsv')
+    with open(seeder.format_filename('test_export') + '.tsv', encoding='utf-8') as f:
+        assert len(f.read().splitlines()) == 3
+
+def test_json_exports():
+    '''
+        Test the compact JSON and JSON Lines exporters
+    '''
+    seeder = Seeder()
+    data = seeder.seed([Name('name'), Version('version')], count=3)
+
+    seeder.to_json('test_compact', indent=None)
+    with open(seeder.format_filename('test_compact') + '.json', encoding='utf-8') as f:
+        text = f.read()
+    assert '\n' not in text
+    assert json.loads(text) == data
+
+    assert seeder.to_jsonl('test_lines').endswith('.jsonl')
+    with open(seeder.format_filename('test_lines') + '.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == data
+
+def test_seeders_do_not_share_random_state():
+    '''
+        Test that each seeder draws from its own RNG and Faker, even across threads
+    '''
+    schema = [Name("name"), Email("email"), Hash("hash")]
+    expected = Seeder(seed=3).seed(schema, count=50)
+    results = [None] * 4
+
+    def work(index):
+        results[index] = Seeder(seed=3).seed(schema, count=50)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(len(results))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result == expected for result in results)
+
+def test_sequential_keys_across_workers(monkeypatch):
+    '''
+        Test that sequences and time-ordered IDs continue across parallel shards
+    '''
+    monkeypatch.setattr(seed_module, "SHARD_SIZE", 100)
+    schema = [Sequence("id"), UUIDv7("uuid", start="2024-01-01"), Snowflake("snowflake", start="2024-01-01")]
+    serial = Seeder(seed=8).seed(schema, count=450)
+    parallel = Seeder(seed=8).seed(schema, count=450, workers=2)
+    assert serial == parallel
+    assert [row["id"] for row in serial] == list(range(1, 451))
+    for column in ("uuid", "snowflake"):
+        values = [row[column] for row in serial]
+        assert values == sorted(values) and len(set(values)) == 450
+
+def test_numpy_backend_seeding(monkeypatch):
+    '''
+        Test that the backend reaches sharded generators and is reproducible across workers
+    '''
+    monkeypatch.setattr(seed_module, "SHARD_SIZE", 100)
+    schema = [{"name": "id", "type": "integer", "min": 1, "max": 10}, {"name": "day", "type": "date", "start_date": "2024-01-01", "end_date": "2024-12-31"}]
+    serial = Seeder(seed=4, backend="numpy").seed(schema, count=250)
+    assert serial == Seeder(seed=4, backend="numpy").seed(schema, count=250, workers=2)
+    assert all(1 <= row["id"] <= 10 for row in serial)
+    with pytest.raises(ValueError):
+        Seeder(backend="fortran")
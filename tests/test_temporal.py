@@ -0,0 +1,90 @@
+'''
+    Test the temporal core shared by the date and time types
+'''
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from seeder.temporal import (
+    epoch_day,
+    epoch_seconds,
+    format_datetime,
+    format_datetimes,
+    format_day,
+    format_time_of_day,
+    format_times_of_day,
+    int_bounds,
+    parse_date,
+    parse_datetime,
+    parse_relative,
+    parse_time,
+)
+from seeder.types import Date, Datetime, Time, Timestamp
+
+def test_parse_bounds():
+    '''
+        Test that every bound format resolves the same way for all types
+    '''
+    assert parse_datetime("2024-03-14T15:30:00") == datetime(2024, 3, 14, 15, 30)
+    assert parse_datetime("2024-03-14 15:30") == datetime(2024, 3, 14, 15, 30)
+    assert parse_datetime(date(2024, 3, 14)) == datetime(2024, 3, 14)
+    assert parse_date("2024-03-14") == date(2024, 3, 14)
+    assert parse_date(date(2024, 3, 14)) == date(2024, 3, 14)
+    assert parse_time("15:30") == time(15, 30)
+    assert parse_time(datetime(2024, 3, 14, 1, 2, 3)) == time(1, 2, 3)
+
+    now = datetime.now()
+    assert abs(parse_relative("-2h") - (now - timedelta(hours=2))) < timedelta(seconds=5)
+    assert abs(parse_relative("+3d") - (now + timedelta(days=3))) < timedelta(seconds=5)
+    assert parse_date("-7d") < parse_date("today")
+
+    for bad in ("yesterday", "+1x", "+d"):
+        with pytest.raises(ValueError):
+            parse_datetime(bad)
+    with pytest.raises(ValueError):
+        parse_date("-2h")
+    with pytest.raises(ValueError):
+        parse_time("+1d")
+    with pytest.raises(ValueError):
+        parse_datetime(12)
+
+def test_formatting():
+    '''
+        Test that cached formatters match strftime, including before 1970
+    '''
+    rng = random.Random(1)
+    start, end = epoch_seconds(datetime(1900, 1, 1)), epoch_seconds(datetime(2100, 1, 1))
+    seconds = [rng.randint(int(start), int(end)) for _ in range(1000)]
+    expected = [(datetime(1970, 1, 1) + timedelta(seconds=value)).strftime('%Y-%m-%d %H:%M:%S') for value in seconds]
+    assert format_datetimes(seconds) == expected
+    assert [format_datetime(value) for value in seconds] == expected
+
+    assert format_day(epoch_day(date(1969, 12, 31))) == "1969-12-31"
+    assert format_time_of_day(3661) == "01:01:01"
+    assert format_times_of_day([0, 86399]) == ["00:00:00", "23:59:59"]
+    assert int_bounds(1.5, 3.2) == (2, 3)
+    assert int_bounds(1.2, 1.7) == (1, 1)
+
+def test_temporal_types():
+    '''
+        Test that the types stay within their bounds in scalar and batch mode
+    '''
+    date_type = Date("test_date", "2024-02-27", "2024-03-02")
+    values = date_type.generate_batch(500) + [date_type()[0] for _ in range(50)]
+    assert set(values) == {"2024-02-27", "2024-02-28", "2024-02-29", "2024-03-01", "2024-03-02"}
+
+    datetime_type = Datetime("test_datetime", "2024-01-01 23:59:58", "2024-01-02 00:00:01")
+    assert set(datetime_type.generate_batch(500)) == {
+        "2024-01-01 23:59:58", "2024-01-01 23:59:59", "2024-01-02 00:00:00", "2024-01-02 00:00:01",
+    }
+
+    time_type = Time("test_time", "09:00", "09:00:02")
+    assert set(time_type.generate_batch(200)) == {"09:00:00", "09:00:01", "09:00:02"}
+
+    recent = Datetime("test_recent", "-1h", "now")
+    assert recent.start_date < recent.end_date
+
+    timestamp = Timestamp("test_timestamp", "2024-01-01", "2024-01-02")
+    assert all(timestamp.low <= value <= timestamp.high for value in timestamp.generate_batch(100))
+    assert Date("test_date", "2024-01-01", "2024-01-01").generate_batch(2) == ["2024-01-01", "2024-01-01"]
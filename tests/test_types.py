@@ -1,10 +1,14 @@
 '''
     Test each seeder type
 '''
+import ipaddress
+import random
+import uuid
 from datetime import datetime
 
 import pytest
 
+from seeder import Seeder, vectorized
 from seeder.types import (
     Text,
     Number,
@@ -41,7 +45,20 @@ from seeder.types import (
     MACAddress,
     CreditCardNumber,
     IBAN,
-    BIC
+    BIC,
+    Name,
+    LazyFaker,
+    new_faker,
+    fake,
+    fast_ipv6,
+    DAYS_OF_WEEK,
+    TLDS,
+    TLD,
+    ID,
+    Sequence,
+    UUIDv7,
+    ULID,
+    Snowflake
 )
 
 def test_text_type():
@@ -437,3 +454,206 @@ def test_probability():
             assert result != 5
         else:
             assert result is None  # When probability is 0, should always get fallback value
+
+def test_generate_batch():
+    """Test that every type can produce a whole column in one call"""
+    batch_types = [
+        Int("test_int", value=7),
+        Number("test_number", value=1.5),
+        Bool("test_bool", value=True),
+        Currency("test_currency", min_value=10, max_value=20),
+        Version("test_version"),
+        SKU("test_sku", prefix="TEST-", length=8),
+        MACAddress("test_mac"),
+        Timestamp("test_timestamp", start_date="2024-01-01", end_date="2024-01-02"),
+        Email("test_email"),
+    ]
+    for batch_type in batch_types:
+        values = batch_type.generate_batch(25)
+        assert len(values) == 25
+
+    assert Int("test_int", value=7).generate_batch(3) == [7, 7, 7]
+    assert all(10 <= float(value[1:]) <= 20 for value in Currency("test_currency", min_value=10, max_value=20).generate_batch(50))
+    start = int(datetime(2024, 1, 1).timestamp())
+    end = int(datetime(2024, 1, 2).timestamp())
+    assert all(start <= value <= end for value in Timestamp("test_timestamp", start_date="2024-01-01", end_date="2024-01-02").generate_batch(50))
+
+def test_generate_batch_wide_ranges():
+    """Test that batches of ranges wider than a C ssize_t draw from the whole range"""
+    high = 2 ** 70
+    for batch_type in (Int("test_int", min_value=0, max_value=high), Currency("test_currency", min_value=0, max_value=high),
+                       Version("test_version", major_max=high, minor_max=high, patch_max=high)):
+        values = batch_type.bind(random.Random(1), new_faker(seed=1)).generate_batch(50)
+        assert len(values) == 50
+    ints = Int("test_int", min_value=0, max_value=high).bind(random.Random(1), new_faker(seed=1)).generate_batch(200)
+    assert all(0 <= value <= high for value in ints) and max(ints) > 2 ** 64
+    assert len(Seeder(seed=1).seed([Currency("c", min_value=0, max_value=high)], count=3)) == 3
+
+def test_generate_batch_probability():
+    """Test that batch generation honours the probability parameter"""
+    assert SKU("test_sku", probability=0).generate_batch(10) == [None] * 10
+    assert Null("test_null", value=Int("inner", value=3)).generate_batch(2) == [3, 3]
+
+def test_default_values_vary():
+    """Test that types without a value draw a new random value per call"""
+    assert len({Int("test_int")()[0] for _ in range(20)}) > 1
+    assert {Bool("test_bool")()[0] for _ in range(50)} == {True, False}
+
+def test_bind():
+    """Test that bound copies draw from their own RNG and Faker"""
+    original = Int("test_int", min_value=1, max_value=1000)
+    first = original.bind(random.Random(5), new_faker(seed=5))
+    second = original.bind(random.Random(5), new_faker(seed=5))
+    assert first.generate_batch(10) == second.generate_batch(10)
+    assert original.rng is random
+
+    name_a = Name("test_name").bind(random.Random(1), new_faker(seed=1))
+    name_b = Name("test_name").bind(random.Random(1), new_faker(seed=1))
+    assert [name_a()[0] for _ in range(5)] == [name_b()[0] for _ in range(5)]
+
+def test_faker_is_loaded_on_first_use():
+    """Test that Faker is only created when a generator first needs it"""
+    faker = LazyFaker(seed=9)
+    email = Email("test_email", email_type="free").bind(random.Random(9), faker)
+    ints = Int("test_int").bind(random.Random(9), faker)
+    ints.generate_batch(10)
+    assert not faker.loaded
+    value, _ = email()
+    assert faker.loaded and "@" in value
+    assert value == Email("test_email", email_type="free").bind(random.Random(9), new_faker(seed=9))()[0]
+
+def test_fast_paths():
+    """Test that fast=True generators keep the Faker output formats"""
+    rng = random.Random(11)
+    for _ in range(200):
+        value, _ = UUID("test_uuid", fast=True).bind(rng, fake)()
+        assert str(uuid.UUID(value)) == value and uuid.UUID(value).version == 4
+        assert len(Hash("test_hash", hash_type="md5", fast=True).bind(rng, fake)()[0]) == 32
+        assert len(Hash("test_hash", hash_type="sha1", fast=True).bind(rng, fake)()[0]) == 40
+        digest = Hash("test_hash", fast=True).bind(rng, fake)()[0]
+        assert len(digest) == 64 and int(digest, 16) >= 0
+        ipv4 = IPAddress("test_ip", fast=True).bind(rng, fake)()[0]
+        assert str(ipaddress.IPv4Address(ipv4)) == ipv4
+        ipv6 = IPAddress("test_ip", version="ipv6", fast=True).bind(rng, fake)()[0]
+        assert str(ipaddress.IPv6Address(ipv6)) == ipv6
+        assert all(0 <= int(octet) <= 255 for octet in MACAddress("test_mac", fast=True).bind(rng, fake)()[0].split(':'))
+    assert fast_ipv6(ZeroBits()) == "::"
+    assert ID("test_id", prefix="usr-", fast=True)()[0].startswith("usr-")
+    assert set(DayOfWeek("test_day", fast=True).generate_batch(200)) == set(DAYS_OF_WEEK)
+    assert set(TLD("test_tld", fast=True).generate_batch(200)) <= set(TLDS)
+    assert {Bool("test_bool", fast=True)()[0] for _ in range(50)} == {True, False}
+
+    first = UUID("test_uuid", fast=True).bind(random.Random(4), fake).generate_batch(5)
+    assert first == UUID("test_uuid", fast=True).bind(random.Random(4), fake).generate_batch(5)
+    assert UUID("test_uuid", fast=True, probability=0).generate_batch(3) == [None] * 3
+
+class ZeroBits(random.Random):
+    """Random source that only returns zero bits"""
+    def getrandbits(self, _k):
+        return 0
+
+def test_sequence_type():
+    """Test that sequences count up from start by step"""
+    sequence = Sequence("test_id", start=10, step=5)
+    assert [sequence()[0] for _ in range(3)] == [10, 15, 20]
+    assert sequence.generate_batch(2) == [25, 30]
+    assert Sequence("test_id").bind(random.Random(), fake, offset=100)()[0] == 101
+    with pytest.raises(ValueError):
+        Sequence("test_id", step=0)
+
+def test_time_ordered_types():
+    """Test that UUIDv7, ULID and Snowflake IDs are valid and increase with the row"""
+    start = datetime(2024, 1, 1)
+    start_ms = int(start.timestamp() * 1000)
+
+    uuids = UUIDv7("test_uuid", start=start).generate_batch(5000)
+    assert uuids == sorted(uuids) and len(set(uuids)) == 5000
+    parsed = uuid.UUID(uuids[-1])
+    assert parsed.version == 7 and str(parsed) == uuids[-1]
+    assert parsed.int >> 80 == start_ms + 4999 // 4096
+
+    ulids = ULID("test_ulid", start=start).generate_batch(1000)
+    assert ulids == sorted(ulids) and all(len(ulid) == 26 for ulid in ulids)
+    assert int(''.join(f"{'0123456789ABCDEFGHJKMNPQRSTVWXYZ'.index(c):05b}" for c in ulids[0]), 2) >> 80 == start_ms
+
+    snowflakes = Snowflake("test_id", start=start, worker_id=3).generate_batch(5000)
+    assert snowflakes == sorted(snowflakes) and len(set(snowflakes)) == 5000
+    assert snowflakes[0] == ((start_ms - 1288834974657) << 22) | (3 << 12)
+    with pytest.raises(ValueError):
+        Snowflake("test_id", worker_id=1024)
+
+    shard = Snowflake("test_id", start=start).bind(random.Random(), fake, offset=4096)
+    assert shard()[0] == ((start_ms + 1 - 1288834974657) << 22)
+
+NUMPY_TYPES = [
+    Int("test_int", min_value=5, max_value=10),
+    Number("test_number"),
+    Bool("test_bool"),
+    Currency("test_currency", min_value=1, max_value=9),
+    Version("test_version", major_max=3),
+    Date("test_date", start_date="2024-01-01", end_date="2024-01-31"),
+    Datetime("test_datetime", start_date="2024-01-01", end_date="2024-01-02"),
+    Timestamp("test_timestamp", start_date="2024-01-01", end_date="2024-01-02"),
+    LatitudeLongitude("test_latlong"),
+]
+
+def check_numpy_column(generator, values):
+    """Check that a NumPy column has 100 values of the right type and within the bounds of NUMPY_TYPES"""
+    assert len(values) == 100
+    if isinstance(generator, Int):
+        assert all(5 <= value <= 10 and isinstance(value, int) for value in values)
+    elif isinstance(generator, Bool):
+        assert set(values) <= {True, False}
+    elif isinstance(generator, Currency):
+        assert all(value.startswith("$") and value.endswith(".00") for value in values)
+    elif isinstance(generator, Date):
+        assert all("2024-01-01" <= value <= "2024-01-31" for value in values)
+    elif isinstance(generator, Datetime):
+        assert all("2024-01-01 00:00:00" <= value <= "2024-01-02 00:00:00" for value in values)
+        assert all(datetime.strptime(value, "%Y-%m-%d %H:%M:%S") for value in values)
+    elif isinstance(generator, LatitudeLongitude):
+        latitude, longitude = (float(part) for part in values[0].split(", "))
+        assert -90 <= latitude <= 90 and -180 <= longitude <= 180
+
+def test_numpy_backend_falls_back(monkeypatch):
+    """Test that the numpy backend generates in Python when NumPy is not installed"""
+    monkeypatch.setattr(vectorized, "_NUMPY", False)
+    for generator in NUMPY_TYPES:
+        bound = generator.bind(random.Random(1), fake, backend="numpy")
+        check_numpy_column(generator, bound.generate_batch(100))
+    with pytest.raises(ValueError):
+        vectorized.check_backend("fortran")
+
+def test_numpy_backend():
+    """Test that the numpy backend draws valid, reproducible columns"""
+    pytest.importorskip("numpy")
+    for generator in NUMPY_TYPES:
+        values = generator.bind(random.Random(1), fake, backend="numpy").generate_batch(100)
+        check_numpy_column(generator, values)
+        assert values == generator.bind(random.Random(1), fake, backend="numpy").generate_batch(100)
+    assert Int("test_int", min_value=1 << 63, max_value=(1 << 63) + 5).bind(random.Random(), fake, backend="numpy").generate_batch(10)
+
+def test_weighted_enum():
+    """Test that Enum draws by weight and only evaluates the chosen callable"""
+    enum = Enum("test_enum", ["hot", "warm", "cold"], weights=[8, 2, 0]).bind(random.Random(1), fake)
+    values = enum.generate_batch(10000)
+    assert "cold" not in values and 0.77 < values.count("hot") / 10000 < 0.83
+    assert enum()[0] in ("hot", "warm")
+    with pytest.raises(ValueError):
+        Enum("test_enum", ["a", "b"], weights=[1])
+
+    calls = []
+
+    def tracked():
+        calls.append(1)
+        return "called"
+
+    mixed = Enum("test_enum", [tracked, Int("test_int", min_value=1, max_value=3), "fixed"]).bind(random.Random(2), fake)
+    values = [mixed()[0] for _ in range(300)]
+    assert len(calls) == values.count("called")
+    assert set(values) == {"called", 1, 2, 3, "fixed"}
+
+    calls.clear()
+    values = mixed.generate_batch(300)
+    assert len(calls) == values.count("called")
+    assert set(values) == {"called", 1, 2, 3, "fixed"}
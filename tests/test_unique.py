@@ -0,0 +1,91 @@
+'''
+    Test unique-value generation
+'''
+import pytest
+
+from seeder import Seeder
+from seeder import seed as seed_module
+from seeder.plan import compile_schema
+from seeder.unique import Permutation, SeenSet, UniqueValuesExhausted, unique_draws
+from seeder.types import Int, Number, UUID, SKU, Email, Name, MACAddress, ISBN
+
+def test_permutation_is_a_bijection():
+    '''
+        Test that permutations cover their range exactly once
+    '''
+    for size in (1, 2, 3, 10, 100, 1000, 4097):
+        permutation = Permutation(size, key=size)
+        assert sorted(permutation[i] for i in range(size)) == list(range(size))
+    assert [Permutation(1000, 1)[i] for i in range(20)] != [Permutation(1000, 2)[i] for i in range(20)]
+    assert [Permutation(1000, 1)[i] for i in range(20)] != list(range(20))
+
+    values = Permutation(3, 5).values(1)
+    assert len([next(values), next(values)]) == 2
+    with pytest.raises(UniqueValuesExhausted):
+        next(values)
+
+def test_unique_draws():
+    '''
+        Test that the seen-set rejects repeats and gives up when exhausted
+    '''
+    seen = SeenSet()
+    assert seen.add('a') and not seen.add('a') and len(seen) == 1
+
+    values = iter([1, 1, 2, 2, 2, 3])
+    draw = unique_draws(lambda: next(values), 'test')
+    assert [draw(), draw(), draw()] == [1, 2, 3]
+
+    constant = unique_draws(lambda: 7, 'test', max_retries=5)
+    assert constant() == 7
+    with pytest.raises(UniqueValuesExhausted, match='test'):
+        constant()
+
+def test_unique_types():
+    '''
+        Test that unique generators never repeat a value
+    '''
+    ints = Int("id", min_value=1, max_value=500, unique=True).generate_batch(500)
+    assert sorted(ints) == list(range(1, 501))
+    with pytest.raises(UniqueValuesExhausted):
+        Int("id", min_value=1, max_value=5, unique=True).generate_batch(6)
+
+    skus = SKU("sku", prefix="P-", length=2, unique=True).generate_batch(36 ** 2)
+    assert len(set(skus)) == 36 ** 2 and all(len(sku) == 4 for sku in skus)
+
+    for generator in (Number("n", unique=True), UUID("u", unique=True), MACAddress("m", unique=True),
+                      Email("e", unique=True), ISBN("i", unique=True)):
+        values = [generator()[0] for _ in range(300)]
+        assert len(set(values)) == 300, generator
+
+    pooled = Name("name", pool_size=50, unique=True)
+    assert len(set(pooled.generate_batch(50))) == 50
+    with pytest.raises(UniqueValuesExhausted):
+        pooled()
+
+def test_unique_seeding_across_workers(monkeypatch):
+    '''
+        Test that unique columns stay unique across shards and workers
+    '''
+    monkeypatch.setattr(seed_module, "SHARD_SIZE", 500)
+    schema = [Int("id", min_value=1, max_value=3000, unique=True), SKU("sku", length=2, unique=True)]
+    serial = Seeder(seed=5).seed(schema, count=1296)
+    parallel = Seeder(seed=5).seed(schema, count=1296, workers=2)
+    assert serial == parallel
+    assert len({row["id"] for row in serial}) == 1296
+    assert len({row["sku"] for row in serial}) == 1296
+
+    with pytest.raises(ValueError, match="email"):
+        Seeder(seed=5).seed([Email("email", unique=True)], count=10, workers=2)
+
+    emails = Seeder(seed=5).seed([Email("email", email_type="free", unique=True)], count=1200)
+    assert len({row["email"] for row in emails}) == 1200
+
+def test_unique_fields():
+    '''
+        Test that "unique" in a field definition enables unique generation
+    '''
+    plan = compile_schema([{"name": "id", "type": "integer", "min": 1, "max": 100, "unique": True}], cache=False)
+    assert plan.generators[0].unique
+    assert len({row["id"] for row in Seeder(seed=1).seed(plan, count=100)}) == 100
+    with pytest.raises(ValueError):
+        compile_schema([{"name": "flag", "type": "boolean", "unique": True}], cache=False)
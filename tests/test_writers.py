@@ -0,0 +1,166 @@
+'''
+    Test the export writers
+'''
+import csv
+import importlib.util
+import io
+import json
+import sqlite3
+import struct
+
+import pytest
+
+from seeder.writers import (
+    sql_literal,
+    write_sql_inserts,
+    write_pg_copy_text,
+    write_pg_copy_binary,
+    write_mysql_load,
+    write_jsonl,
+    write_json_array,
+    write_csv,
+    json_encoder
+)
+
+def test_sql_literal():
+    '''
+        Test SQL literal conversion per value type
+    '''
+    assert sql_literal(None) == 'NULL'
+    assert sql_literal(True) == 'TRUE'
+    assert sql_literal(False) == 'FALSE'
+    assert sql_literal(42) == '42'
+    assert sql_literal(1.5) == '1.5'
+    assert sql_literal(float('nan')) == "'nan'"
+    assert sql_literal("O'Brien") == "'O''Brien'"
+    assert sql_literal("C:\\temp\\") == "'C:\\temp\\'"
+    assert sql_literal("C:\\temp\\", dialect='mysql') == "'C:\\\\temp\\\\'"
+    assert sql_literal("it's\\n\0", dialect='mysql') == "'it''s\\\\n\\0'"
+
+def test_write_sql_inserts_batches():
+    '''
+        Test that rows are split into multi-row INSERT statements
+    '''
+    rows = [{"id": i, "name": f"it's {i}", "note": None, "active": i % 2 == 0} for i in range(5)]
+    f = io.StringIO()
+    written = write_sql_inserts(f, "people", ["id", "name", "note", "active"], iter(rows), batch_size=2)
+    assert written == 5
+    assert f.getvalue().count("INSERT INTO people (id, name, note, active) VALUES") == 3
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE people (id INTEGER, name TEXT, note TEXT, active BOOLEAN)")
+    connection.executescript(f.getvalue())
+    assert connection.execute("SELECT id, name, note, active FROM people ORDER BY id").fetchall() == [
+        (i, f"it's {i}", None, int(i % 2 == 0)) for i in range(5)
+    ]
+
+def test_write_sql_inserts_backslashes():
+    '''
+        Test that backslashes round-trip in the standard dialect and are escaped for MySQL
+    '''
+    rows = [{"id": 1, "path": "C:\\temp\\"}, {"id": 2, "path": "a\\'b"}]
+    f = io.StringIO()
+    write_sql_inserts(f, "paths", ["id", "path"], iter(rows))
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE paths (id INTEGER, path TEXT)")
+    connection.executescript(f.getvalue())
+    assert connection.execute("SELECT path FROM paths ORDER BY id").fetchall() == [("C:\\temp\\",), ("a\\'b",)]
+
+    f = io.StringIO()
+    write_sql_inserts(f, "paths", ["id", "path"], iter(rows), dialect="mysql")
+    assert "(1, 'C:\\\\temp\\\\'),\n(2, 'a\\\\''b')" in f.getvalue()
+    with pytest.raises(ValueError):
+        write_sql_inserts(io.StringIO(), "paths", ["id"], iter(rows), dialect="oracle")
+
+def test_write_sql_inserts_empty():
+    '''
+        Test that no statement is written without rows
+    '''
+    f = io.StringIO()
+    assert write_sql_inserts(f, "people", ["id"], iter([])) == 0
+    assert f.getvalue() == ''
+
+def test_pg_copy_text():
+    '''
+        Test PostgreSQL COPY text escaping
+    '''
+    f = io.StringIO()
+    rows = [{"id": 1, "note": "tab\there\nline\\slash", "flag": True, "missing": None}]
+    assert write_pg_copy_text(f, iter(rows)) == 1
+    assert f.getvalue() == '1\ttab\\there\\nline\\\\slash\tt\t\\N\n'
+
+def test_mysql_load():
+    '''
+        Test MySQL LOAD DATA escaping
+    '''
+    f = io.StringIO()
+    rows = [{"id": 1, "note": "a\tb\0", "flag": False, "missing": None}]
+    assert write_mysql_load(f, iter(rows)) == 1
+    assert f.getvalue() == '1\ta\\tb\\0\t0\t\\N\n'
+
+def test_pg_copy_binary():
+    '''
+        Test the PostgreSQL binary COPY layout
+    '''
+    f = io.BytesIO()
+    rows = [
+        {"id": 7, "name": "abc", "active": True, "born": "2000-01-02", "seen": 946684801},
+        {"id": 8, "name": None, "active": False, "born": "1999-12-31", "seen": 946684800},
+    ]
+    types = {"id": "int4", "born": "date", "seen": "timestamp"}
+    assert write_pg_copy_binary(f, list(rows[0]), iter(rows), types) == 2
+
+    data = f.getvalue()
+    assert data.startswith(b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0))
+    assert data.endswith(struct.pack('>h', -1))
+    body = data[19:-2]
+    first = (
+        struct.pack('>h', 5)
+        + struct.pack('>i', 4) + struct.pack('>i', 7)
+        + struct.pack('>i', 3) + b'abc'
+        + struct.pack('>i', 1) + b'\x01'
+        + struct.pack('>i', 4) + struct.pack('>i', 1)
+        + struct.pack('>i', 8) + struct.pack('>q', 1000000)
+    )
+    assert body.startswith(first)
+    assert struct.pack('>i', -1) in body[len(first):]
+
+def test_write_jsonl():
+    '''
+        Test JSON Lines output with each encoder backend
+    '''
+    rows = [{"id": 1, "name": "Zoë", "note": None}, {"id": 2, "name": "Al", "note": "x"}]
+    backends = ['json', 'auto']
+    if importlib.util.find_spec('orjson') is not None:
+        backends.append('orjson')
+
+    for backend in backends:
+        f = io.StringIO()
+        assert write_jsonl(f, iter(rows), backend=backend) == 2
+        lines = f.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == rows
+        assert lines[0] == '{"id":1,"name":"Zoë","note":null}'
+
+    with pytest.raises(ValueError):
+        json_encoder('yaml')
+
+def test_write_json_array():
+    '''
+        Test that streamed JSON arrays match json.dumps
+    '''
+    rows = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}]
+    for indent in (None, 2, 4):
+        f = io.StringIO()
+        assert write_json_array(f, iter(rows), indent=indent) == 2
+        assert json.loads(f.getvalue()) == rows
+    f = io.StringIO()
+    write_json_array(f, rows, indent=4)
+    assert f.getvalue() == json.dumps(rows, indent=4)
+
+def test_write_csv():
+    '''
+        Test CSV output with a header line
+    '''
+    f = io.StringIO()
+    assert write_csv(f, ["id", "name"], iter([{"id": 1, "name": "a,b"}, {"id": 2, "name": None}])) == 2
+    assert list(csv.reader(io.StringIO(f.getvalue()))) == [["id", "name"], ["1", "a,b"], ["2", ""]]